@@ -0,0 +1,117 @@
+"""Tests for conversation management."""
+
+from tomo.orchestrators.conversation import ConversationManager, Message, ROLE_SYSTEM
+
+
+class TestConversationManager:
+    """Test conversation history storage and trimming."""
+
+    def test_add_and_get_messages(self):
+        """Test adding messages and reading them back in LLM format."""
+        conversation = ConversationManager()
+        conversation.add_message("user", "Hello")
+        conversation.add_message("assistant", "Hi", metadata={"source": "test"})
+
+        assert len(conversation) == 2
+        assert conversation.get_messages() == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi"},
+        ]
+        assert conversation.get_messages(include_metadata=True)[1]["metadata"] == {
+            "source": "test"
+        }
+
+    def test_message_views(self):
+        """Test that messages are materialized as Message objects."""
+        conversation = ConversationManager()
+        conversation.add_message("user", "Hello")
+
+        message = conversation[0]
+        assert isinstance(message, Message)
+        assert message.role == "user"
+        assert message.content == "Hello"
+        assert conversation.messages == [message]
+
+    def test_max_messages_keeps_system_messages(self):
+        """Test that trimming drops the oldest non-system messages."""
+        conversation = ConversationManager(max_messages=3)
+        conversation.add_message("system", "Be helpful")
+        for i in range(5):
+            conversation.add_message("user", f"message {i}")
+
+        assert len(conversation) == 3
+        assert conversation.roles == ["system", "user", "user"]
+        assert conversation.contents == ["Be helpful", "message 3", "message 4"]
+
+    def test_recent_messages(self):
+        """Test getting the most recent messages."""
+        conversation = ConversationManager()
+        for i in range(5):
+            conversation.add_message("user", f"message {i}")
+
+        recent = conversation.get_recent_messages(2)
+        assert [m["content"] for m in recent] == ["message 3", "message 4"]
+
+    def test_summary(self):
+        """Test conversation summary counts."""
+        conversation = ConversationManager()
+        conversation.add_message("user", "Hello")
+        conversation.add_message("assistant", "Hi")
+        conversation.add_tool_result("Calculator", 42)
+
+        summary = conversation.get_summary()
+        assert summary["total_messages"] == 3
+        assert summary["user_messages"] == 1
+        assert summary["assistant_messages"] == 1
+        assert summary["tool_messages"] == 1
+        assert summary["oldest_message"] <= summary["newest_message"]
+
+        conversation.clear()
+        assert len(conversation) == 0
+        assert conversation.get_summary()["oldest_message"] is None
+
+    def test_roles_are_interned(self):
+        """Test that stored roles share the module-level role constants."""
+        conversation = ConversationManager()
+        conversation.add_message("".join(["sys", "tem"]), "Be helpful")
+
+        assert conversation.roles[0] is ROLE_SYSTEM
+        assert conversation[0].role is ROLE_SYSTEM
+
+    def test_summarize_keeps_tool_results(self):
+        """Test collapsing the oldest messages into an extractive summary."""
+        conversation = ConversationManager()
+        conversation.add_message("system", "Be helpful")
+        conversation.add_message("user", "Add 1 and 2")
+        conversation.add_tool_result("Calculator", 3)
+        conversation.add_message("assistant", "The answer is 3")
+
+        summary = conversation.summarize(2)
+
+        assert summary is not None
+        assert summary.role == "system"
+        assert summary.metadata == {"summary": True, "summarized_messages": 2}
+        assert summary.content == "Tool 'Calculator' executed successfully: 3"
+        assert conversation.roles == ["system", "system", "assistant"]
+        assert conversation.contents[1] == summary.content
+
+    def test_auto_summarize_on_overflow(self):
+        """Test that overflow summarizes instead of dropping messages."""
+        conversation = ConversationManager(
+            max_messages=4,
+            summarize_window=3,
+            summarizer=lambda messages: f"{len(messages)} messages",
+        )
+        for i in range(5):
+            conversation.add_message("user", f"message {i}")
+
+        assert len(conversation) == 3
+        assert conversation.contents == ["3 messages", "message 3", "message 4"]
+        assert conversation.metadatas[0]["summarized_messages"] == 3
+
+        # Earlier summaries are folded into later ones
+        for i in range(5, 7):
+            conversation.add_message("user", f"message {i}")
+
+        assert conversation.metadatas[0]["summarized_messages"] == 5
+        assert conversation.roles.count("system") == 1
@@ -1,6 +1,7 @@
 """Tests for core Tomo functionality."""
 
 import pytest
+from typing import ClassVar, List
 from tomo import BaseTool, tool, ToolRegistry, ToolRunner
 from tomo.core.runner import ToolNotFoundError, ToolValidationError, ToolExecutionError
 
@@ -29,6 +30,23 @@ class TestDivider(BaseTool):
         return self.a / self.b
 
 
+@tool
+class TestBatchDoubler(BaseTool):
+    """Test tool that doubles numbers in batches."""
+
+    value: int
+
+    batch_calls: ClassVar[List[int]] = []
+
+    def run(self) -> int:
+        return self.value * 2
+
+    @classmethod
+    def batch_run(cls, tools):
+        cls.batch_calls.append(len(tools))
+        return [t.value * 2 for t in tools]
+
+
 class TestTool:
     """Test tool definition and decoration."""
 
@@ -121,6 +139,36 @@ class TestToolRegistry:
         assert len(schemas) == 1
         assert schemas[0]["function"]["name"] == "TestCalculator"
 
+    def test_iter_with_schema(self):
+        """Test iterating tools with their schemas."""
+        registry = ToolRegistry()
+        registry.register(TestCalculator)
+        registry.register(TestDivider, name="divide")
+
+        entries = list(registry.iter_with_schema())
+        assert [(name, cls) for name, cls, _ in entries] == [
+            ("TestCalculator", TestCalculator),
+            ("divide", TestDivider),
+        ]
+        assert entries[1][2] == TestDivider.get_schema()
+        # Schemas are generated once per registered name
+        assert registry.get_schema("divide") is entries[1][2]
+
+    def test_registry_version(self):
+        """Test that the version changes only when tools change."""
+        registry = ToolRegistry()
+        initial = registry.version
+
+        registry.register(TestCalculator)
+        registered = registry.version
+        assert registered > initial
+
+        assert registry.unregister("NonExistent") is False
+        assert registry.version == registered
+
+        registry.unregister("TestCalculator")
+        assert registry.version > registered
+
 
 class TestToolRunner:
     """Test tool runner functionality."""
@@ -166,6 +214,52 @@ class TestToolRunner:
         with pytest.raises(ToolExecutionError):
             runner.run_tool("TestDivider", {"a": 10, "b": 0})
 
+    def test_custom_init_tool(self):
+        """Test that tools with a custom __init__ are still constructed through it."""
+
+        class OffsetTool(BaseTool):
+            value: int
+
+            def __init__(self, **data):
+                data["value"] = data.get("value", 0) + 1
+                super().__init__(**data)
+
+            def run(self) -> int:
+                return self.value
+
+        registry = ToolRegistry()
+        registry.register(OffsetTool)
+        registry.register(TestCalculator)
+        runner = ToolRunner(registry)
+
+        assert runner.run_tool("OffsetTool", {"value": 1}) == 2
+        assert runner.run_tool("TestCalculator", {"a": 1, "b": 2}) == 3
+        assert runner.validate_tool_inputs("TestCalculator", {"a": "x", "b": 2}) is False
+
+    def test_batch_execution(self):
+        """Test batched execution with per-call errors."""
+        registry = ToolRegistry()
+        registry.register(TestBatchDoubler)
+        registry.register(TestDivider)
+        runner = ToolRunner(registry)
+
+        TestBatchDoubler.batch_calls.clear()
+        outcomes = runner.run_tool_batch(
+            "TestBatchDoubler", [{"value": 1}, {"value": "bad"}, {"value": 3}]
+        )
+        assert TestBatchDoubler.batch_calls == [2]
+        assert outcomes[0] == (2, None)
+        assert isinstance(outcomes[1][1], ToolValidationError)
+        assert outcomes[2] == (6, None)
+
+        # Tools without batch_run run each call separately
+        outcomes = runner.run_tool_batch("TestDivider", [{"a": 4, "b": 2}, {"a": 1, "b": 0}])
+        assert outcomes[0] == (2.0, None)
+        assert isinstance(outcomes[1][1], ToolExecutionError)
+
+        with pytest.raises(ToolNotFoundError):
+            runner.run_tool_batch("NonExistent", [{}])
+
     def test_safe_execution(self):
         """Test safe execution mode."""
         registry = ToolRegistry()
@@ -0,0 +1,289 @@
+"""Tests for the Tomo plugin system."""
+
+import json
+import pytest
+from datetime import datetime
+
+from tomo.plugins import BasePlugin, PluginLoader, PluginLoaderError, PluginRegistry, PluginType, prewarm
+
+
+PLUGIN_SOURCE = '''
+from tomo.plugins import BasePlugin, PluginType, plugin
+
+
+@plugin(PluginType.TOOL, "{name}", "1.0.0")
+class SamplePlugin(BasePlugin):
+    @property
+    def plugin_type(self):
+        return PluginType.TOOL
+
+    @property
+    def name(self):
+        return "{name}"
+
+    @property
+    def version(self):
+        return "1.0.0"
+
+    def initialize(self, config=None):
+        self.config = config or {{}}
+
+    def register_components(self, registry):
+        pass
+'''
+
+
+class StubPlugin(BasePlugin):
+    """Minimal plugin with a configurable name and type."""
+
+    def __init__(self, name, plugin_type):
+        self._name = name
+        self._type = plugin_type
+
+    @property
+    def plugin_type(self):
+        return self._type
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def version(self):
+        return "1.0.0"
+
+    def initialize(self, config=None):
+        pass
+
+    def register_components(self, registry):
+        pass
+
+
+def write_plugin(directory, file_name, plugin_name):
+    """Write a minimal plugin module to a directory."""
+    path = directory / file_name
+    path.write_text(PLUGIN_SOURCE.format(name=plugin_name))
+    return path
+
+
+class TestPluginLoader:
+    """Test plugin loading from various sources."""
+
+    def test_load_from_directory(self, tmp_path):
+        """Test loading plugin files from a directory."""
+        write_plugin(tmp_path, "alpha.py", "alpha")
+        write_plugin(tmp_path, "beta.py", "beta")
+        write_plugin(tmp_path, "_private.py", "private")
+        (tmp_path / "notes.txt").write_text("not a plugin")
+        (tmp_path / "pkg.py").mkdir()
+
+        loader = PluginLoader()
+        discovered = loader.load_from_directory(tmp_path)
+
+        assert discovered == 2
+        assert sorted(loader.registry.list_plugins()) == ["alpha", "beta"]
+        assert len(loader.get_loaded_modules()) == 2
+
+        history = loader.get_load_history()
+        assert len(history) == 1
+        assert history[0]["source_type"] == "directory"
+        assert history[0]["plugins_loaded"] == 2
+        assert datetime.fromisoformat(history[0]["timestamp"])
+
+    def test_load_history_since(self, tmp_path):
+        """Test tailing the load history from an index."""
+        write_plugin(tmp_path, "alpha.py", "alpha")
+
+        loader = PluginLoader()
+        loader.load_from_directory(tmp_path)
+        loader.registry.clear()
+        loader.load_from_directory(tmp_path)
+
+        tail = loader.get_load_history(since=1)
+        assert len(tail) == 1
+        assert tail[0]["metadata"]["cached"] is True
+
+        history = loader.get_load_history()
+        assert len(history) == 2
+        assert all(datetime.fromisoformat(record["timestamp"]) for record in history)
+        assert loader.get_load_history(since=-1) == tail
+
+        history[0]["source"] = "changed"
+        assert loader.get_load_history()[0]["source"] == str(tmp_path)
+
+    def test_load_from_directory_cache(self, tmp_path):
+        """Test that unchanged directories reuse previously loaded modules."""
+        write_plugin(tmp_path, "alpha.py", "alpha")
+
+        loader = PluginLoader()
+        loader.load_from_directory(tmp_path)
+        modules = dict(loader.get_loaded_modules())
+
+        loader.registry.clear()
+        assert loader.load_from_directory(tmp_path) == 1
+        assert loader.get_loaded_modules() == modules
+        assert loader.get_load_history()[-1]["metadata"]["cached"] is True
+
+        loader.invalidate_cache(tmp_path)
+        loader.registry.clear()
+        assert loader.load_from_directory(tmp_path) == 1
+        assert loader.get_loaded_modules() != modules
+
+    def test_load_from_directory_error(self, tmp_path):
+        """Test that a broken plugin file reports which file failed."""
+        write_plugin(tmp_path, "alpha.py", "alpha")
+        (tmp_path / "broken.py").write_text("raise RuntimeError('bad plugin')")
+        write_plugin(tmp_path, "gamma.py", "gamma")
+
+        loader = PluginLoader()
+
+        with pytest.raises(PluginLoaderError, match="broken.py.*bad plugin"):
+            loader.load_from_directory(tmp_path)
+        assert loader.registry.list_plugins() == ["alpha"]
+
+    def test_prewarm_directory(self, tmp_path, capsys):
+        """Test byte-compiling plugin files ahead of loading them."""
+        write_plugin(tmp_path, "alpha.py", "alpha")
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+
+        assert prewarm.main([str(tmp_path)]) == 0
+        assert "compiled 1 plugin file(s)" in capsys.readouterr().out
+        assert any((tmp_path / "__pycache__").glob("alpha.*.pyc"))
+
+        assert prewarm.main([str(tmp_path / "missing")]) == 1
+
+    def test_load_from_directory_warmup(self, tmp_path):
+        """Test that warmup loads compile plugin files first."""
+        write_plugin(tmp_path, "alpha.py", "alpha")
+
+        loader = PluginLoader()
+
+        assert loader.load_from_directory(tmp_path, warmup=True) == 1
+        assert any((tmp_path / "__pycache__").glob("alpha.*.pyc"))
+
+    def test_load_from_package(self, tmp_path, monkeypatch):
+        """Test discovering plugins defined in a package's submodules."""
+        package = tmp_path / "tomo_test_plugin_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("from . import tools\n")
+        write_plugin(package, "tools.py", "package_tool")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        loader = PluginLoader()
+
+        assert loader.load_from_package("tomo_test_plugin_pkg") == 1
+        assert loader.registry.list_plugins() == ["package_tool"]
+
+    def test_load_from_package_reexport(self, tmp_path, monkeypatch):
+        """Test discovering plugins re-exported from another module."""
+        write_plugin(tmp_path, "tomo_test_plugin_impl.py", "reexported_tool")
+        (tmp_path / "tomo_test_plugin_facade.py").write_text(
+            "from tomo_test_plugin_impl import SamplePlugin\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        loader = PluginLoader()
+
+        assert loader.load_from_package("tomo_test_plugin_facade") == 1
+        assert loader.registry.list_plugins() == ["reexported_tool"]
+
+    def test_collected_plugin_classes_are_pruned(self):
+        """Test that garbage-collected plugin classes leave no module entry."""
+        import gc
+        from tomo.plugins.base import _PLUGIN_CLASSES_BY_MODULE
+
+        namespace = {"__name__": "tomo_test_transient_plugins"}
+        exec(PLUGIN_SOURCE.format(name="transient"), namespace)
+        assert "tomo_test_transient_plugins" in _PLUGIN_CLASSES_BY_MODULE
+
+        namespace.clear()
+        gc.collect()
+
+        assert "tomo_test_transient_plugins" not in _PLUGIN_CLASSES_BY_MODULE
+
+    def test_load_from_missing_directory(self, tmp_path):
+        """Test that loading a missing directory raises an error."""
+        loader = PluginLoader()
+
+        with pytest.raises(PluginLoaderError, match="does not exist"):
+            loader.load_from_directory(tmp_path / "missing")
+
+    def test_load_from_config(self, tmp_path):
+        """Test loading plugins listed in a configuration file."""
+        plugin_dir = tmp_path / "plugins"
+        plugin_dir.mkdir()
+        write_plugin(plugin_dir, "alpha.py", "alpha")
+
+        config_file = tmp_path / "plugins.json"
+        config_file.write_text(json.dumps({
+            "plugins": [
+                {
+                    "source": {"directory": str(plugin_dir)},
+                    "enabled": True,
+                    "config": {"timeout": 5},
+                },
+                {"source": "tomo_missing_package", "enabled": False},
+            ]
+        }))
+
+        loader = PluginLoader()
+
+        assert loader.validate_config_file(config_file) == []
+        assert loader.load_from_config(config_file) == 1
+        assert loader.registry.list_plugins() == ["alpha"]
+        assert loader.registry.get_plugin("alpha").config == {"timeout": 5}
+        assert loader.registry.get_plugin_info("alpha")["config"] == {"timeout": 5}
+
+    def test_create_sample_config(self, tmp_path):
+        """Test that the sample configuration is indented JSON."""
+        output = tmp_path / "sample.json"
+        PluginLoader().create_sample_config(output)
+
+        sample = json.loads(output.read_text())
+        assert output.read_text() == json.dumps(sample, indent=2)
+        assert [p["enabled"] for p in sample["plugins"]] == [False, True]
+
+    def test_validate_config_file_errors(self, tmp_path):
+        """Test validation errors for malformed configuration files."""
+        loader = PluginLoader()
+
+        bad_json = tmp_path / "bad.json"
+        bad_json.write_text("{not json")
+        assert loader.validate_config_file(bad_json)[0].startswith("Invalid JSON")
+
+        bad_entries = tmp_path / "entries.json"
+        bad_entries.write_text(json.dumps({
+            "plugins": ["oops", {}, {"source": {}}, {"source": 3}]
+        }))
+        assert loader.validate_config_file(bad_entries) == [
+            "Plugin config 0 must be an object",
+            "Plugin config 1 missing required 'source' field",
+            "Plugin config 2 directory source missing 'directory' field",
+            "Plugin config 3 'source' must be string or object",
+        ]
+
+        with pytest.raises(PluginLoaderError, match="Invalid JSON"):
+            loader.load_from_config(bad_json)
+
+
+class TestPluginRegistry:
+    """Test plugin registry bookkeeping."""
+
+    def test_get_plugins_by_type(self):
+        """Test that the type index follows registration changes."""
+        registry = PluginRegistry()
+        first = StubPlugin("first", PluginType.TOOL)
+        second = StubPlugin("second", PluginType.TOOL)
+        adapter = StubPlugin("adapter", PluginType.ADAPTER)
+        for p in (first, adapter, second):
+            registry.register_plugin(p)
+
+        assert registry.get_plugins_by_type(PluginType.TOOL) == [first, second]
+        assert registry.get_plugins_by_type(PluginType.ADAPTER) == [adapter]
+        assert registry.get_plugins_by_type(PluginType.SERVER) == []
+
+        assert registry.unregister_plugin("first") is True
+        assert registry.get_plugins_by_type(PluginType.TOOL) == [second]
+
+        registry.clear()
+        assert registry.get_plugins_by_type(PluginType.TOOL) == []
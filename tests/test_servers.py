@@ -0,0 +1,332 @@
+"""Tests for the Tomo API and MCP servers."""
+
+import asyncio
+from typing import ClassVar, List
+
+import pytest
+from pydantic import BaseModel
+
+# Installed together with the "server" extra
+pytest.importorskip("fastapi")
+pytest.importorskip("uvicorn")
+pytest.importorskip("httpx")
+pytest.importorskip("websockets")
+
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from tomo import BaseTool, tool, ToolRegistry
+from tomo.servers.api import APIServer
+from tomo.servers.mcp import MCPServer
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+@tool
+class PointTool(BaseTool):
+    """Tool returning a Pydantic model."""
+
+    x: int
+
+    def run(self) -> Point:
+        return Point(x=self.x, y=self.x * 2)
+
+
+@tool
+class TagsTool(BaseTool):
+    """Tool returning a set."""
+
+    def run(self) -> set:
+        return {"a"}
+
+
+@tool
+class CountsTool(BaseTool):
+    """Tool returning a large dict with integer keys."""
+
+    size: int
+
+    def run(self) -> dict:
+        return {i: {i} for i in range(self.size)}
+
+
+@tool
+class OpaqueTool(BaseTool):
+    """Tool returning a large list of unserializable values."""
+
+    def run(self) -> list:
+        return [object()] * 2000
+
+
+@tool
+class ProfileTool(BaseTool):
+    """Tool returning a plain dict."""
+
+    name: str
+
+    def run(self) -> dict:
+        return {"name": self.name, "active": True}
+
+
+@tool
+class ScaleTool(BaseTool):
+    """Batchable tool recording the size of each batch."""
+
+    value: int
+    batches: ClassVar[List[int]] = []
+
+    def run(self) -> int:
+        return self.value * 10
+
+    @classmethod
+    def batch_run(cls, tools: List["ScaleTool"]) -> List[int]:
+        cls.batches.append(len(tools))
+        return [t.value * 10 for t in tools]
+
+
+@tool
+class ShortBatchTool(BaseTool):
+    """Batchable tool whose batch_run drops a result."""
+
+    value: int
+
+    def run(self) -> int:
+        return self.value
+
+    @classmethod
+    def batch_run(cls, tools: List["ShortBatchTool"]) -> List[int]:
+        return [t.value for t in tools][1:]
+
+
+def make_client():
+    """Create a test client for a server with the test tools."""
+    registry = ToolRegistry()
+    registry.register(PointTool)
+    registry.register(TagsTool)
+    registry.register(CountsTool)
+    registry.register(OpaqueTool)
+    return TestClient(APIServer(registry).get_app())
+
+
+class TestAPIServer:
+    """Test API server endpoints."""
+
+    def test_get_tool(self):
+        """Test fetching a single tool's description and schema."""
+        client = make_client()
+
+        response = client.get("/tools/PointTool")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["name"] == "PointTool"
+        assert "x" in response.json()["schema"]["function"]["parameters"]["properties"]
+
+        assert client.get("/tools/Missing").status_code == 404
+
+    def test_execute_model_result(self):
+        """Test that Pydantic model results are serialized."""
+        response = make_client().post("/tools/PointTool/execute", json={"inputs": {"x": 2}})
+
+        assert response.status_code == 200
+        assert response.json() == {"success": True, "result": {"x": 2, "y": 4}, "error": None}
+
+    def test_execute_set_result(self):
+        """Test that set results are serialized as lists."""
+        response = make_client().post("/tools/TagsTool/execute", json={"inputs": {}})
+
+        assert response.status_code == 200
+        assert response.json()["result"] == ["a"]
+
+    def test_execute_streams_int_keyed_dict(self):
+        """Test that large dicts with non-string keys are streamed as valid JSON."""
+        response = make_client().post(
+            "/tools/CountsTool/execute", json={"inputs": {"size": 1500}}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        assert len(body["result"]) == 1500
+        assert body["result"]["1499"] == [1499]
+
+    def test_execute_stream_encoding_error(self):
+        """Test that unserializable large results fail before streaming starts."""
+        response = make_client().post("/tools/OpaqueTool/execute", json={"inputs": {}})
+
+        assert response.status_code == 500
+
+    def test_keep_alive_headers(self):
+        """Test that keep-alive headers are added once and never override."""
+        client = make_client()
+
+        @client.app.get("/closing")
+        def closing():
+            return Response(headers={"Connection": "close"})
+
+        response = client.get("/tools")
+        assert response.headers.get_list("connection") == ["keep-alive"]
+        assert response.headers["keep-alive"] == "timeout=75"
+
+        response = client.get("/closing")
+        assert response.headers.get_list("connection") == ["close"]
+        assert "keep-alive" not in response.headers
+
+    def test_validate_inputs(self):
+        """Test input validation without execution."""
+        client = make_client()
+
+        response = client.post("/tools/PointTool/validate", json={"inputs": {"x": 1}})
+        assert response.json()["valid"] is True
+
+        response = client.post("/tools/PointTool/validate", json={"inputs": {"x": "a"}})
+        assert response.json()["valid"] is False
+
+        response = client.post("/tools/Missing/validate", json={"inputs": {}})
+        assert response.status_code == 404
+
+
+def make_mcp_server(**kwargs):
+    """Create an MCP server for the test tools."""
+    registry = ToolRegistry()
+    for tool_class in (ProfileTool, ScaleTool, ShortBatchTool):
+        registry.register(tool_class)
+    return MCPServer(registry, **kwargs)
+
+
+def call_message(message_id, name, arguments):
+    """Build a tools/call request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": message_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    }
+
+
+class TestMCPBatching:
+    """Test coalescing of calls to batchable tools."""
+
+    @pytest.mark.asyncio
+    async def test_calls_are_coalesced(self):
+        """Test that concurrent calls run as one batch."""
+        server = make_mcp_server(batch_window=0.05)
+        ScaleTool.batches.clear()
+
+        try:
+            responses = await asyncio.gather(*(
+                server._handle_message(call_message(i, "ScaleTool", {"value": i}))
+                for i in range(3)
+            ))
+        finally:
+            server._stop_batch_workers()
+
+        assert ScaleTool.batches == [3]
+        assert [r["id"] for r in responses] == [0, 1, 2]
+        assert [r["result"]["content"][0]["text"] for r in responses] == ["0", "10", "20"]
+
+    @pytest.mark.asyncio
+    async def test_validation_error_reaches_its_request(self):
+        """Test that an invalid call fails alone within a batch."""
+        server = make_mcp_server(batch_window=0.05)
+
+        try:
+            good, bad = await asyncio.gather(
+                server._handle_message(call_message("good", "ScaleTool", {"value": 1})),
+                server._handle_message(call_message("bad", "ScaleTool", {"value": "x"})),
+            )
+        finally:
+            server._stop_batch_workers()
+
+        assert good["id"] == "good"
+        assert good["result"]["content"][0]["text"] == "10"
+        assert bad["id"] == "bad"
+        assert bad["error"]["code"] == -32602
+
+    @pytest.mark.asyncio
+    async def test_batch_length_mismatch_fails_every_call(self):
+        """Test that a short batch_run result fails all calls in the batch."""
+        server = make_mcp_server(batch_window=0.05)
+
+        try:
+            responses = await asyncio.gather(*(
+                server._handle_message(call_message(i, "ShortBatchTool", {"value": i}))
+                for i in range(2)
+            ))
+        finally:
+            server._stop_batch_workers()
+
+        assert [r["error"]["code"] for r in responses] == [-32603, -32603]
+
+    def test_batching_across_event_loops(self):
+        """Test that batch workers are recreated for a new event loop."""
+        server = make_mcp_server()
+
+        async def call():
+            message = call_message(1, "ScaleTool", {"value": 2})
+            return await asyncio.wait_for(server._handle_message(message), 1)
+
+        assert asyncio.run(call())["result"]["content"][0]["text"] == "20"
+        assert asyncio.run(call())["result"]["content"][0]["text"] == "20"
+
+
+class TestMCPServer:
+    """Test MCP JSON-RPC message handling."""
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test that an empty batch is an invalid request."""
+        response = await make_mcp_server()._handle_batch([])
+
+        assert response["id"] is None
+        assert response["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_notification_only_batch(self):
+        """Test that a batch of notifications gets no response."""
+        batch = [{"jsonrpc": "2.0", "method": "ping"}] * 2
+
+        assert await make_mcp_server()._handle_batch(batch) is None
+
+    @pytest.mark.asyncio
+    async def test_batch_responses(self):
+        """Test that batch responses keep request order and reject non-objects."""
+        batch = [
+            {"jsonrpc": "2.0", "id": 3, "method": "ping"},
+            1,
+            {"jsonrpc": "2.0", "method": "ping"},
+            {"jsonrpc": "2.0", "id": "a", "method": "ping"},
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+        ]
+
+        responses = await make_mcp_server()._handle_batch(batch)
+
+        assert [r["id"] for r in responses] == [3, None, "a", 1]
+        assert responses[1]["error"]["code"] == -32600
+        assert all("result" in responses[i] for i in (0, 2, 3))
+
+    @pytest.mark.asyncio
+    async def test_unknown_method(self):
+        """Test that unknown and non-string methods are not found."""
+        server = make_mcp_server()
+
+        for method in ("tools/unknown", ["ping"], None):
+            response = await server._handle_message(
+                {"jsonrpc": "2.0", "id": 7, "method": method}
+            )
+            assert response["id"] == 7
+            assert response["error"]["code"] == -32601
+
+    @pytest.mark.asyncio
+    async def test_structured_content(self):
+        """Test that structuredContent is only added when enabled."""
+        message = call_message(1, "ProfileTool", {"name": "ada"})
+
+        plain = await make_mcp_server()._handle_message(message)
+        structured = await make_mcp_server(structured_content=True)._handle_message(message)
+
+        assert "structuredContent" not in plain["result"]
+        assert structured["result"]["structuredContent"] == {"name": "ada", "active": True}
+        assert structured["result"]["content"] == plain["result"]["content"]
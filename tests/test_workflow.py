@@ -2,6 +2,9 @@
 
 import pytest
 import asyncio
+import sys
+import types
+import warnings
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock
 
@@ -24,7 +27,12 @@ from tomo.orchestrators.workflow_steps import (
     LoopStep, 
     DelayStep, 
     ScriptStep,
-    create_tool_step
+    EmailStep,
+    WebhookStep,
+    create_tool_step,
+    create_condition_step,
+    create_transform_step,
+    error_message
 )
 
 
@@ -135,6 +143,38 @@ class TestWorkflowContext:
         assert context.get_variable("var1") == 42
         assert context.get_variable("nonexistent") is None
         assert context.get_variable("nonexistent", "default") == "default"
+    
+    def test_context_fork(self):
+        """Test that forked contexts read through but write locally."""
+        context = WorkflowContext()
+        context.set("shared", 1)
+        
+        child = context.fork()
+        child.set("local", 2)
+        child.set("shared", 3)
+        
+        assert child.get("shared") == 3
+        assert child.get("local") == 2
+        assert context.get("shared") == 1
+        assert context.get("local") is None
+        assert child.data.maps[0] == {"local": 2, "shared": 3}
+    
+    def test_context_dirty_keys(self):
+        """Test that only real changes are tracked as dirty."""
+        context = WorkflowContext()
+        items = [1, 2]
+        context.set("count", 1)
+        context.set("items", items)
+        assert context.pop_dirty_keys() == {"count", "items"}
+        
+        context.set("count", 1)
+        context.set("items", items)
+        assert context.pop_dirty_keys() == set()
+        
+        context.set("count", True)
+        context.set("items", [1, 2])
+        context.update({"other": 3})
+        assert context.pop_dirty_keys() == {"count", "items", "other"}
 
 
 # Test workflow step results
@@ -308,6 +348,73 @@ class TestWorkflow:
         execution_order = workflow.get_execution_order()
         assert execution_order == ["step1", "step2", "step3"]
     
+    def test_workflow_dependents(self, runner):
+        """Test reverse dependency lookup and cache invalidation."""
+        workflow = Workflow(name="Test Workflow")
+        
+        step1 = create_tool_step(
+            step_id="step1",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "add", "a": 1, "b": 2},
+            runner=runner
+        )
+        step2 = create_tool_step(
+            step_id="step2",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "multiply", "a": "$step1", "b": 3},
+            runner=runner,
+            depends_on=["step1"]
+        )
+        
+        workflow.add_step(step1)
+        assert workflow.get_execution_order() == ["step1"]
+        assert workflow.get_dependents("step1") == []
+        
+        workflow.add_step(step2)
+        assert workflow.get_execution_order() == ["step1", "step2"]
+        assert workflow.get_dependents("step1") == ["step2"]
+        assert workflow.get_dependents("step2") == []
+    
+    def test_workflow_replaced_steps(self):
+        """Test that replacing entries in steps directly invalidates caches."""
+        workflow = Workflow(name="Test Workflow")
+        workflow.add_step(DelayStep(step_id="a", delay_seconds=0))
+        workflow.add_step(DelayStep(step_id="b", delay_seconds=0, depends_on=["a"]))
+        
+        assert workflow.get_execution_order() == ["a", "b"]
+        assert workflow.get_dependents("a") == ["b"]
+        
+        # Same step count, but "b" is now first
+        workflow.steps["a"] = DelayStep(step_id="a", delay_seconds=0, depends_on=["b"])
+        workflow.steps["b"] = DelayStep(step_id="b", delay_seconds=0)
+        
+        assert workflow.get_execution_order() == ["b", "a"]
+        assert workflow.get_dependents("b") == ["a"]
+        assert workflow.get_dependency_levels() == {"b": 0, "a": 1}
+        
+        # Added directly, then depended on through add_step
+        workflow.steps["c"] = DelayStep(step_id="c", delay_seconds=0)
+        workflow.add_step(DelayStep(step_id="d", delay_seconds=0, depends_on=["c"]))
+        assert workflow.get_dependency_levels()["d"] == 1
+        
+        # Rewritten into a cycle
+        workflow.steps["b"] = DelayStep(step_id="b", delay_seconds=0, depends_on=["a"])
+        
+        errors = workflow.validate()
+        assert any("circular" in error.lower() for error in errors)
+    
+    def test_workflow_deep_execution_order(self):
+        """Test ordering a dependency chain deeper than the recursion limit."""
+        workflow = Workflow(name="Deep Workflow")
+        workflow.add_step(DelayStep(step_id="step0", delay_seconds=0))
+        for i in range(1, 2000):
+            workflow.add_step(
+                DelayStep(step_id=f"step{i}", delay_seconds=0, depends_on=[f"step{i - 1}"])
+            )
+        
+        execution_order = workflow.get_execution_order()
+        assert execution_order == [f"step{i}" for i in range(2000)]
+    
     def test_workflow_circular_dependency(self, runner):
         """Test detection of circular dependencies."""
         workflow = Workflow(name="Test Workflow")
@@ -395,6 +502,56 @@ class TestWorkflowSteps:
         assert result == 42
         assert context.get("calc_step") == 42
     
+    def test_tool_step_nested_input_resolution(self):
+        """Test resolving references nested inside tool inputs."""
+        template = {
+            "config": {"mode": "fast", "user": "$user.name"},
+            "items": [1, {"$context": "items[0]"}, "literal"],
+            "static": {"a": [1, 2]},
+        }
+        step = ToolStep(step_id="nested", tool_name="Noop", tool_inputs=template)
+        
+        context = WorkflowContext()
+        context.set("user", {"name": "Ada"})
+        context.set("items", ["first"])
+        
+        resolved = step._resolve_inputs(context)
+        
+        assert resolved["config"] == {"mode": "fast", "user": "Ada"}
+        assert resolved["items"] == [1, "first", "literal"]
+        assert resolved["static"] is template["static"]
+        # The input template itself is left untouched
+        assert template["config"]["user"] == "$user.name"
+        assert template["items"][1] == {"$context": "items[0]"}
+    
+    def test_tool_step_deeply_nested_inputs(self):
+        """Test resolving inputs nested deeper than the recursion limit."""
+        template = {"value": "$leaf"}
+        for _ in range(5000):
+            template = {"child": [template]}
+        step = ToolStep(step_id="deep", tool_name="Noop", tool_inputs=template)
+        
+        context = WorkflowContext()
+        context.set("leaf", 42)
+        
+        node = step._resolve_inputs(context)
+        while "child" in node:
+            node = node["child"][0]
+        assert node == {"value": 42}
+    
+    def test_tool_step_resolve_path(self):
+        """Test dot and bracket path resolution."""
+        step = ToolStep(step_id="paths", tool_name="Noop", tool_inputs={})
+        
+        context = WorkflowContext()
+        context.set("user", {"addresses": [{"city": "Paris"}], "tags": {"a": 1}})
+        
+        assert step._resolve_path("user.addresses[0].city", context) == "Paris"
+        assert step._resolve_path("user.tags[a]", context) == 1
+        assert step._resolve_path("user.addresses[5].city", context) is None
+        assert step._resolve_path("user.missing.city", context) is None
+        assert step._resolve_path("[0]", context) is None
+    
     @pytest.mark.asyncio
     async def test_condition_step(self, runner):
         """Test conditional step execution."""
@@ -435,6 +592,43 @@ class TestWorkflowSteps:
         result = await condition_step.execute(context)
         assert result == "Value is not positive"
     
+    @pytest.mark.asyncio
+    async def test_create_condition_step_strings(self):
+        """Test key and expression string conditions."""
+        context = WorkflowContext()
+        context.set("enabled", True)
+        context.set("count", 5)
+        context.set("items", [{"active": False}])
+        
+        key_step = create_condition_step(step_id="by_key", condition="enabled")
+        expr_step = create_condition_step(
+            step_id="by_expr",
+            condition="count > 3 and not items[0]['active']"
+        )
+        
+        assert await key_step.execute(context) is True
+        assert await expr_step.execute(context) is True
+        
+        context.set("count", 1)
+        assert await expr_step.execute(context) is False
+    
+    @pytest.mark.asyncio
+    async def test_create_condition_step_hyphenated_key(self):
+        """Test that non-identifier context keys are looked up, not evaluated."""
+        context = WorkflowContext()
+        
+        dashed_step = create_condition_step(step_id="dashed", condition="fetch-data")
+        dotted_step = create_condition_step(step_id="dotted", condition="step.1")
+        
+        assert await dashed_step.execute(context) is False
+        assert await dotted_step.execute(context) is False
+        
+        context.set("fetch-data", {"rows": 3})
+        context.set("step.1", True)
+        
+        assert await dashed_step.execute(context) is True
+        assert await dotted_step.execute(context) is True
+    
     @pytest.mark.asyncio
     async def test_parallel_step(self, runner):
         """Test parallel step execution."""
@@ -481,6 +675,92 @@ class TestWorkflowSteps:
         assert result["script1"]["success"] is True
         assert result["script1"]["result"] == "Hello World"
     
+    @pytest.mark.asyncio
+    async def test_parallel_step_failure(self):
+        """Test that a failing parallel step does not abort its siblings."""
+        ok_step = ScriptStep(step_id="ok", script='result = "fine"')
+        bad_step = ScriptStep(step_id="bad", script='raise ValueError("boom")')
+        
+        parallel_step = ParallelStep(
+            step_id="parallel_fail",
+            parallel_steps=[ok_step, bad_step]
+        )
+        
+        result = await parallel_step.execute(WorkflowContext())
+        
+        assert result["ok"] == {"success": True, "result": "fine"}
+        assert result["bad"]["success"] is False
+        assert isinstance(result["bad"]["error"], RuntimeError)
+        assert "boom" in error_message(result["bad"])
+        assert error_message(result["ok"]) is None
+    
+    @pytest.mark.asyncio
+    async def test_parallel_step_sibling_dependencies(self):
+        """Test that children wait for the siblings they depend on."""
+        producer = ScriptStep(
+            step_id="producer",
+            script='context.set("value", 21)\nresult = 21'
+        )
+        consumer = ScriptStep(
+            step_id="consumer",
+            script='result = context.get("value") * 2',
+            depends_on=["producer"]
+        )
+        orphan = ScriptStep(
+            step_id="orphan",
+            script='result = "ran"',
+            depends_on=["broken"]
+        )
+        broken = ScriptStep(step_id="broken", script='raise ValueError("boom")')
+        
+        parallel_step = ParallelStep(
+            step_id="parallel_deps",
+            parallel_steps=[consumer, producer, orphan, broken]
+        )
+        
+        result = await parallel_step.execute(WorkflowContext())
+        
+        assert list(result) == ["consumer", "producer", "orphan", "broken"]
+        assert result["consumer"] == {"success": True, "result": 42}
+        assert result["orphan"]["success"] is False
+        assert "broken" in error_message(result["orphan"])
+    
+    @pytest.mark.asyncio
+    async def test_parallel_step_first_completed_dependencies(self):
+        """Test that first-completed mode reports dependent children as skipped."""
+        producer = ScriptStep(step_id="producer", script='result = 1')
+        consumer = ScriptStep(
+            step_id="consumer",
+            script='result = 2',
+            depends_on=["producer"]
+        )
+        
+        parallel_step = ParallelStep(
+            step_id="parallel_first",
+            parallel_steps=[producer, consumer],
+            wait_for_all=False
+        )
+        
+        result = await parallel_step.execute(WorkflowContext())
+        
+        assert result["producer"] == {"success": True, "result": 1}
+        assert result["consumer"]["success"] is False
+        assert "Skipped" in error_message(result["consumer"])
+        
+        # Only mutually dependent children: nothing can start
+        a = ScriptStep(step_id="a", script='result = 1', depends_on=["b"])
+        b = ScriptStep(step_id="b", script='result = 2', depends_on=["a"])
+        cyclic_step = ParallelStep(
+            step_id="parallel_cycle",
+            parallel_steps=[a, b],
+            wait_for_all=False
+        )
+        
+        result = await cyclic_step.execute(WorkflowContext())
+        
+        assert result["a"]["success"] is False
+        assert result["b"]["success"] is False
+    
     @pytest.mark.asyncio
     async def test_data_transform_step(self):
         """Test data transformation step."""
@@ -502,6 +782,92 @@ class TestWorkflowSteps:
         assert result == "HELLO WORLD"
         assert context.get("output_text") == "HELLO WORLD"
     
+    @pytest.mark.asyncio
+    async def test_data_transform_step_jit(self):
+        """Test that jit transforms run with or without Numba installed."""
+        def double(x):
+            return x * 2
+        
+        step = DataTransformStep(
+            step_id="jit_test",
+            transform_func=double,
+            input_key="value",
+            jit=True
+        )
+        
+        context = WorkflowContext()
+        context.set("value", 21)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            result = await step.execute(context)
+        
+        assert result == 42
+        assert step._compiled is not None
+    
+    @pytest.mark.asyncio
+    async def test_data_transform_step_jit_compile_failure(self, monkeypatch):
+        """Test that jit transforms fall back to Python when Numba fails."""
+        class FakeNumbaError(Exception):
+            pass
+        
+        def njit(**options):
+            def decorate(func):
+                def compiled(data):
+                    raise FakeNumbaError("unsupported type")
+                return compiled
+            return decorate
+        
+        fake_numba = types.SimpleNamespace(
+            njit=njit,
+            core=types.SimpleNamespace(
+                errors=types.SimpleNamespace(NumbaError=FakeNumbaError)
+            ),
+        )
+        monkeypatch.setitem(sys.modules, "numba", fake_numba)
+        
+        def count_keys(data):
+            return len(data)
+        
+        step = DataTransformStep(
+            step_id="jit_fallback",
+            transform_func=count_keys,
+            input_key="value",
+            jit=True
+        )
+        
+        context = WorkflowContext()
+        context.set("value", {"a": 1, "b": 2})
+        
+        with pytest.warns(RuntimeWarning, match="could not compile"):
+            assert await step.execute(context) == 2
+        assert step._compiled is count_keys
+        
+        context.set("value", {"a": 1})
+        assert await step.execute(context) == 1
+    
+    @pytest.mark.asyncio
+    async def test_create_transform_step_builtins(self):
+        """Test the built-in string transforms."""
+        context = WorkflowContext()
+        context.set("text", "Hello")
+        context.set("raw", '{"a": 1}')
+        
+        cases = [
+            ("upper", "text", "HELLO"),
+            ("lower", "text", "hello"),
+            ("length", "text", 5),
+            ("json", "raw", {"a": 1}),
+            ("unknown", "text", "Hello"),
+        ]
+        for transform, input_key, expected in cases:
+            step = create_transform_step(
+                step_id=f"t_{transform}",
+                transform=transform,
+                input_key=input_key
+            )
+            assert await step.execute(context) == expected
+    
     @pytest.mark.asyncio
     async def test_loop_step(self, runner):
         """Test loop step execution."""
@@ -530,6 +896,42 @@ class TestWorkflowSteps:
         assert result[1]["result"] == 9  # 3^2
         assert result[2]["result"] == 16  # 4^2
     
+    @pytest.mark.asyncio
+    async def test_loop_step_concurrency(self):
+        """Test running independent loop iterations concurrently."""
+        class SquareStep(WorkflowStep):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.active = 0
+                self.peak = 0
+            
+            async def execute(self, context):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                value = context.get("loop_test_current_item")
+                context.set(f"square_{value}", value * value)
+                return value * value
+        
+        square = SquareStep(step_id="square")
+        step = LoopStep(
+            step_id="loop_test",
+            loop_step=square,
+            iteration_data_key="numbers",
+            concurrency=2
+        )
+        
+        context = WorkflowContext()
+        context.set("numbers", [1, 2, 3, 4, 5])
+        
+        result = await step.execute(context)
+        
+        assert [r["result"] for r in result] == [1, 4, 9, 16, 25]
+        assert square.peak == 2
+        assert context.get("square_3") == 9
+        assert context.get("loop_test_iteration") == 4
+    
     @pytest.mark.asyncio
     async def test_delay_step(self):
         """Test delay step execution."""
@@ -567,6 +969,115 @@ result = f"Square root of {x}^2 is {y}"
         
         assert result == "Square root of 5^2 is 5.0"
         assert context.get("script_test") == result
+    
+    def test_email_step_template(self):
+        """Test email template variable substitution."""
+        step = EmailStep(
+            step_id="email",
+            to_email="$recipient",
+            subject="Hi $name, $name_suffix $unknown",
+            body="Total: $total"
+        )
+        
+        context = WorkflowContext()
+        context.set("recipient", "ada@example.com")
+        context.set("name", "Ada")
+        context.set("name_suffix", "!")
+        context.set("total", 42)
+        
+        assert step._resolve_value(step.to_email, context) == "ada@example.com"
+        assert step._resolve_value(step.subject, context) == "Hi Ada, ! $unknown"
+        assert step._resolve_value(step.body, context) == "Total: 42"
+    
+    @pytest.mark.asyncio
+    async def test_email_step_reuses_connection(self, monkeypatch):
+        """Test that consecutive emails share one SMTP connection."""
+        from tomo.orchestrators import workflow_steps
+        
+        smtp_cls = Mock()
+        smtp_cls.return_value.noop.return_value = (250, b"OK")
+        monkeypatch.setattr(workflow_steps.smtplib, "SMTP", smtp_cls)
+        
+        step = EmailStep(
+            step_id="email",
+            to_email="ada@example.com",
+            subject="Hi",
+            body="Hello",
+            smtp_config={"server": "smtp.test", "port": 2525}
+        )
+        
+        try:
+            context = WorkflowContext()
+            await step.execute(context)
+            await step.execute(context)
+        finally:
+            workflow_steps.close_smtp_connections()
+        
+        smtp_cls.assert_called_once_with("smtp.test", 2525)
+        assert smtp_cls.return_value.send_message.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_email_step_pools_per_credentials(self, monkeypatch):
+        """Test that steps with different credentials never share a connection."""
+        from tomo.orchestrators import workflow_steps
+        
+        smtp_cls = Mock()
+        smtp_cls.return_value.noop.return_value = (250, b"OK")
+        monkeypatch.setattr(workflow_steps.smtplib, "SMTP", smtp_cls)
+        
+        configs = [
+            {"server": "smtp.test", "username": "ada", "password": "secret"},
+            {"server": "smtp.test", "username": "ada", "password": "wrong"},
+            {"server": "smtp.test", "username": "ada"},
+        ]
+        
+        try:
+            for config in configs:
+                step = EmailStep(
+                    step_id="email",
+                    to_email="ada@example.com",
+                    subject="Hi",
+                    body="Hello",
+                    smtp_config=config
+                )
+                await step.execute(WorkflowContext())
+        finally:
+            workflow_steps.close_smtp_connections()
+        
+        assert smtp_cls.call_count == 3
+        assert smtp_cls.return_value.login.call_count == 2
+    
+    def test_webhook_session_per_loop(self):
+        """Test that each event loop gets its own session, closed on shutdown."""
+        pytest.importorskip("aiohttp")
+        
+        async def get_session():
+            return WebhookStep._get_session()
+        
+        first = asyncio.run(get_session())
+        second = asyncio.run(get_session())
+        
+        assert first is not second
+        assert first.closed and second.closed
+    
+    @pytest.mark.asyncio
+    async def test_webhook_close_session(self):
+        """Test closing the running loop's shared session."""
+        pytest.importorskip("aiohttp")
+        
+        session = WebhookStep._get_session()
+        assert WebhookStep._get_session() is session
+        
+        await WebhookStep.close_session()
+        
+        assert session.closed
+        assert WebhookStep._get_session() is not session
+        await WebhookStep.close_session()
+    
+    def test_script_step_compile_error(self):
+        """Test that invalid scripts fail at construction time."""
+        with pytest.raises(RuntimeError, match="Script compilation failed"):
+            ScriptStep(step_id="bad_script", script="result = (")
 
 
 # Test workflow engine
@@ -632,6 +1143,129 @@ class TestWorkflowEngine:
         with pytest.raises(WorkflowEngineError):
             await workflow_engine.execute_workflow(workflow)
     
+    @pytest.mark.asyncio
+    async def test_workflow_skipped_step_satisfies_dependents(self, workflow_engine, runner):
+        """Test that a skipped step does not block its dependents."""
+        workflow = Workflow(name="Skip Test")
+        
+        step1 = create_tool_step(
+            step_id="skipped_step",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "add", "a": 1, "b": 2},
+            runner=runner,
+            condition=lambda ctx: False
+        )
+        
+        step2 = create_tool_step(
+            step_id="final_step",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "add", "a": 3, "b": 4},
+            runner=runner,
+            depends_on=["skipped_step"]
+        )
+        
+        workflow.add_step(step1)
+        workflow.add_step(step2)
+        
+        state = await workflow_engine.execute_workflow(workflow)
+        
+        assert state.status == WorkflowStatus.COMPLETED
+        assert state.step_results["skipped_step"].status == StepStatus.SKIPPED
+        assert state.context.get("final_step") == 7
+    
+    @pytest.mark.asyncio
+    async def test_workflow_step_retry(self, workflow_engine):
+        """Test that failed steps are retried according to retry_config."""
+        class FlakyStep(WorkflowStep):
+            def __init__(self, failures, **kwargs):
+                super().__init__(**kwargs)
+                self.failures = failures
+                self.attempts = 0
+            
+            async def execute(self, context):
+                self.attempts += 1
+                if self.attempts <= self.failures:
+                    raise RuntimeError(f"attempt {self.attempts} failed")
+                return "ok"
+        
+        flaky = FlakyStep(
+            failures=2,
+            step_id="flaky",
+            retry_config={"max_retries": 3, "retry_delay": 0}
+        )
+        workflow = Workflow(name="Retry Test", steps=[flaky])
+        
+        state = await workflow_engine.execute_workflow(workflow)
+        
+        result = state.get_step_result("flaky")
+        assert state.success
+        assert flaky.attempts == 3
+        assert result.result == "ok"
+        assert result.metadata["retry_count"] == 2
+        assert result.metadata["previous_error"] == "attempt 2 failed"
+        
+        # Exhausted retries fail the workflow
+        failing = FlakyStep(
+            failures=5,
+            step_id="failing",
+            retry_config={"max_retries": 2, "retry_delay": 0}
+        )
+        with pytest.raises(WorkflowEngineError):
+            await workflow_engine.execute_workflow(Workflow(steps=[failing]))
+        assert failing.attempts == 3
+    
+    @pytest.mark.asyncio
+    async def test_sequential_workflow_execution(self, registry, runner):
+        """Test the sequential path used when max_parallel_steps is 1."""
+        from tomo.adapters import OpenAIAdapter
+        engine = WorkflowEngine(registry=registry, adapter=OpenAIAdapter(), max_parallel_steps=1)
+        
+        workflow = Workflow(name="Sequential Test")
+        workflow.add_step(create_tool_step(
+            step_id="add_step",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "add", "a": 10, "b": 5},
+            runner=runner
+        ))
+        workflow.add_step(create_tool_step(
+            step_id="skipped_step",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "add", "a": 1, "b": 1},
+            runner=runner,
+            condition=lambda ctx: False
+        ))
+        workflow.add_step(create_tool_step(
+            step_id="multiply_step",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "multiply", "a": "$add_step", "b": 2},
+            runner=runner,
+            depends_on=["add_step", "skipped_step"]
+        ))
+        
+        state = await engine.execute_workflow(workflow)
+        
+        assert state.success
+        assert state.context.get("multiply_step") == 30
+        assert state.step_results["skipped_step"].status == StepStatus.SKIPPED
+        
+        # A failing step stops its dependents and fails the workflow
+        workflow.add_step(create_tool_step(
+            step_id="fail_step",
+            tool_name="FailingTool",
+            tool_inputs={"should_fail": True},
+            runner=runner
+        ))
+        workflow.add_step(create_tool_step(
+            step_id="after_fail",
+            tool_name="TestCalculator",
+            tool_inputs={"operation": "add", "a": 1, "b": 2},
+            runner=runner,
+            depends_on=["fail_step"]
+        ))
+        
+        with pytest.raises(WorkflowEngineError, match="fail_step"):
+            await engine.execute_workflow(workflow)
+    
     @pytest.mark.asyncio
     async def test_workflow_validation_error(self, workflow_engine):
         """Test workflow validation errors."""
@@ -4,6 +4,9 @@ A lightweight, language-model-agnostic framework for defining, registering,
 and executing typed tools.
 """
 
+import importlib.util
+from typing import Any
+
 from tomo.core.tool import BaseTool, tool
 from tomo.core.registry import ToolRegistry
 from tomo.core.runner import ToolRunner
@@ -29,12 +32,11 @@ try:
 except ImportError:
     orchestrator_available = False
 
-# Import servers if available
-try:
-    from tomo.servers import APIServer, MCPServer
-    server_available = True
-except ImportError:
-    server_available = False
+# Servers are imported lazily (see __getattr__); only check their dependencies here
+server_available = all(
+    importlib.util.find_spec(dep) is not None
+    for dep in ("fastapi", "uvicorn", "websockets")
+)
 
 # Import plugins if available
 try:
@@ -86,3 +88,11 @@ if plugin_available:
     ])
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import server classes on first access."""
+    if name in ("APIServer", "MCPServer"):
+        from tomo import servers
+        return getattr(servers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,12 @@
 """Core components of the Tomo framework."""
 
-from .tool import BaseTool, tool
+from .tool import BaseTool, BatchableTool, tool
 from .registry import ToolRegistry
 from .runner import ToolRunner
 
 __all__ = [
     "BaseTool",
+    "BatchableTool",
     "tool",
     "ToolRegistry",
     "ToolRunner",
@@ -1,6 +1,6 @@
 """Tool registry for managing and discovering tools."""
 
-from typing import Dict, List, Type, Any, Optional, Iterator
+from typing import Dict, List, Type, Any, Optional, Iterator, Tuple
 from .tool import BaseTool
 
 
@@ -14,6 +14,18 @@ class ToolRegistry:
     def __init__(self) -> None:
         """Initialize an empty tool registry."""
         self._tools: Dict[str, Type[BaseTool]] = {}
+        # Generated schemas by tool name; schema generation is slow
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter that increases whenever tools are registered or removed.
+
+        Callers can cache data derived from the registry and rebuild it
+        when the version changes.
+        """
+        return self._version
 
     def register(self, tool_class: Type[BaseTool], name: Optional[str] = None) -> None:
         """Register a tool class with the registry.
@@ -35,6 +47,7 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool_name}' is already registered")
 
         self._tools[tool_name] = tool_class
+        self._version += 1
 
     def unregister(self, name: str) -> bool:
         """Unregister a tool by name.
@@ -47,6 +60,8 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._schemas.pop(name, None)
+            self._version += 1
             return True
         return False
 
@@ -80,6 +95,8 @@ class ToolRegistry:
     def clear(self) -> None:
         """Clear all registered tools."""
         self._tools.clear()
+        self._schemas.clear()
+        self._version += 1
 
     def size(self) -> int:
         """Get the number of registered tools.
@@ -106,7 +123,7 @@ class ToolRegistry:
         Returns:
             A list of tool schemas in OpenAI function calling format.
         """
-        return [tool_class.get_schema() for tool_class in self._tools.values()]
+        return [self._schema_for(name, tool_class) for name, tool_class in self._tools.items()]
 
     def get_schema(self, name: str) -> Optional[Dict[str, Any]]:
         """Get the schema for a specific tool.
@@ -115,10 +132,35 @@ class ToolRegistry:
             name: The name of the tool.
 
         Returns:
-            The tool schema if found, None otherwise.
+            The tool schema if found, None otherwise. Schemas are cached and
+            shared between callers, so they must not be mutated.
         """
         tool_class = self.get(name)
-        return tool_class.get_schema() if tool_class else None
+        return self._schema_for(name, tool_class) if tool_class else None
+
+    def iter_with_schema(self) -> Iterator[Tuple[str, Type[BaseTool], Dict[str, Any]]]:
+        """Iterate over registered tools together with their schemas.
+
+        Yields:
+            ``(name, tool_class, schema)`` tuples in registration order.
+        """
+        for name, tool_class in self._tools.items():
+            yield name, tool_class, self._schema_for(name, tool_class)
+
+    def _schema_for(self, name: str, tool_class: Type[BaseTool]) -> Dict[str, Any]:
+        """Get a registered tool's schema, generating it on first use.
+
+        Args:
+            name: The name the tool is registered under.
+            tool_class: The registered tool class.
+
+        Returns:
+            The cached tool schema.
+        """
+        schema = self._schemas.get(name)
+        if schema is None:
+            schema = self._schemas[name] = tool_class.get_schema()
+        return schema
 
     def auto_discover(self, module: Any) -> int:
         """Auto-discover and register tools from a module.
@@ -1,9 +1,9 @@
 """Tool runner for executing registered tools."""
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 import json
-from pydantic import ValidationError
-from .tool import BaseTool
+from pydantic import BaseModel, ValidationError
+from .tool import BaseTool, BatchableTool
 from .registry import ToolRegistry
 
 
@@ -39,6 +39,8 @@ class ToolRunner:
             registry: The tool registry to use for tool lookup.
         """
         self.registry = registry
+        # Input validators per tool class, see _get_validator
+        self._validators: Dict[Type[BaseTool], Callable[[Dict[str, Any]], BaseTool]] = {}
 
     def run_tool(self, tool_name: str, inputs: Dict[str, Any]) -> Any:
         """Run a tool by name with the given inputs.
@@ -60,15 +62,8 @@ class ToolRunner:
         if tool_class is None:
             raise ToolNotFoundError(f"Tool '{tool_name}' not found in registry")
 
-        try:
-            # Instantiate the tool with input validation
-            tool_instance = tool_class(**inputs)
-        except ValidationError as e:
-            raise ToolValidationError(
-                f"Input validation failed for tool '{tool_name}': {e}"
-            )
-        except TypeError as e:
-            raise ToolValidationError(f"Invalid inputs for tool '{tool_name}': {e}")
+        # Instantiate the tool with input validation
+        tool_instance = self._create_instance(tool_class, tool_name, inputs)
 
         try:
             # Execute the tool
@@ -77,6 +72,114 @@ class ToolRunner:
         except Exception as e:
             raise ToolExecutionError(f"Tool '{tool_name}' execution failed: {e}")
 
+    def run_tool_batch(
+        self, tool_name: str, inputs_list: List[Dict[str, Any]]
+    ) -> List[Tuple[Any, Optional[Exception]]]:
+        """Run a tool once per set of inputs, batching calls when supported.
+
+        Tools implementing ``BatchableTool`` execute all valid inputs in a
+        single ``batch_run`` call; other tools run each input in turn.
+
+        Args:
+            tool_name: The name of the tool to run.
+            inputs_list: Input parameter dictionaries, one per call.
+
+        Returns:
+            A ``(result, error)`` pair per call, in input order. ``error`` is
+            a ToolValidationError or ToolExecutionError when the call failed.
+
+        Raises:
+            ToolNotFoundError: If the tool is not found in the registry.
+        """
+        tool_class = self.registry.get(tool_name)
+        if tool_class is None:
+            raise ToolNotFoundError(f"Tool '{tool_name}' not found in registry")
+
+        outcomes: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(inputs_list)
+        instances = []
+        positions = []
+        for i, inputs in enumerate(inputs_list):
+            try:
+                instances.append(self._create_instance(tool_class, tool_name, inputs))
+                positions.append(i)
+            except ToolValidationError as e:
+                outcomes[i] = (None, e)
+
+        if not instances:
+            return outcomes
+
+        if isinstance(tool_class, BatchableTool):
+            try:
+                results = list(tool_class.batch_run(instances))
+                if len(results) != len(instances):
+                    raise ValueError(
+                        f"batch_run returned {len(results)} results for {len(instances)} inputs"
+                    )
+            except Exception as e:
+                error = ToolExecutionError(f"Tool '{tool_name}' execution failed: {e}")
+                for i in positions:
+                    outcomes[i] = (None, error)
+            else:
+                for i, result in zip(positions, results):
+                    outcomes[i] = (result, None)
+        else:
+            for i, tool_instance in zip(positions, instances):
+                try:
+                    outcomes[i] = (tool_instance.run(), None)
+                except Exception as e:
+                    outcomes[i] = (None, ToolExecutionError(f"Tool '{tool_name}' execution failed: {e}"))
+
+        return outcomes
+
+    def _get_validator(self, tool_class: Type[BaseTool]) -> Callable[[Dict[str, Any]], BaseTool]:
+        """Get the function that builds a validated tool instance from inputs.
+
+        Tools that keep Pydantic's ``__init__`` are validated directly from
+        the input dictionary with the class's compiled validator, skipping
+        keyword argument packing; tools with a custom ``__init__`` are called
+        normally.
+
+        Args:
+            tool_class: The tool class to validate inputs for.
+
+        Returns:
+            A callable taking the input dictionary.
+        """
+        validator = self._validators.get(tool_class)
+        if validator is None:
+            if tool_class.__init__ is BaseModel.__init__:
+                validator = tool_class.model_validate
+            else:
+                def validator(inputs: Dict[str, Any]) -> BaseTool:
+                    return tool_class(**inputs)
+            self._validators[tool_class] = validator
+        return validator
+
+    def _create_instance(
+        self, tool_class: Type[BaseTool], tool_name: str, inputs: Dict[str, Any]
+    ) -> BaseTool:
+        """Instantiate a tool, converting input errors to ToolValidationError.
+
+        Args:
+            tool_class: The tool class to instantiate.
+            tool_name: The name the tool is registered under.
+            inputs: Dictionary of input parameters for the tool.
+
+        Returns:
+            The validated tool instance.
+
+        Raises:
+            ToolValidationError: If the input validation fails.
+        """
+        try:
+            return self._get_validator(tool_class)(inputs)
+        except ValidationError as e:
+            raise ToolValidationError(
+                f"Input validation failed for tool '{tool_name}': {e}"
+            )
+        except TypeError as e:
+            raise ToolValidationError(f"Invalid inputs for tool '{tool_name}': {e}")
+
     def run_tool_from_json(self, tool_name: str, inputs_json: str) -> Any:
         """Run a tool by name with JSON-encoded inputs.
 
@@ -133,7 +236,7 @@ class ToolRunner:
             raise ToolNotFoundError(f"Tool '{tool_name}' not found in registry")
 
         try:
-            tool_class(**inputs)
+            self._get_validator(tool_class)(inputs)
             return True
         except (ValidationError, TypeError):
             return False
@@ -180,14 +283,7 @@ class ToolRunner:
         if tool_class is None:
             raise ToolNotFoundError(f"Tool '{tool_name}' not found in registry")
 
-        try:
-            return tool_class(**inputs)
-        except ValidationError as e:
-            raise ToolValidationError(
-                f"Input validation failed for tool '{tool_name}': {e}"
-            )
-        except TypeError as e:
-            raise ToolValidationError(f"Invalid inputs for tool '{tool_name}': {e}")
+        return self._create_instance(tool_class, tool_name, inputs)
 
     def __repr__(self) -> str:
         """String representation of the runner."""
@@ -1,6 +1,6 @@
 """Core tool definitions and decorators."""
 
-from typing import Any, Dict, Type, TypeVar, Union, get_type_hints, Callable, Optional
+from typing import Any, Dict, List, Protocol, Type, TypeVar, Union, get_type_hints, Callable, Optional, runtime_checkable
 from abc import ABC, abstractmethod
 import inspect
 from pydantic import BaseModel, Field, create_model
@@ -49,6 +49,27 @@ class BaseTool(BaseModel, ABC):
         }
 
 
+@runtime_checkable
+class BatchableTool(Protocol):
+    """Protocol for tool classes that can execute many calls at once.
+
+    Tools wrapping set-oriented backends (embedding models, databases) can
+    define ``batch_run`` as a classmethod; servers then coalesce concurrent
+    calls to the tool into a single invocation.
+    """
+
+    def batch_run(self, tools: List["BaseTool"]) -> List[Any]:
+        """Execute several validated tool instances.
+
+        Args:
+            tools: Tool instances, one per call.
+
+        Returns:
+            One result per tool instance, in the same order.
+        """
+        ...
+
+
 def tool(cls: Type[T]) -> Type[T]:
     """Decorator to register a class as a Tomo tool.
 
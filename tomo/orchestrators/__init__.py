@@ -28,6 +28,7 @@ from .workflow_steps import (
     create_tool_step,
     create_condition_step,
     create_transform_step,
+    error_message,
 )
 
 __all__ = [
@@ -63,4 +64,5 @@ __all__ = [
     "create_tool_step",
     "create_condition_step",
     "create_transform_step",
+    "error_message",
 ]
@@ -1,9 +1,17 @@
 """Conversation management for orchestrator."""
 
-from typing import List, Dict, Any, Optional, Union
+import sys
+import time
+from typing import List, Dict, Any, Callable, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# Interned role names; stored roles share these references.
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+ROLE_SYSTEM = sys.intern("system")
+ROLE_TOOL = sys.intern("tool")
+
 
 @dataclass
 class Message:
@@ -14,20 +22,72 @@ class Message:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        self.role = sys.intern(self.role)
 
-class ConversationManager:
-    """Manages conversation history and context for the orchestrator."""
 
-    def __init__(self, max_messages: int = 50) -> None:
+class ConversationManager:
+    """Manages conversation history and context for the orchestrator.
+
+    Messages are stored as parallel arrays (roles, contents, timestamps,
+    metadatas) so role-based queries only scan the ``roles`` list.
+    ``Message`` objects are materialized on demand. Timestamps are kept as
+    raw epoch seconds and only converted to ``datetime`` when read.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 50,
+        summarize_window: int = 0,
+        summarizer: Optional[Callable[[List[Message]], str]] = None,
+    ) -> None:
         """Initialize conversation manager.
 
         Args:
             max_messages: Maximum number of messages to keep in history
+            summarize_window: Number of oldest messages to collapse into a
+                summary when history overflows (0 disables summarization)
+            summarizer: Optional callable producing summary text from messages;
+                defaults to an extractive summary that keeps tool results
         """
         self.max_messages = max_messages
-        self.messages: List[Message] = []
+        self.summarize_window = summarize_window
+        self.summarizer = summarizer
+        self.roles: List[str] = []
+        self.contents: List[str] = []
+        self.timestamps: List[float] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self._system_count = 0
         self.context: Dict[str, Any] = {}
 
+    def __len__(self) -> int:
+        """Get number of messages in history."""
+        return len(self.roles)
+
+    def __getitem__(self, index: int) -> Message:
+        """Get a message view by index."""
+        return Message(
+            role=self.roles[index],
+            content=self.contents[index],
+            timestamp=datetime.fromtimestamp(self.timestamps[index]),
+            metadata=self.metadatas[index],
+        )
+
+    @property
+    def messages(self) -> List[Message]:
+        """Get conversation history as a list of ``Message`` views."""
+        return [
+            Message(
+                role=role,
+                content=content,
+                timestamp=datetime.fromtimestamp(timestamp),
+                metadata=metadata,
+            )
+            for role, content, timestamp, metadata in zip(
+                self.roles, self.contents, self.timestamps, self.metadatas
+            )
+        ]
+
     def add_message(
         self, role: str, content: str, metadata: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -38,19 +98,112 @@ class ConversationManager:
             content: Message content
             metadata: Optional metadata for the message
         """
-        message = Message(role=role, content=content, metadata=metadata or {})
+        role = sys.intern(role)
+        self.roles.append(role)
+        self.contents.append(content)
+        self.timestamps.append(time.time())
+        self.metadatas.append(metadata or {})
+        if role is ROLE_SYSTEM:
+            self._system_count += 1
+
+        if self.summarize_window > 0 and len(self.roles) > self.max_messages:
+            self.summarize(self.summarize_window)
+
+        # Maintain max message limit; system messages are never evicted
+        total = len(self.roles)
+        excess = min(total - self.max_messages, total - self._system_count)
+        if excess > 0:
+            self._evict_oldest(excess)
+
+    def _evict_oldest(self, count: int) -> None:
+        """Remove the ``count`` oldest non-system messages in place.
+
+        Args:
+            count: Number of non-system messages to remove
+        """
+        evict: List[int] = []
+        for i, role in enumerate(self.roles):
+            if role is not ROLE_SYSTEM:
+                evict.append(i)
+                if len(evict) == count:
+                    break
+
+        for i in reversed(evict):
+            del self.roles[i]
+            del self.contents[i]
+            del self.timestamps[i]
+            del self.metadatas[i]
+
+    def summarize(self, window: int) -> Optional[Message]:
+        """Collapse the oldest messages into a single system summary message.
+
+        The oldest ``window`` non-system messages (and any earlier summaries)
+        are replaced by one summary message at the position of the first
+        collapsed message. Regular system messages are left untouched.
 
-        self.messages.append(message)
+        Args:
+            window: Maximum number of messages to collapse
 
-        # Maintain max message limit
-        if len(self.messages) > self.max_messages:
-            # Remove oldest non-system messages
-            system_messages = [msg for msg in self.messages if msg.role == "system"]
-            other_messages = [msg for msg in self.messages if msg.role != "system"]
+        Returns:
+            The summary message, or None if there was nothing to summarize
+        """
+        indices: List[int] = []
+        for i, role in enumerate(self.roles):
+            if role is not ROLE_SYSTEM or self.metadatas[i].get("summary"):
+                indices.append(i)
+                if len(indices) == window:
+                    break
+
+        if not indices:
+            return None
+
+        collapsed = [self[i] for i in indices]
+        if self.summarizer:
+            content = self.summarizer(collapsed)
+        else:
+            content = self._extractive_summary(collapsed)
+
+        summary = Message(
+            role=ROLE_SYSTEM,
+            content=content,
+            timestamp=collapsed[-1].timestamp,
+            metadata={
+                "summary": True,
+                "summarized_messages": sum(
+                    m.metadata.get("summarized_messages", 1) for m in collapsed
+                ),
+            },
+        )
 
-            # Keep all system messages and recent other messages
-            keep_count = self.max_messages - len(system_messages)
-            self.messages = system_messages + other_messages[-keep_count:]
+        last_timestamp = self.timestamps[indices[-1]]
+        for i in reversed(indices):
+            if self.roles[i] is ROLE_SYSTEM:
+                self._system_count -= 1
+            del self.roles[i]
+            del self.contents[i]
+            del self.timestamps[i]
+            del self.metadatas[i]
+
+        first = indices[0]
+        self.roles.insert(first, summary.role)
+        self.contents.insert(first, summary.content)
+        self.timestamps.insert(first, last_timestamp)
+        self.metadatas.insert(first, summary.metadata)
+        self._system_count += 1
+
+        return summary
+
+    @staticmethod
+    def _extractive_summary(messages: List[Message]) -> str:
+        """Summarize messages by keeping earlier summaries and tool results."""
+        kept = [
+            m.content
+            for m in messages
+            if m.role is ROLE_TOOL or m.metadata.get("summary")
+        ]
+        if not kept:
+            return f"{len(messages)} earlier messages omitted."
+        return "\n".join(kept)
 
     def get_messages(self, include_metadata: bool = False) -> List[Dict[str, Union[str, Dict[str, Any]]]]:
         """Get conversation messages in LLM format.
@@ -61,13 +214,21 @@ class ConversationManager:
         Returns:
             List of message dictionaries
         """
+        return self._format_messages(0, include_metadata)
+
+    def _format_messages(
+        self, start: int, include_metadata: bool = False
+    ) -> List[Dict[str, Union[str, Dict[str, Any]]]]:
+        """Format messages from ``start`` onwards as LLM message dictionaries."""
         result: List[Dict[str, Union[str, Dict[str, Any]]]] = []
 
-        for message in self.messages:
-            msg_dict: Dict[str, Union[str, Dict[str, Any]]] = {"role": message.role, "content": message.content}
+        for role, content, metadata in zip(
+            self.roles[start:], self.contents[start:], self.metadatas[start:]
+        ):
+            msg_dict: Dict[str, Union[str, Dict[str, Any]]] = {"role": role, "content": content}
 
-            if include_metadata and message.metadata:
-                msg_dict["metadata"] = message.metadata
+            if include_metadata and metadata:
+                msg_dict["metadata"] = metadata
 
             result.append(msg_dict)
 
@@ -82,10 +243,7 @@ class ConversationManager:
         Returns:
             List of recent message dictionaries
         """
-        recent_messages = (
-            self.messages[-count:] if len(self.messages) > count else self.messages
-        )
-        return self.get_messages()[-count:]
+        return self._format_messages(-count)
 
     def add_tool_result(self, tool_name: str, result: Any, success: bool = True) -> None:
         """Add a tool execution result to conversation.
@@ -100,7 +258,7 @@ class ConversationManager:
             content = f"Tool '{tool_name}' failed: {result}"
 
         self.add_message(
-            role="tool",
+            role=ROLE_TOOL,
             content=content,
             metadata={"tool_name": tool_name, "success": success, "result": result},
         )
@@ -132,7 +290,11 @@ class ConversationManager:
 
     def clear(self) -> None:
         """Clear conversation history and context."""
-        self.messages.clear()
+        self.roles.clear()
+        self.contents.clear()
+        self.timestamps.clear()
+        self.metadatas.clear()
+        self._system_count = 0
         self.context.clear()
 
     def get_summary(self) -> Dict[str, Any]:
@@ -142,13 +304,15 @@ class ConversationManager:
             Dictionary with conversation statistics
         """
         return {
-            "total_messages": len(self.messages),
-            "user_messages": len([m for m in self.messages if m.role == "user"]),
-            "assistant_messages": len(
-                [m for m in self.messages if m.role == "assistant"]
-            ),
-            "tool_messages": len([m for m in self.messages if m.role == "tool"]),
+            "total_messages": len(self.roles),
+            "user_messages": self.roles.count(ROLE_USER),
+            "assistant_messages": self.roles.count(ROLE_ASSISTANT),
+            "tool_messages": self.roles.count(ROLE_TOOL),
             "context_keys": list(self.context.keys()),
-            "oldest_message": self.messages[0].timestamp if self.messages else None,
-            "newest_message": self.messages[-1].timestamp if self.messages else None,
+            "oldest_message": (
+                datetime.fromtimestamp(self.timestamps[0]) if self.timestamps else None
+            ),
+            "newest_message": (
+                datetime.fromtimestamp(self.timestamps[-1]) if self.timestamps else None
+            ),
         }
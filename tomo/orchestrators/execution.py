@@ -64,12 +64,13 @@ class ExecutionEngine:
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
+        names = [tool_call.get("name", "unknown") for tool_call in tool_calls]
         processed_results = []
-        for i, result in enumerate(results):
+        for name, result in zip(names, results):
             if isinstance(result, Exception):
                 processed_results.append(
                     {
-                        "tool": tool_calls[i].get("name", "unknown"),
+                        "tool": name,
                         "success": False,
                         "error": str(result),
                     }
@@ -77,7 +78,7 @@ class ExecutionEngine:
             else:
                 processed_results.append(
                     {
-                        "tool": tool_calls[i].get("name", "unknown"),
+                        "tool": name,
                         "success": True,
                         "result": result,
                     }
@@ -99,11 +100,12 @@ class ExecutionEngine:
         results = []
 
         for tool_call in tool_calls:
+            name = tool_call.get("name", "unknown")
             try:
                 result = await self._execute_tool_with_retry(tool_call)
                 results.append(
                     {
-                        "tool": tool_call.get("name", "unknown"),
+                        "tool": name,
                         "success": True,
                         "result": result,
                     }
@@ -111,7 +113,7 @@ class ExecutionEngine:
             except Exception as e:
                 results.append(
                     {
-                        "tool": tool_call.get("name", "unknown"),
+                        "tool": name,
                         "success": False,
                         "error": str(e),
                     }
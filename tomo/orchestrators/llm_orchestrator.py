@@ -20,6 +20,8 @@ class OrchestrationConfig:
     system_prompt: Optional[str] = None
     custom_instructions: Optional[str] = None
     enable_memory: bool = True
+    max_messages: int = 50
+    summarize_window: int = 0
     enable_retry: bool = True
     max_retries: int = 3
 
@@ -49,7 +51,14 @@ class LLMOrchestrator:
 
         # Initialize components
         self.runner = ToolRunner(registry)
-        self.conversation = ConversationManager() if self.config.enable_memory else None
+        self.conversation = (
+            ConversationManager(
+                max_messages=self.config.max_messages,
+                summarize_window=self.config.summarize_window,
+            )
+            if self.config.enable_memory
+            else None
+        )
         self.execution_engine = ExecutionEngine(self.runner, self.adapter)
 
         # Create system prompt
@@ -125,7 +134,8 @@ Available tools are listed below:
 
             # Add results to context
             if isinstance(context["executed_tools"], list):
-                context["executed_tools"].extend([call.get("name", "unknown") for call in tool_calls])
+                # Tool names were already extracted into the results
+                context["executed_tools"].extend(r["tool"] for r in tool_results)
             if isinstance(context["results"], list):
                 context["results"].extend(tool_results)
 
@@ -223,15 +233,12 @@ Available tools are listed below:
         results = []
 
         for tool_call in tool_calls:
+            name = tool_call.get("name", "unknown")
             try:
                 result = await self.execution_engine.execute_tool(tool_call)
-                results.append(
-                    {"tool": tool_call.get("name", "unknown"), "success": True, "result": result}
-                )
+                results.append({"tool": name, "success": True, "result": result})
             except Exception as e:
-                results.append(
-                    {"tool": tool_call.get("name", "unknown"), "success": False, "error": str(e)}
-                )
+                results.append({"tool": name, "success": False, "error": str(e)})
 
         return results
 
@@ -240,10 +247,8 @@ Available tools are listed below:
     ) -> bool:
         """Determine if orchestration should continue."""
         # Continue if there were successful tool executions and we haven't hit max iterations
-        successful_tools = [r for r in tool_results if r["success"]]
-        return (
-            len(successful_tools) > 0
-            and context["iteration"] < self.config.max_iterations
+        return context["iteration"] < self.config.max_iterations and any(
+            r["success"] for r in tool_results
         )
 
     async def _generate_final_response(self, context: Dict[str, Any]) -> str:
@@ -271,17 +276,12 @@ Available tools are listed below:
 
     def _summarize_context(self, context: Dict[str, Any]) -> str:
         """Summarize execution context for LLM."""
-        if not context["results"]:
-            return "No previous actions taken."
-
-        summary_parts = []
-        for result in context["results"]:
-            if result["success"]:
-                summary_parts.append(f"{result['tool']}: {result['result']}")
-            else:
-                summary_parts.append(f"{result['tool']}: failed - {result['error']}")
-
-        return "; ".join(summary_parts)
+        return "; ".join(
+            f"{r['tool']}: {r['result']}"
+            if r["success"]
+            else f"{r['tool']}: failed - {r['error']}"
+            for r in context["results"]
+        ) or "No previous actions taken."
 
     def reset_conversation(self) -> None:
         """Reset conversation history."""
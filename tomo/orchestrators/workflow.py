@@ -2,16 +2,20 @@
 
 import asyncio
 import uuid
+from collections import ChainMap, deque
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, Callable, Set
+from typing import Any, Dict, List, Optional, Union, Callable, Sequence, Set, Tuple
 from pydantic import BaseModel
 
 
 class WorkflowStatus(Enum):
-    """Status of workflow execution."""
+    """Status of workflow execution.
+    
+    Members are singletons, so compare them by identity (``is``).
+    """
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
@@ -21,7 +25,10 @@ class WorkflowStatus(Enum):
 
 
 class StepStatus(Enum):
-    """Status of individual step execution."""
+    """Status of individual step execution.
+    
+    Members are singletons, so compare them by identity (``is``).
+    """
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
@@ -30,21 +37,45 @@ class StepStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+_MISSING = object()
+
+# Values of these types are safe to compare by equality when skipping writes;
+# mutable values are only skipped when the very same object is re-set.
+_IMMUTABLE_SCALARS = (str, int, float, bool, bytes, type(None))
+
+
+@dataclass(slots=True)
 class WorkflowContext:
-    """Shared context and data between workflow steps."""
+    """Shared context and data between workflow steps.
+    
+    Keys written through ``set``/``update`` are recorded as dirty so that
+    observers can pick up only what changed via ``pop_dirty_keys``.
+    """
     
     data: Dict[str, Any] = field(default_factory=dict)
     variables: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _dirty: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from the context data."""
         return self.data.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
-        """Set a value in the context data."""
+        """Set a value in the context data.
+        
+        Re-setting a key to the same object, or to an equal immutable scalar,
+        is a no-op and does not mark the key dirty.
+        """
+        prev = self.data.get(key, _MISSING)
+        if prev is value or (
+            type(prev) is type(value)
+            and isinstance(value, _IMMUTABLE_SCALARS)
+            and prev == value
+        ):
+            return
         self.data[key] = value
+        self._dirty.add(key)
     
     def get_variable(self, name: str, default: Any = None) -> Any:
         """Get a workflow variable."""
@@ -56,10 +87,35 @@ class WorkflowContext:
     
     def update(self, data: Dict[str, Any]) -> None:
         """Update context with new data."""
-        self.data.update(data)
+        self.data |= data
+        self._dirty.update(data)
+    
+    def pop_dirty_keys(self) -> Set[str]:
+        """Get the keys changed since the last call and reset tracking.
+        
+        Returns:
+            Set of changed context keys
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        return dirty
+    
+    def fork(self) -> "WorkflowContext":
+        """Create a child context layered over this one.
+        
+        The child's data is a ``ChainMap`` whose first map holds the child's
+        own writes; reads fall through to this context without copying it.
+        Variables and metadata are shared.
+        
+        Returns:
+            New workflow context
+        """
+        return WorkflowContext(
+            data=ChainMap({}, self.data), variables=self.variables, metadata=self.metadata
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of a workflow step execution."""
     
@@ -70,10 +126,14 @@ class StepResult:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    start_mono: Optional[float] = None
+    end_mono: Optional[float] = None
     
     @property
     def duration(self) -> Optional[float]:
         """Get execution duration in seconds."""
+        if self.start_mono is not None and self.end_mono is not None:
+            return self.end_mono - self.start_mono
         if self.start_time and self.end_time:
             return (self.end_time - self.start_time).total_seconds()
         return None
@@ -81,10 +141,10 @@ class StepResult:
     @property
     def success(self) -> bool:
         """Check if step completed successfully."""
-        return self.status == StepStatus.COMPLETED
+        return self.status is StepStatus.COMPLETED
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowState:
     """Current state of workflow execution."""
     
@@ -98,6 +158,9 @@ class WorkflowState:
     end_time: Optional[datetime] = None
     error: Optional[str] = None
     context: WorkflowContext = field(default_factory=WorkflowContext)
+    start_mono: Optional[float] = None
+    # Completed or skipped steps, i.e. steps whose dependents may run
+    satisfied_steps: Set[str] = field(default_factory=set)
     
     @property
     def duration(self) -> Optional[float]:
@@ -109,7 +172,7 @@ class WorkflowState:
     @property
     def success(self) -> bool:
         """Check if workflow completed successfully."""
-        return self.status == WorkflowStatus.COMPLETED
+        return self.status is WorkflowStatus.COMPLETED
     
     def get_step_result(self, step_id: str) -> Optional[StepResult]:
         """Get result for a specific step."""
@@ -149,7 +212,7 @@ class WorkflowStep(ABC):
         self.step_id = step_id
         self.name = name or step_id
         self.description = description or ""
-        self.depends_on = depends_on or []
+        self.depends_on: Sequence[str] = tuple(depends_on or ())
         self.condition = condition
         self.retry_config = retry_config or {}
     
@@ -178,9 +241,12 @@ class WorkflowStep(ABC):
             return True
         return self.condition(context)
     
-    def get_dependencies(self) -> List[str]:
-        """Get list of step IDs this step depends on."""
-        return self.depends_on.copy()
+    def get_dependencies(self) -> Sequence[str]:
+        """Get the step IDs this step depends on.
+        
+        Returns the stored sequence without copying; callers must not mutate it.
+        """
+        return self.depends_on
 
 
 class Workflow:
@@ -212,6 +278,16 @@ class Workflow:
         self.steps: Dict[str, WorkflowStep] = {}
         self.metadata = metadata or {}
         
+        # Cached dependency graph data, invalidated when steps change
+        self._execution_order: Optional[List[str]] = None
+        self._dependents: Optional[Dict[str, List[str]]] = None
+        self._graph_snapshot: List[Tuple[str, WorkflowStep, Tuple[str, ...]]] = []
+        
+        # Dependency levels and parallel groups, maintained by add_step
+        self._dependency_levels: Dict[str, int] = {}
+        self._parallel_groups: Dict[int, List[str]] = {}
+        self._levels_stale = False
+        
         # Add steps if provided
         if steps:
             for step in steps:
@@ -231,7 +307,96 @@ class Workflow:
             if dep_id not in self.steps:
                 raise ValueError(f"Step '{step.step_id}' depends on unknown step '{dep_id}'")
         
+        # Direct edits made before this call still show up as a snapshot
+        # mismatch on the next read, which rebuilds everything
         self.steps[step.step_id] = step
+        self._graph_snapshot.append(
+            (step.step_id, step, tuple(step.get_dependencies()))
+        )
+        self._invalidate_cache()
+        
+        # Dependencies are already present, so the step's level is final;
+        # a dependency added directly to ``steps`` has no level yet
+        deps = step.get_dependencies()
+        if any(dep_id not in self._dependency_levels for dep_id in deps):
+            self._levels_stale = True
+        if not self._levels_stale:
+            level = max(
+                (self._dependency_levels[dep_id] for dep_id in deps),
+                default=-1
+            ) + 1
+            self._dependency_levels[step.step_id] = level
+            self._parallel_groups.setdefault(level, []).append(step.step_id)
+    
+    def _invalidate_cache(self) -> None:
+        """Drop cached execution order and dependents map."""
+        self._execution_order = None
+        self._dependents = None
+    
+    def _graph_state(self) -> List[Tuple[str, WorkflowStep, Tuple[str, ...]]]:
+        """Capture the step objects and dependencies the caches were built from."""
+        return [
+            (step_id, step, tuple(step.get_dependencies()))
+            for step_id, step in self.steps.items()
+        ]
+    
+    def _check_cache(self) -> None:
+        """Invalidate caches if steps were changed without ``add_step``.
+        
+        Steps are compared by object and dependencies, so replacing an entry
+        in ``steps`` or reassigning a step's ``depends_on`` is detected even
+        when the number of steps is unchanged.
+        """
+        state = self._graph_state()
+        if state != self._graph_snapshot:
+            self._invalidate_cache()
+            self._levels_stale = True
+            self._graph_snapshot = state
+    
+    def _rebuild_levels(self) -> None:
+        """Recompute dependency levels after steps were changed directly."""
+        levels: Dict[str, int] = {}
+        groups: Dict[int, List[str]] = {}
+        for step_id in self.get_execution_order():
+            level = max(
+                (levels[dep_id] for dep_id in self.steps[step_id].get_dependencies()
+                 if dep_id in levels),
+                default=-1
+            ) + 1
+            levels[step_id] = level
+            groups.setdefault(level, []).append(step_id)
+        
+        self._dependency_levels = levels
+        self._parallel_groups = groups
+        self._levels_stale = False
+    
+    def get_dependency_levels(self) -> Dict[str, int]:
+        """Get the dependency level of each step.
+        
+        Steps without dependencies are at level 0; every other step is one
+        level above its deepest dependency.
+        
+        Returns:
+            Dictionary mapping step IDs to dependency levels
+        """
+        self._check_cache()
+        if self._levels_stale:
+            self._rebuild_levels()
+        return dict(self._dependency_levels)
+    
+    def get_parallel_groups(self) -> Dict[int, List[str]]:
+        """Get steps grouped by dependency level.
+        
+        Steps in the same group have no dependencies on each other and can
+        run in parallel.
+        
+        Returns:
+            Dictionary mapping dependency levels to step IDs
+        """
+        self._check_cache()
+        if self._levels_stale:
+            self._rebuild_levels()
+        return {level: list(step_ids) for level, step_ids in self._parallel_groups.items()}
     
     def get_step(self, step_id: str) -> Optional[WorkflowStep]:
         """Get a step by ID.
@@ -248,41 +413,80 @@ class Workflow:
         """Get list of all step IDs in the workflow."""
         return list(self.steps.keys())
     
+    def get_dependents(self, step_id: str) -> List[str]:
+        """Get IDs of steps that directly depend on a step.
+        
+        Args:
+            step_id: ID of the step
+            
+        Returns:
+            List of dependent step IDs
+        """
+        return self.get_dependents_map().get(step_id, [])
+    
+    def get_dependents_map(self) -> Dict[str, List[str]]:
+        """Get the reverse dependency map of the workflow.
+        
+        The map is cached until the workflow's steps change; callers must
+        not mutate it.
+        
+        Returns:
+            Dictionary mapping step IDs to the IDs of their direct dependents
+        """
+        self._check_cache()
+        if self._dependents is None:
+            dependents: Dict[str, List[str]] = {}
+            for sid, step in self.steps.items():
+                for dep_id in step.get_dependencies():
+                    dependents.setdefault(dep_id, []).append(sid)
+            self._dependents = dependents
+        
+        return self._dependents
+    
     def get_execution_order(self) -> List[str]:
         """Get steps in topological order based on dependencies.
         
+        The order is cached until the workflow's steps change.
+        
         Returns:
             List of step IDs in execution order
             
         Raises:
             ValueError: If circular dependencies are detected
         """
-        # Topological sort implementation
-        visited = set()
-        temp_visited = set()
+        self._check_cache()
+        if self._execution_order is None:
+            self._execution_order = self._compute_execution_order()
+        
+        return list(self._execution_order)
+    
+    def _compute_execution_order(self) -> List[str]:
+        """Compute the topological order of the workflow steps (Kahn's algorithm)."""
+        # Count in-degrees over known steps only; unknown dependencies are
+        # reported by validate()
+        in_degree = {
+            step_id: sum(1 for dep_id in step.get_dependencies() if dep_id in self.steps)
+            for step_id, step in self.steps.items()
+        }
+        
+        queue = deque(step_id for step_id, degree in in_degree.items() if degree == 0)
         result = []
         
-        def visit(step_id: str) -> None:
-            if step_id in temp_visited:
-                raise ValueError(f"Circular dependency detected involving step '{step_id}'")
+        dependents = self.get_dependents_map()
+        while queue:
+            step_id = queue.popleft()
+            result.append(step_id)
             
-            if step_id not in visited:
-                temp_visited.add(step_id)
-                
-                # Visit dependencies first
-                step = self.steps.get(step_id)
-                if step:
-                    for dep_id in step.get_dependencies():
-                        visit(dep_id)
-                
-                temp_visited.remove(step_id)
-                visited.add(step_id)
-                result.append(step_id)
-        
-        # Visit all steps
-        for step_id in self.steps:
-            if step_id not in visited:
-                visit(step_id)
+            for dependent_id in dependents.get(step_id, ()):
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+        
+        if len(result) < len(self.steps):
+            cyclic = [step_id for step_id, degree in in_degree.items() if degree > 0]
+            raise ValueError(
+                f"Circular dependency detected involving steps: {', '.join(cyclic)}"
+            )
         
         return result
     
@@ -292,12 +496,22 @@ class Workflow:
         Returns:
             List of validation errors (empty if valid)
         """
+        errors, _ = self.validate_and_order()
+        return errors
+    
+    def validate_and_order(self) -> Tuple[List[str], List[str]]:
+        """Validate the workflow and compute its execution order in one pass.
+        
+        Returns:
+            Tuple of (validation errors, execution order). The execution order
+            is empty if the workflow is invalid.
+        """
         errors = []
         
         # Check for empty workflow
         if not self.steps:
             errors.append("Workflow has no steps")
-            return errors
+            return errors, []
         
         # Check dependencies
         for step_id, step in self.steps.items():
@@ -306,12 +520,15 @@ class Workflow:
                     errors.append(f"Step '{step_id}' depends on unknown step '{dep_id}'")
         
         # Check for circular dependencies
+        execution_order: List[str] = []
         try:
-            self.get_execution_order()
+            execution_order = self.get_execution_order()
         except ValueError as e:
             errors.append(str(e))
         
-        return errors
+        if errors:
+            return errors, []
+        return errors, execution_order
     
     def create_state(self) -> WorkflowState:
         """Create initial workflow state for execution.
@@ -1,8 +1,10 @@
 """Workflow execution engine for Tomo."""
 
 import asyncio
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Callable
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Callable, Tuple
 from ..core.registry import ToolRegistry
 from ..core.runner import ToolRunner
 from ..adapters.base import BaseAdapter
@@ -23,6 +25,20 @@ class WorkflowEngineError(Exception):
     pass
 
 
+_EVENT_HANDLERS = frozenset({
+    "on_workflow_start",
+    "on_workflow_complete",
+    "on_workflow_error",
+    "on_step_start",
+    "on_step_complete",
+    "on_step_error",
+})
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Default event handler that does nothing."""
+
+
 class WorkflowEngine:
     """Engine for executing declarative workflows."""
     
@@ -57,13 +73,19 @@ class WorkflowEngine:
             self.runner = None
             self.execution_engine = None
         
-        # Event handlers
-        self.on_workflow_start: Optional[Callable[[Workflow, WorkflowState], None]] = None
-        self.on_workflow_complete: Optional[Callable[[Workflow, WorkflowState], None]] = None
-        self.on_workflow_error: Optional[Callable[[Workflow, WorkflowState, Exception], None]] = None
-        self.on_step_start: Optional[Callable[[WorkflowStep, WorkflowState], None]] = None
-        self.on_step_complete: Optional[Callable[[WorkflowStep, StepResult, WorkflowState], None]] = None
-        self.on_step_error: Optional[Callable[[WorkflowStep, Exception, WorkflowState], None]] = None
+        # Event handlers (no-op by default so they can be called unconditionally)
+        self.on_workflow_start: Callable[[Workflow, WorkflowState], None] = _noop
+        self.on_workflow_complete: Callable[[Workflow, WorkflowState], None] = _noop
+        self.on_workflow_error: Callable[[Workflow, WorkflowState, Exception], None] = _noop
+        self.on_step_start: Callable[[WorkflowStep, WorkflowState], None] = _noop
+        self.on_step_complete: Callable[[WorkflowStep, StepResult, WorkflowState], None] = _noop
+        self.on_step_error: Callable[[WorkflowStep, Exception, WorkflowState], None] = _noop
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Assigning None to an event handler restores the no-op default
+        if value is None and name in _EVENT_HANDLERS:
+            value = _noop
+        super().__setattr__(name, value)
     
     async def execute_workflow(
         self, 
@@ -82,14 +104,15 @@ class WorkflowEngine:
         Raises:
             WorkflowEngineError: If workflow execution fails
         """
-        # Validate workflow
-        validation_errors = workflow.validate()
+        # Validate workflow and compute execution order in one pass
+        validation_errors, execution_order = workflow.validate_and_order()
         if validation_errors:
             raise WorkflowEngineError(f"Workflow validation failed: {'; '.join(validation_errors)}")
         
         # Create initial state
         state = workflow.create_state()
         state.start_time = datetime.now()
+        state.start_mono = time.monotonic()
         state.status = WorkflowStatus.RUNNING
         
         # Initialize context
@@ -97,20 +120,18 @@ class WorkflowEngine:
             state.context.update(initial_context)
         
         # Fire start event
-        if self.on_workflow_start:
-            self.on_workflow_start(workflow, state)
+        self.on_workflow_start(workflow, state)
         
         try:
             # Execute workflow steps
-            await self._execute_workflow_steps(workflow, state)
+            await self._execute_workflow_steps(workflow, state, execution_order)
             
             # Mark workflow as completed
             state.status = WorkflowStatus.COMPLETED
             state.end_time = datetime.now()
             
             # Fire completion event
-            if self.on_workflow_complete:
-                self.on_workflow_complete(workflow, state)
+            self.on_workflow_complete(workflow, state)
                 
         except Exception as e:
             # Mark workflow as failed
@@ -119,230 +140,224 @@ class WorkflowEngine:
             state.end_time = datetime.now()
             
             # Fire error event
-            if self.on_workflow_error:
-                self.on_workflow_error(workflow, state, e)
+            self.on_workflow_error(workflow, state, e)
             
             raise WorkflowEngineError(f"Workflow execution failed: {str(e)}") from e
         
         return state
     
-    async def _execute_workflow_steps(self, workflow: Workflow, state: WorkflowState) -> None:
+    async def _execute_workflow_steps(
+        self,
+        workflow: Workflow,
+        state: WorkflowState,
+        execution_order: List[str]
+    ) -> None:
         """Execute all workflow steps in proper order.
         
         Args:
             workflow: Workflow being executed
             state: Current workflow state
+            execution_order: Step IDs in topological order
         """
-        # Get execution order
-        execution_order = workflow.get_execution_order()
+        if self.max_parallel_steps <= 1:
+            await self._execute_sequential(workflow, state, execution_order)
+            return
         
-        # Track steps ready for execution
-        ready_steps: Set[str] = set()
-        running_steps: Set[str] = set()
+        # Track steps ready for execution (FIFO, seeded in topological order)
+        ready_steps: Deque[str] = deque()
+        running_tasks: Dict["asyncio.Task[StepResult]", str] = {}
+        done_queue: "asyncio.Queue[asyncio.Task[StepResult]]" = asyncio.Queue()
         
-        # Find initially ready steps (no dependencies)
+        # Count unmet dependencies per step; steps with none are ready
+        dependents = workflow.get_dependents_map()
+        remaining_deps: Dict[str, int] = {}
         for step_id in execution_order:
-            step = workflow.get_step(step_id)
-            if step and not step.get_dependencies():
-                ready_steps.add(step_id)
+            remaining_deps[step_id] = len(workflow.steps[step_id].get_dependencies())
+            if not remaining_deps[step_id]:
+                ready_steps.append(step_id)
         
         # Execute steps until all are complete
-        while ready_steps or running_steps:
+        while ready_steps or running_tasks:
             # Start new steps up to parallel limit
-            while ready_steps and len(running_steps) < self.max_parallel_steps:
-                step_id = ready_steps.pop()
-                step = workflow.get_step(step_id)
+            while ready_steps and len(running_tasks) < self.max_parallel_steps:
+                step_id = ready_steps.popleft()
+                step = workflow.steps[step_id]
                 
-                if step and step.should_execute(state.context):
+                if step.should_execute(state.context):
                     # Start step execution
-                    running_steps.add(step_id)
                     task = asyncio.create_task(
                         self._execute_step_with_timeout(step, state),
                         name=f"step_{step_id}"
                     )
-                    # Store task for monitoring
-                    state.context.metadata[f"task_{step_id}"] = task
+                    task.add_done_callback(done_queue.put_nowait)
+                    running_tasks[task] = step_id
                 else:
                     # Skip step due to condition
                     self._mark_step_skipped(step_id, state)
-                    self._check_for_ready_steps(workflow, state, step_id, ready_steps, running_steps)
+                    self._check_for_ready_steps(dependents, step_id, ready_steps, remaining_deps)
             
             # Wait for at least one step to complete
-            if running_steps:
-                await self._wait_for_step_completion(workflow, state, ready_steps, running_steps)
+            if running_tasks:
+                await self._wait_for_step_completion(
+                    state, dependents, ready_steps, running_tasks, remaining_deps, done_queue
+                )
         
-        # Check if all required steps completed successfully
-        for step_id in execution_order:
-            step = workflow.get_step(step_id)
-            if step and step.should_execute(state.context):
-                if not state.is_step_completed(step_id):
-                    if state.is_step_failed(step_id):
-                        raise WorkflowEngineError(f"Required step '{step_id}' failed")
-                    else:
-                        raise WorkflowEngineError(f"Required step '{step_id}' did not complete")
+        self._check_all_steps_finished(state, execution_order)
     
-    async def _execute_step_with_timeout(self, step: WorkflowStep, state: WorkflowState) -> StepResult:
-        """Execute a single step with timeout handling.
+    async def _execute_sequential(
+        self,
+        workflow: Workflow,
+        state: WorkflowState,
+        execution_order: List[str]
+    ) -> None:
+        """Execute workflow steps one at a time in topological order.
+        
+        Used when ``max_parallel_steps`` is 1; awaits each step directly
+        instead of going through task scheduling.
         
         Args:
-            step: Step to execute
+            workflow: Workflow being executed
             state: Current workflow state
-            
-        Returns:
-            Step execution result
+            execution_order: Step IDs in topological order
         """
-        state.current_step = step.step_id
-        
-        # Fire step start event
-        if self.on_step_start:
-            self.on_step_start(step, state)
-        
-        # Create step result
-        result = StepResult(
-            step_id=step.step_id,
-            status=StepStatus.RUNNING,
-            start_time=datetime.now()
-        )
-        
-        try:
-            # Execute step with timeout
-            if self.step_timeout:
-                step_result = await asyncio.wait_for(
-                    step.execute(state.context),
-                    timeout=self.step_timeout
-                )
-            else:
-                step_result = await step.execute(state.context)
-            
-            # Mark as completed
-            result.result = step_result
-            result.status = StepStatus.COMPLETED
-            result.end_time = datetime.now()
-            
-            # Update state
-            state.completed_steps.add(step.step_id)
-            state.step_results[step.step_id] = result
-            
-            # Fire completion event
-            if self.on_step_complete:
-                self.on_step_complete(step, result, state)
-                
-        except asyncio.TimeoutError:
-            result.status = StepStatus.FAILED
-            result.error = f"Step timed out after {self.step_timeout} seconds"
-            result.end_time = datetime.now()
-            
-            state.failed_steps.add(step.step_id)
-            state.step_results[step.step_id] = result
-            
-            # Fire error event
-            if self.on_step_error:
-                self.on_step_error(step, TimeoutError(result.error), state)
-            
-            raise WorkflowEngineError(result.error)
-            
-        except Exception as e:
-            result.status = StepStatus.FAILED
-            result.error = str(e)
-            result.end_time = datetime.now()
-            
-            state.failed_steps.add(step.step_id)
-            state.step_results[step.step_id] = result
+        for step_id in execution_order:
+            step = workflow.steps[step_id]
             
-            # Fire error event
-            if self.on_step_error:
-                self.on_step_error(step, e, state)
+            # Steps downstream of a failed step never run
+            if not all(dep_id in state.satisfied_steps for dep_id in step.get_dependencies()):
+                continue
             
-            # Check if should retry
-            if self.enable_retries and self._should_retry_step(step, result):
-                return await self._retry_step(step, state, result)
+            if not step.should_execute(state.context):
+                # Skip step due to condition
+                self._mark_step_skipped(step_id, state)
+                continue
             
-            raise WorkflowEngineError(f"Step '{step.step_id}' failed: {str(e)}") from e
+            try:
+                await self._execute_step_with_timeout(step, state)
+            except WorkflowEngineError:
+                # Failure is recorded in state and reported below
+                continue
         
-        return result
+        self._check_all_steps_finished(state, execution_order)
     
-    def _should_retry_step(self, step: WorkflowStep, result: StepResult) -> bool:
-        """Check if a step should be retried.
+    def _check_all_steps_finished(
+        self,
+        state: WorkflowState,
+        execution_order: List[str]
+    ) -> None:
+        """Raise if any step failed or did not run.
         
         Args:
-            step: Step that failed
-            result: Step result
+            state: Current workflow state
+            execution_order: Step IDs in topological order
             
-        Returns:
-            True if step should be retried
+        Raises:
+            WorkflowEngineError: If a required step failed or did not complete
         """
-        retry_config = step.retry_config
-        if not retry_config:
-            return False
-        
-        max_retries = retry_config.get("max_retries", 0)
-        current_retries = result.metadata.get("retry_count", 0)
-        
-        return current_retries < max_retries
+        # The order is only scanned to name the offending step on failure
+        if state.failed_steps:
+            step_id = next(sid for sid in execution_order if sid in state.failed_steps)
+            raise WorkflowEngineError(f"Required step '{step_id}' failed")
+        
+        if len(state.satisfied_steps) < len(execution_order):
+            step_id = next(sid for sid in execution_order if sid not in state.satisfied_steps)
+            raise WorkflowEngineError(f"Required step '{step_id}' did not complete")
     
-    async def _retry_step(self, step: WorkflowStep, state: WorkflowState, failed_result: StepResult) -> StepResult:
-        """Retry a failed step.
+    async def _execute_step_with_timeout(self, step: WorkflowStep, state: WorkflowState) -> StepResult:
+        """Execute a single step with timeout handling and retries.
+        
+        Failed attempts are retried in a loop with exponential backoff
+        according to the step's ``retry_config`` (when retries are enabled).
+        A single ``StepResult`` is updated in place across attempts.
         
         Args:
-            step: Step to retry
+            step: Step to execute
             state: Current workflow state
-            failed_result: Previous failed result
             
         Returns:
-            New step result
+            Step execution result
+            
+        Raises:
+            WorkflowEngineError: If the step fails after all attempts
         """
-        retry_config = step.retry_config
-        retry_count = failed_result.metadata.get("retry_count", 0) + 1
+        state.current_step = step.step_id
+        
+        # Fire step start event
+        self.on_step_start(step, state)
         
-        # Wait before retry
+        # Read retry settings once per step
+        retry_config = step.retry_config
+        max_retries = retry_config.get("max_retries", 0) if self.enable_retries else 0
         retry_delay = retry_config.get("retry_delay", 1.0)
         backoff_multiplier = retry_config.get("backoff_multiplier", 2.0)
-        actual_delay = retry_delay * (backoff_multiplier ** (retry_count - 1))
-        
-        await asyncio.sleep(actual_delay)
         
-        # Create new result with retry metadata
+        # Create step result
+        start_mono, start_time = self._clock(state)
         result = StepResult(
             step_id=step.step_id,
             status=StepStatus.RUNNING,
-            start_time=datetime.now(),
-            metadata={"retry_count": retry_count, "previous_error": failed_result.error}
+            start_time=start_time,
+            start_mono=start_mono
         )
+        last_error: Exception = RuntimeError("Step was not executed")
         
-        try:
-            # Execute step again
-            if self.step_timeout:
-                step_result = await asyncio.wait_for(
-                    step.execute(state.context),
-                    timeout=self.step_timeout
-                )
-            else:
-                step_result = await step.execute(state.context)
+        for attempt in range(max_retries + 1):
+            if attempt:
+                # Wait before retry (exponential backoff)
+                await asyncio.sleep(retry_delay * (backoff_multiplier ** (attempt - 1)))
+                
+                result.metadata["retry_count"] = attempt
+                result.metadata["previous_error"] = result.error
+                result.status = StepStatus.RUNNING
+                result.error = None
+                result.start_mono, result.start_time = self._clock(state)
+                result.end_mono = result.end_time = None
+            
+            try:
+                # Execute step with timeout
+                if self.step_timeout:
+                    step_result = await asyncio.wait_for(
+                        step.execute(state.context),
+                        timeout=self.step_timeout
+                    )
+                else:
+                    step_result = await step.execute(state.context)
+            except Exception as e:
+                if self.step_timeout and isinstance(e, asyncio.TimeoutError):
+                    e = TimeoutError(f"Step timed out after {self.step_timeout} seconds")
+                last_error = e
+                
+                result.status = StepStatus.FAILED
+                result.error = str(e)
+                result.end_mono, result.end_time = self._clock(state)
+                
+                state.failed_steps.add(step.step_id)
+                state.step_results[step.step_id] = result
+                
+                # Fire error event
+                self.on_step_error(step, e, state)
+                continue
             
             # Mark as completed
             result.result = step_result
             result.status = StepStatus.COMPLETED
-            result.end_time = datetime.now()
+            result.end_mono, result.end_time = self._clock(state)
             
-            # Update state (remove from failed, add to completed)
+            # Update state (a successful retry clears the earlier failure)
             state.failed_steps.discard(step.step_id)
             state.completed_steps.add(step.step_id)
+            state.satisfied_steps.add(step.step_id)
             state.step_results[step.step_id] = result
             
-        except Exception as e:
-            result.status = StepStatus.FAILED
-            result.error = str(e)
-            result.end_time = datetime.now()
-            
-            state.step_results[step.step_id] = result
-            
-            # Check if should retry again
-            if self._should_retry_step(step, result):
-                return await self._retry_step(step, state, result)
-            
-            raise WorkflowEngineError(f"Step '{step.step_id}' failed after {retry_count} retries: {str(e)}") from e
+            # Fire completion event
+            self.on_step_complete(step, result, state)
+            return result
         
-        return result
+        if max_retries:
+            message = f"Step '{step.step_id}' failed after {max_retries} retries: {last_error}"
+        else:
+            message = f"Step '{step.step_id}' failed: {last_error}"
+        raise WorkflowEngineError(message) from last_error
     
     def _mark_step_skipped(self, step_id: str, state: WorkflowState) -> None:
         """Mark a step as skipped.
@@ -351,90 +366,93 @@ class WorkflowEngine:
             step_id: ID of the step to skip
             state: Current workflow state
         """
+        now_mono, now = self._clock(state)
         result = StepResult(
             step_id=step_id,
             status=StepStatus.SKIPPED,
-            start_time=datetime.now(),
-            end_time=datetime.now()
+            start_time=now,
+            end_time=now,
+            start_mono=now_mono,
+            end_mono=now_mono
         )
         state.step_results[step_id] = result
+        state.satisfied_steps.add(step_id)
+    
+    @staticmethod
+    def _clock(state: WorkflowState) -> Tuple[float, datetime]:
+        """Read the monotonic clock and derive the matching wall-clock time.
+        
+        Wall-clock time is derived from the workflow's start time plus the
+        monotonic offset, so the system clock is only read once per run.
+        
+        Args:
+            state: Current workflow state
+            
+        Returns:
+            Tuple of (monotonic seconds, wall-clock datetime)
+        """
+        now_mono = time.monotonic()
+        if state.start_time is None or state.start_mono is None:
+            return now_mono, datetime.now()
+        return now_mono, state.start_time + timedelta(seconds=now_mono - state.start_mono)
     
     def _check_for_ready_steps(
         self, 
-        workflow: Workflow, 
-        state: WorkflowState, 
+        dependents: Dict[str, List[str]],
         completed_step_id: str,
-        ready_steps: Set[str],
-        running_steps: Set[str]
+        ready_steps: Deque[str],
+        remaining_deps: Dict[str, int]
     ) -> None:
         """Check if any new steps are ready to execute after a step completes.
         
+        Only call this for steps that satisfy their dependents, i.e. steps
+        that completed or were skipped; failed steps do not.
+        
         Args:
-            workflow: Workflow being executed
-            state: Current workflow state
+            dependents: Reverse dependency map of the workflow
             completed_step_id: ID of the step that just completed
-            ready_steps: Set of steps ready to execute
-            running_steps: Set of steps currently running
+            ready_steps: Queue of steps ready to execute
+            remaining_deps: Number of unmet dependencies per step
         """
-        for step_id, step in workflow.steps.items():
-            # Skip if already processed
-            if (step_id in state.completed_steps or 
-                step_id in state.failed_steps or 
-                step_id in ready_steps or 
-                step_id in running_steps):
-                continue
-            
-            # Check if all dependencies are satisfied
-            dependencies_satisfied = all(
-                state.is_step_completed(dep_id) or 
-                (state.step_results.get(dep_id) and state.step_results.get(dep_id).status == StepStatus.SKIPPED)
-                for dep_id in step.get_dependencies()
-            )
-            
-            if dependencies_satisfied:
-                ready_steps.add(step_id)
+        for step_id in dependents.get(completed_step_id, ()):
+            remaining_deps[step_id] -= 1
+            if remaining_deps[step_id] == 0:
+                ready_steps.append(step_id)
     
     async def _wait_for_step_completion(
         self,
-        workflow: Workflow,
         state: WorkflowState,
-        ready_steps: Set[str],
-        running_steps: Set[str]
+        dependents: Dict[str, List[str]],
+        ready_steps: Deque[str],
+        running_tasks: Dict["asyncio.Task[StepResult]", str],
+        remaining_deps: Dict[str, int],
+        done_queue: "asyncio.Queue[asyncio.Task[StepResult]]"
     ) -> None:
-        """Wait for at least one running step to complete.
+        """Wait for a running step to complete.
+        
+        After the first completion, any other tasks that have already
+        finished are drained from the queue in the same pass.
         
         Args:
-            workflow: Workflow being executed
             state: Current workflow state
-            ready_steps: Set of steps ready to execute
-            running_steps: Set of steps currently running
+            dependents: Reverse dependency map of the workflow
+            ready_steps: Queue of steps ready to execute
+            running_tasks: Running step tasks mapped to their step IDs
+            remaining_deps: Number of unmet dependencies per step
+            done_queue: Queue that step tasks are put on when they finish
         """
-        # Get all running tasks
-        tasks = []
-        step_id_map = {}
-        
-        for step_id in list(running_steps):
-            task = state.context.metadata.get(f"task_{step_id}")
-            if task:
-                tasks.append(task)
-                step_id_map[task] = step_id
-        
-        if not tasks:
-            return
-        
-        # Wait for at least one task to complete
-        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-        
-        # Process completed tasks
-        for task in done:
-            step_id = step_id_map[task]
-            running_steps.discard(step_id)
-            
-            # Clean up task reference
-            state.context.metadata.pop(f"task_{step_id}", None)
+        task = await done_queue.get()
+        while True:
+            step_id = running_tasks.pop(task)
             
             # Check for newly ready steps
-            self._check_for_ready_steps(workflow, state, step_id, ready_steps, running_steps)
+            if step_id in state.satisfied_steps:
+                self._check_for_ready_steps(dependents, step_id, ready_steps, remaining_deps)
+            
+            try:
+                task = done_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
     
     def create_execution_plan(self, workflow: Workflow) -> Dict[str, Any]:
         """Create an execution plan for the workflow.
@@ -445,26 +463,10 @@ class WorkflowEngine:
         Returns:
             Dictionary containing execution plan details
         """
+        # Dependency levels and parallel groups are maintained by the workflow
         execution_order = workflow.get_execution_order()
-        
-        # Analyze dependencies and parallel opportunities
-        dependency_levels = {}
-        for step_id in execution_order:
-            step = workflow.get_step(step_id)
-            if not step or not step.get_dependencies():
-                dependency_levels[step_id] = 0
-            else:
-                max_dep_level = max(
-                    dependency_levels.get(dep_id, 0) for dep_id in step.get_dependencies()
-                )
-                dependency_levels[step_id] = max_dep_level + 1
-        
-        # Group steps by dependency level (can run in parallel)
-        parallel_groups = {}
-        for step_id, level in dependency_levels.items():
-            if level not in parallel_groups:
-                parallel_groups[level] = []
-            parallel_groups[level].append(step_id)
+        dependency_levels = workflow.get_dependency_levels()
+        parallel_groups = workflow.get_parallel_groups()
         
         return {
             "workflow_id": workflow.workflow_id,
@@ -1,11 +1,75 @@
 """Concrete workflow step implementations."""
 
 import asyncio
-from typing import Any, Dict, List, Optional, Callable, Union
+import atexit
+import hashlib
+import json
+import re
+import smtplib
+import threading
+import warnings
+from collections import ChainMap
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from ..core.runner import ToolRunner
 from .workflow import WorkflowStep, WorkflowContext, WorkflowStatus
 
 
+# A path token is either a bare key or a bracketed index/key
+_PATH_TOKEN_RE = re.compile(r'([^.\[\]]+)|\[([^\]]+)\]')
+
+# Template variables in EmailStep fields, e.g. "$user_name"
+_EMAIL_VAR_RE = re.compile(r'\$([A-Za-z_][A-Za-z0-9_]*)')
+
+# Pooled SMTP connections keyed by (server, port, username, password digest);
+# the digest is None for connections that never logged in
+_SMTPKey = Tuple[str, int, Optional[str], Optional[str]]
+_smtp_pool: Dict[_SMTPKey, smtplib.SMTP] = {}
+_smtp_locks: Dict[_SMTPKey, threading.Lock] = {}
+_smtp_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    """Parse a context path into a tuple of lookup steps.
+    
+    String steps are dictionary keys and integer steps are list indices,
+    e.g. ``"data.values[1]"`` becomes ``("data", "values", 1)``.
+    
+    Args:
+        path: Dot-notation or bracket-notation path
+        
+    Returns:
+        Tuple of lookup steps
+    """
+    steps: List[Union[str, int]] = []
+    for match in _PATH_TOKEN_RE.finditer(path):
+        key, index_or_key = match.groups()
+        if key is not None:
+            steps.append(key)
+        else:
+            try:
+                steps.append(int(index_or_key))
+            except ValueError:
+                steps.append(index_or_key)
+    
+    return tuple(steps)
+
+
 class ToolStep(WorkflowStep):
     """A workflow step that executes a Tomo tool."""
     
@@ -34,6 +98,19 @@ class ToolStep(WorkflowStep):
         self.output_key = output_key or step_id
         self.runner = runner
     
+    @property
+    def tool_inputs(self) -> Dict[str, Any]:
+        """Get the tool input template."""
+        return self._tool_inputs
+    
+    @tool_inputs.setter
+    def tool_inputs(self, value: Dict[str, Any]) -> None:
+        """Set the tool input template and pre-compute its reference slots."""
+        self._tool_inputs = value
+        self._ref_slots: List[Tuple[Tuple[Union[str, int], ...], str]] = []
+        for key, item in value.items():
+            self._scan_refs(item, (key,), self._ref_slots)
+    
     async def execute(self, context: WorkflowContext) -> Any:
         """Execute the tool."""
         if not self.runner:
@@ -59,40 +136,56 @@ class ToolStep(WorkflowStep):
         Returns:
             Resolved input dictionary
         """
-        resolved = {}
+        resolved = dict(self._tool_inputs)
+        if not self._ref_slots:
+            # Fast path: no context references anywhere in the inputs
+            return resolved
         
-        for key, value in self.tool_inputs.items():
-            resolved[key] = self._resolve_value(value, context)
+        # Copy only the containers on the way to a reference; literal
+        # subtrees are shared with the template.
+        copied = set()
+        for path, ref in self._ref_slots:
+            container = resolved
+            for key in path[:-1]:
+                child = container[key]
+                if id(child) not in copied:
+                    child = dict(child) if isinstance(child, dict) else list(child)
+                    copied.add(id(child))
+                    container[key] = child
+                container = child
+            container[path[-1]] = self._resolve_path(ref, context)
         
         return resolved
     
-    def _resolve_value(self, value: Any, context: WorkflowContext) -> Any:
-        """Recursively resolve a value from context.
+    @staticmethod
+    def _scan_refs(
+        value: Any,
+        path: Tuple[Union[str, int], ...],
+        slots: List[Tuple[Tuple[Union[str, int], ...], str]],
+    ) -> None:
+        """Collect the locations of context references within an input value.
+        
+        Uses an explicit stack so deeply nested inputs do not recurse.
         
         Args:
-            value: Value to resolve
-            context: Current workflow context
-            
-        Returns:
-            Resolved value
+            value: Input value to scan
+            path: Location of ``value`` within the inputs
+            slots: List receiving ``(path, reference_path)`` pairs
         """
-        if isinstance(value, str) and value.startswith("$"):
-            # Variable reference - handle nested properties and array access
-            var_path = value[1:]
-            return self._resolve_path(var_path, context)
-        elif isinstance(value, dict) and value.get("$context"):
-            # Context reference
-            context_key = value["$context"]
-            return self._resolve_path(context_key, context)
-        elif isinstance(value, dict):
-            # Recursively resolve dictionary values
-            return {k: self._resolve_value(v, context) for k, v in value.items()}
-        elif isinstance(value, list):
-            # Recursively resolve list values
-            return [self._resolve_value(item, context) for item in value]
-        else:
-            # Literal value
-            return value
+        stack = [(value, path)]
+        while stack:
+            node, node_path = stack.pop()
+            if isinstance(node, str) and node.startswith("$"):
+                slots.append((node_path, node[1:]))
+            elif isinstance(node, dict) and node.get("$context"):
+                slots.append((node_path, node["$context"]))
+            elif isinstance(node, dict):
+                # Push in reverse so slots are collected in input order
+                for k, v in reversed(node.items()):
+                    stack.append((v, node_path + (k,)))
+            elif isinstance(node, list):
+                for i in range(len(node) - 1, -1, -1):
+                    stack.append((node[i], node_path + (i,)))
     
     def _resolve_path(self, path: str, context: WorkflowContext) -> Any:
         """Resolve a dot-notation or bracket-notation path from context.
@@ -104,72 +197,24 @@ class ToolStep(WorkflowStep):
         Returns:
             Resolved value or None if path not found
         """
+        steps = _parse_path(path)
+        
         try:
             # Start with the full context data
             current = context.data
             
-            # Handle bracket notation for arrays first
-            import re
-            
-            # Split path by dots, but preserve bracket notation
-            parts = []
-            current_part = ""
-            bracket_depth = 0
-            
-            for char in path:
-                if char == '[':
-                    bracket_depth += 1
-                    current_part += char
-                elif char == ']':
-                    bracket_depth -= 1
-                    current_part += char
-                elif char == '.' and bracket_depth == 0:
-                    if current_part:
-                        parts.append(current_part)
-                        current_part = ""
-                else:
-                    current_part += char
-            
-            if current_part:
-                parts.append(current_part)
-            
             # Navigate through the path
-            for part in parts:
-                if '[' in part and ']' in part:
-                    # Handle array/dict access like "items[0]" or "data[key]"
-                    key_match = re.match(r'([^[]+)\[([^\]]+)\]', part)
-                    if key_match:
-                        base_key = key_match.group(1)
-                        index_or_key = key_match.group(2)
-                        
-                        # Get the base object
-                        if base_key:
-                            current = current.get(base_key) if isinstance(current, dict) else None
-                        
-                        if current is not None:
-                            # Try to parse index as integer for list access
-                            try:
-                                index = int(index_or_key)
-                                if isinstance(current, (list, tuple)) and 0 <= index < len(current):
-                                    current = current[index]
-                                else:
-                                    return None
-                            except ValueError:
-                                # Not an integer, try as string key for dict access
-                                if isinstance(current, dict):
-                                    current = current.get(index_or_key)
-                                else:
-                                    return None
-                        else:
-                            return None
+            for step in steps:
+                if isinstance(step, int):
+                    # List index access like "items[0]"
+                    if isinstance(current, (list, tuple)) and 0 <= step < len(current):
+                        current = current[step]
                     else:
                         return None
+                elif isinstance(current, (dict, ChainMap)):
+                    current = current.get(step)
                 else:
-                    # Regular key access
-                    if isinstance(current, dict):
-                        current = current.get(part)
-                    else:
-                        return None
+                    return None
                 
                 if current is None:
                     break
@@ -227,7 +272,14 @@ class ConditionStep(WorkflowStep):
 
 
 class ParallelStep(WorkflowStep):
-    """A workflow step that executes multiple steps in parallel."""
+    """A workflow step that executes multiple steps in parallel.
+    
+    A child step may list sibling step IDs in its ``depends_on``; such
+    children run in a later wave, once the siblings they depend on have
+    succeeded. Dependencies on steps outside the group are ignored here.
+    With ``wait_for_all=False`` only the first independent child to finish
+    is reported, and dependent children are reported as skipped.
+    """
     
     def __init__(
         self,
@@ -250,47 +302,112 @@ class ParallelStep(WorkflowStep):
     
     async def execute(self, context: WorkflowContext) -> Any:
         """Execute steps in parallel."""
-        # Create tasks for all parallel steps
-        tasks = []
-        for step in self.parallel_steps:
-            task = asyncio.create_task(step.execute(context))
-            tasks.append((step.step_id, task))
-        
         results = {}
         
+        sibling_deps = self._sibling_dependencies()
+        
         if self.wait_for_all:
-            # Wait for all tasks to complete
-            for step_id, task in tasks:
-                try:
-                    result = await task
-                    results[step_id] = {"success": True, "result": result}
-                except Exception as e:
-                    results[step_id] = {"success": False, "error": str(e)}
-        else:
-            # Wait for first completion
-            task_dict = {task: step_id for step_id, task in tasks}
-            done, pending = await asyncio.wait(
-                [task for _, task in tasks], 
-                return_when=asyncio.FIRST_COMPLETED
-            )
+            # Run children in waves of steps whose sibling dependencies are met
+            pending_steps = list(self.parallel_steps)
+            while pending_steps:
+                wave = []
+                waiting = []
+                for step in pending_steps:
+                    deps = sibling_deps[step.step_id]
+                    failed = [d for d in deps if d in results and not results[d]["success"]]
+                    if failed:
+                        results[step.step_id] = {
+                            "success": False,
+                            "error": RuntimeError(f"Skipped: dependency '{failed[0]}' failed"),
+                        }
+                    elif all(d in results for d in deps):
+                        wave.append(step)
+                    else:
+                        waiting.append(step)
+                
+                if not wave:
+                    if waiting:
+                        # Remaining children depend on each other
+                        for step in waiting:
+                            results[step.step_id] = {
+                                "success": False,
+                                "error": RuntimeError(
+                                    "Skipped: circular dependency between parallel steps"
+                                ),
+                            }
+                    break
+                
+                await self._run_wave(wave, context, results)
+                pending_steps = waiting
             
-            # Cancel pending tasks
-            for task in pending:
-                task.cancel()
+            # Report results in declaration order
+            results = {step.step_id: results[step.step_id] for step in self.parallel_steps}
+        else:
+            # Wait for first completion among children with no sibling dependencies
+            task_dict = {
+                asyncio.ensure_future(step.execute(context)): step.step_id
+                for step in self.parallel_steps
+                if not sibling_deps[step.step_id]
+            }
+            if task_dict:
+                done, pending = await asyncio.wait(
+                    task_dict,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                # Cancel pending tasks
+                for task in pending:
+                    task.cancel()
+                
+                # Get result from first completed task
+                for task in done:
+                    step_id = task_dict[task]
+                    try:
+                        results[step_id] = {"success": True, "result": task.result()}
+                    except Exception as e:
+                        results[step_id] = {"success": False, "error": e}
             
-            # Get result from first completed task
-            for task in done:
-                step_id = task_dict[task]
-                try:
-                    result = await task
-                    results[step_id] = {"success": True, "result": result}
-                except Exception as e:
-                    results[step_id] = {"success": False, "error": str(e)}
+            # Dependent children never get a later wave in this mode
+            for step in self.parallel_steps:
+                if sibling_deps[step.step_id]:
+                    results[step.step_id] = {
+                        "success": False,
+                        "error": RuntimeError(
+                            "Skipped: dependent steps do not run when wait_for_all is False"
+                        ),
+                    }
         
         # Store results in context
         context.set(f"{self.step_id}_results", results)
         
         return results
+    
+    def _sibling_dependencies(self) -> Dict[str, List[str]]:
+        """Map each child step ID to the sibling step IDs it depends on."""
+        sibling_ids = {step.step_id for step in self.parallel_steps}
+        return {
+            step.step_id: [d for d in step.get_dependencies() if d in sibling_ids]
+            for step in self.parallel_steps
+        }
+    
+    @staticmethod
+    async def _run_wave(
+        steps: List[WorkflowStep],
+        context: WorkflowContext,
+        results: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Execute steps concurrently, recording each outcome in ``results``."""
+        outcomes = await asyncio.gather(
+            *(step.execute(context) for step in steps),
+            return_exceptions=True
+        )
+        for step, outcome in zip(steps, outcomes):
+            if isinstance(outcome, Exception):
+                results[step.step_id] = {"success": False, "error": outcome}
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[step.step_id] = {"success": True, "result": outcome}
 
 
 class DataTransformStep(WorkflowStep):
@@ -302,6 +419,7 @@ class DataTransformStep(WorkflowStep):
         transform_func: Callable[[Any], Any],
         input_key: str,
         output_key: Optional[str] = None,
+        jit: bool = False,
         **kwargs
     ):
         """Initialize data transform step.
@@ -311,12 +429,27 @@ class DataTransformStep(WorkflowStep):
             transform_func: Function to transform the data
             input_key: Key to get input data from context
             output_key: Key to store output data (defaults to step_id)
+            jit: Compile a synchronous, numeric transform with Numba on first
+                use. Falls back to plain Python if Numba is not installed.
             **kwargs: Additional step configuration
         """
         super().__init__(step_id, **kwargs)
         self.transform_func = transform_func
         self.input_key = input_key
         self.output_key = output_key or step_id
+        self.jit = jit
+    
+    @property
+    def transform_func(self) -> Callable[[Any], Any]:
+        """Get the transform function."""
+        return self._transform_func
+    
+    @transform_func.setter
+    def transform_func(self, func: Callable[[Any], Any]) -> None:
+        """Set the transform function and cache how it is invoked."""
+        self._transform_func = func
+        self._is_async = asyncio.iscoroutinefunction(func)
+        self._compiled: Optional[Callable[[Any], Any]] = None
     
     async def execute(self, context: WorkflowContext) -> Any:
         """Execute data transformation."""
@@ -324,10 +457,15 @@ class DataTransformStep(WorkflowStep):
         input_data = context.get(self.input_key)
         
         # Transform data
-        if asyncio.iscoroutinefunction(self.transform_func):
-            result = await self.transform_func(input_data)
+        if self._is_async:
+            result = await self._transform_func(input_data)
+        elif self.jit:
+            if self._compiled is None:
+                self._compiled, result = _jit_first_call(self._transform_func, input_data)
+            else:
+                result = self._compiled(input_data)
         else:
-            result = self.transform_func(input_data)
+            result = self._transform_func(input_data)
         
         # Store result
         context.set(self.output_key, result)
@@ -345,6 +483,7 @@ class LoopStep(WorkflowStep):
         iteration_data_key: str,
         max_iterations: Optional[int] = None,
         break_condition: Optional[Callable[[WorkflowContext, int], bool]] = None,
+        concurrency: int = 1,
         **kwargs
     ):
         """Initialize loop step.
@@ -355,6 +494,9 @@ class LoopStep(WorkflowStep):
             iteration_data_key: Key for data to iterate over
             max_iterations: Maximum number of iterations
             break_condition: Function to check if loop should break
+            concurrency: Maximum number of iterations to run at once. Values
+                above 1 run each iteration in a forked context and require
+                iterations to be independent of each other.
             **kwargs: Additional step configuration
         """
         super().__init__(step_id, **kwargs)
@@ -362,10 +504,14 @@ class LoopStep(WorkflowStep):
         self.iteration_data_key = iteration_data_key
         self.max_iterations = max_iterations
         self.break_condition = break_condition
+        self.concurrency = concurrency
     
     async def execute(self, context: WorkflowContext) -> Any:
         """Execute loop."""
         iteration_data = context.get(self.iteration_data_key, [])
+        if self.concurrency > 1:
+            return await self._execute_concurrent(context, iteration_data)
+        
         results = []
         
         for i, item in enumerate(iteration_data):
@@ -386,7 +532,58 @@ class LoopStep(WorkflowStep):
                 result = await self.loop_step.execute(context)
                 results.append({"iteration": i, "success": True, "result": result})
             except Exception as e:
-                results.append({"iteration": i, "success": False, "error": str(e)})
+                results.append({"iteration": i, "success": False, "error": e})
+        
+        # Store results
+        context.set(f"{self.step_id}_results", results)
+        
+        return results
+    
+    async def _execute_concurrent(self, context: WorkflowContext, iteration_data: Any) -> Any:
+        """Execute independent iterations concurrently.
+        
+        The break condition is evaluated against the parent context before
+        any iteration starts. Each iteration runs in its own forked context;
+        values it writes are merged back into the parent in iteration order.
+        
+        Args:
+            context: Current workflow context
+            iteration_data: Items to iterate over
+            
+        Returns:
+            List of per-iteration results
+        """
+        items = []
+        for i, item in enumerate(iteration_data):
+            if self.max_iterations and i >= self.max_iterations:
+                break
+            if self.break_condition and self.break_condition(context, i):
+                break
+            items.append(item)
+        
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        # Iteration scratch keys live in each fork's top layer
+        async def run_iteration(i: int, item: Any) -> Tuple[WorkflowContext, Dict[str, Any]]:
+            async with semaphore:
+                local = context.fork()
+                local.set(f"{self.step_id}_current_item", item)
+                local.set(f"{self.step_id}_iteration", i)
+                try:
+                    result = await self.loop_step.execute(local)
+                    return local, {"iteration": i, "success": True, "result": result}
+                except Exception as e:
+                    return local, {"iteration": i, "success": False, "error": e}
+        
+        outcomes = await asyncio.gather(
+            *(run_iteration(i, item) for i, item in enumerate(items))
+        )
+        
+        results = []
+        for local, result in outcomes:
+            # Only the fork's own layer holds values written by the iteration
+            context.update(local.data.maps[0])
+            results.append(result)
         
         # Store results
         context.set(f"{self.step_id}_results", results)
@@ -420,7 +617,13 @@ class DelayStep(WorkflowStep):
 
 
 class ScriptStep(WorkflowStep):
-    """A workflow step that executes Python code."""
+    """A workflow step that executes Python code.
+    
+    The script is compiled once at construction time; each execution runs
+    the cached code object in a fresh namespace.
+    """
+    
+    _BASE_ENV: Dict[str, Any] = {"asyncio": asyncio}
     
     def __init__(
         self,
@@ -436,22 +639,27 @@ class ScriptStep(WorkflowStep):
             script: Python code to execute
             output_key: Key to store script result
             **kwargs: Additional step configuration
+            
+        Raises:
+            RuntimeError: If the script cannot be compiled
         """
         super().__init__(step_id, **kwargs)
         self.script = script
         self.output_key = output_key or step_id
+        
+        try:
+            self._code = compile(script, f"<ScriptStep:{step_id}>", "exec")
+        except (SyntaxError, ValueError) as e:
+            raise RuntimeError(f"Script compilation failed: {str(e)}") from e
     
     async def execute(self, context: WorkflowContext) -> Any:
         """Execute Python script."""
         # Create execution environment
-        env = {
-            "context": context,
-            "asyncio": asyncio,
-        }
+        env = {**self._BASE_ENV, "context": context}
         
         # Execute script
         try:
-            exec(self.script, env)
+            exec(self._code, env)
             result = env.get("result", "Script executed successfully")
         except Exception as e:
             raise RuntimeError(f"Script execution failed: {str(e)}") from e
@@ -463,7 +671,17 @@ class ScriptStep(WorkflowStep):
 
 
 class WebhookStep(WorkflowStep):
-    """A workflow step that makes HTTP requests."""
+    """A workflow step that makes HTTP requests.
+    
+    All webhook steps running on the same event loop share one
+    ``aiohttp.ClientSession`` so keep-alive connections are reused across
+    requests. The session is closed when ``asyncio.run()`` shuts its loop
+    down, or earlier by calling ``WebhookStep.close_session()``.
+    """
+    
+    connection_limit: int = 100
+    # One (session, closer task) pair per event loop
+    _sessions: Dict[asyncio.AbstractEventLoop, Tuple[Any, "asyncio.Task[None]"]] = {}
     
     def __init__(
         self,
@@ -495,9 +713,7 @@ class WebhookStep(WorkflowStep):
     
     async def execute(self, context: WorkflowContext) -> Any:
         """Execute HTTP request."""
-        try:
-            import aiohttp
-        except ImportError:
+        if aiohttp is None:
             raise ImportError("aiohttp is required for WebhookStep")
         
         # Resolve dynamic values
@@ -505,23 +721,26 @@ class WebhookStep(WorkflowStep):
         headers = {k: self._resolve_value(v, context) for k, v in self.headers.items()}
         data = self._resolve_value(self.data, context) if self.data else None
         
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method=self.method,
-                url=url,
-                headers=headers,
-                json=data if self.method in ["POST", "PUT", "PATCH"] else None
-            ) as response:
-                result = {
-                    "status": response.status,
-                    "headers": dict(response.headers),
-                    "data": await response.text()
-                }
-                
-                # Try to parse JSON if possible
+        session = self._get_session()
+        async with session.request(
+            method=self.method,
+            url=url,
+            headers=headers,
+            json=data if self.method in ["POST", "PUT", "PATCH"] else None
+        ) as response:
+            # Read the body once and decode/parse from the same bytes
+            raw = await response.read()
+            result = {
+                "status": response.status,
+                "headers": dict(response.headers),
+                "data": raw.decode(response.charset or "utf-8", errors="replace")
+            }
+            
+            # Try to parse JSON if possible
+            if "json" in response.content_type:
                 try:
-                    result["json"] = await response.json()
-                except:
+                    result["json"] = _json_loads(raw)
+                except ValueError:
                     pass
         
         # Store result
@@ -529,6 +748,48 @@ class WebhookStep(WorkflowStep):
         
         return result
     
+    @classmethod
+    def _get_session(cls) -> Any:
+        """Get the shared client session for the running event loop.
+        
+        Returns:
+            An open ``aiohttp.ClientSession`` bound to the current loop
+        """
+        loop = asyncio.get_running_loop()
+        entry = cls._sessions.get(loop)
+        if entry is None or entry[0].closed:
+            # Sessions of closed loops were closed by their closer tasks
+            for old_loop in [l for l in cls._sessions if l.is_closed()]:
+                del cls._sessions[old_loop]
+            
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=cls.connection_limit)
+            )
+            closer = loop.create_task(cls._close_on_cancel(session))
+            entry = cls._sessions[loop] = (session, closer)
+        return entry[0]
+    
+    @staticmethod
+    async def _close_on_cancel(session: Any) -> None:
+        """Close a session once this task is cancelled.
+        
+        ``asyncio.run()`` cancels leftover tasks before closing its loop, so
+        each loop's session is closed on that loop.
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await session.close()
+    
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the running event loop's shared client session, if open."""
+        entry = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            session, closer = entry
+            closer.cancel()
+            await session.close()
+    
     def _resolve_value(self, value: Any, context: WorkflowContext) -> Any:
         """Resolve dynamic values from context."""
         if isinstance(value, str) and value.startswith("$"):
@@ -573,10 +834,6 @@ class EmailStep(WorkflowStep):
     
     async def execute(self, context: WorkflowContext) -> Any:
         """Send email."""
-        import smtplib
-        from email.mime.text import MIMEText
-        from email.mime.multipart import MIMEMultipart
-        
         # Resolve dynamic values
         to_email = self._resolve_value(self.to_email, context)
         subject = self._resolve_value(self.subject, context)
@@ -590,33 +847,182 @@ class EmailStep(WorkflowStep):
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
         
-        # Send email
+        # Send email without blocking the event loop
+        await asyncio.to_thread(self._send_message, msg)
+        
+        result = f"Email sent to {to_email}"
+        context.set(f"{self.step_id}_result", result)
+        
+        return result
+    
+    def _send_message(self, msg: MIMEMultipart) -> None:
+        """Send a message over a pooled SMTP connection.
+        
+        Connections are shared only between steps with the same server,
+        port and credentials, and checked with ``NOOP`` before reuse; a dead
+        connection is replaced.
+        
+        Args:
+            msg: Message to send
+        """
         smtp_server = self.smtp_config.get("server", "localhost")
         smtp_port = self.smtp_config.get("port", 587)
         username = self.smtp_config.get("username")
         password = self.smtp_config.get("password")
+        login = bool(username and password)
+        # Never hand an authenticated connection to a step with other credentials
+        password_digest = hashlib.sha256(password.encode()).hexdigest() if login else None
+        key = (smtp_server, smtp_port, username, password_digest)
         
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            if username and password:
-                server.starttls()
-                server.login(username, password)
-            
-            server.send_message(msg)
-        
-        result = f"Email sent to {to_email}"
-        context.set(f"{self.step_id}_result", result)
+        with _smtp_pool_lock:
+            lock = _smtp_locks.setdefault(key, threading.Lock())
         
-        return result
+        with lock:
+            server = _smtp_pool.get(key)
+            if server is not None:
+                try:
+                    if server.noop()[0] != 250:
+                        raise smtplib.SMTPServerDisconnected("NOOP failed")
+                except (smtplib.SMTPException, OSError):
+                    _close_smtp(server)
+                    server = None
+            
+            if server is None:
+                server = smtplib.SMTP(smtp_server, smtp_port)
+                try:
+                    if login:
+                        server.starttls()
+                        server.login(username, password)
+                except Exception:
+                    _close_smtp(server)
+                    raise
+                _smtp_pool[key] = server
+            
+            try:
+                server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                _smtp_pool.pop(key, None)
+                _close_smtp(server)
+                raise
     
     def _resolve_value(self, value: Any, context: WorkflowContext) -> Any:
         """Resolve dynamic values from context."""
         if isinstance(value, str) and "$" in value:
-            # Simple template substitution
-            for key, val in context.data.items():
-                value = value.replace(f"${key}", str(val))
+            # Simple template substitution; unknown variables are left as-is
+            data = context.data
+            return _EMAIL_VAR_RE.sub(
+                lambda m: str(data[m.group(1)]) if m.group(1) in data else m.group(0),
+                value
+            )
         return value
 
 
+def _upper_transform(data: Any) -> Any:
+    """Convert data to an upper-case string."""
+    return str(data).upper()
+
+
+def _lower_transform(data: Any) -> Any:
+    """Convert data to a lower-case string."""
+    return str(data).lower()
+
+
+def _length_transform(data: Any) -> Any:
+    """Get the length of data, or 0 if it has none."""
+    return len(data) if hasattr(data, "__len__") else 0
+
+
+def _json_transform(data: Any) -> Any:
+    """Parse data as JSON."""
+    return json.loads(data if isinstance(data, (str, bytes)) else str(data))
+
+
+def _identity_transform(data: Any) -> Any:
+    """Return data unchanged."""
+    return data
+
+
+_BUILTIN_TRANSFORMS: Dict[str, Callable[[Any], Any]] = {
+    "upper": _upper_transform,
+    "lower": _lower_transform,
+    "length": _length_transform,
+    "json": _json_transform,
+}
+
+
+def _jit_first_call(func: Callable[[Any], Any], data: Any) -> Tuple[Callable[[Any], Any], Any]:
+    """Compile a function with Numba, if available, and call it once.
+    
+    Numba compiles on the first call, so compilation failures (e.g. a
+    transform using unsupported types) surface here and fall back to
+    running ``func`` in plain Python.
+    
+    Args:
+        func: Synchronous function to compile
+        data: Argument for the first call
+        
+    Returns:
+        The callable to use for later calls, and the first call's result
+    """
+    try:
+        import numba  # type: ignore
+    except ImportError:
+        warnings.warn(
+            "Numba unavailable; running transform in pure Python", RuntimeWarning
+        )
+        return func, func(data)
+    
+    try:
+        compiled = numba.njit(cache=True)(func)
+        return compiled, compiled(data)
+    except (numba.core.errors.NumbaError, RuntimeError) as e:
+        # RuntimeError covers functions Numba cannot cache, e.g. from exec()
+        warnings.warn(
+            f"Numba could not compile transform ({e.__class__.__name__}); "
+            "running in pure Python",
+            RuntimeWarning
+        )
+        return func, func(data)
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors."""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def close_smtp_connections() -> None:
+    """Close all pooled EmailStep SMTP connections."""
+    with _smtp_pool_lock:
+        servers = list(_smtp_pool.values())
+        _smtp_pool.clear()
+    
+    for server in servers:
+        _close_smtp(server)
+
+
+atexit.register(close_smtp_connections)
+
+
+def error_message(result: Dict[str, Any]) -> Optional[str]:
+    """Get the error message from a ParallelStep or LoopStep result entry.
+    
+    Failed entries hold the raised exception under ``"error"``; it is only
+    formatted when a message is actually needed.
+    
+    Args:
+        result: A single result entry
+        
+    Returns:
+        Error message, or None if the entry succeeded
+    """
+    if result["success"]:
+        return None
+    return str(result["error"])
+
+
 # Utility functions for creating common step patterns
 
 def create_tool_step(
@@ -643,12 +1049,37 @@ def create_condition_step(
     false_step: Optional[WorkflowStep] = None,
     **kwargs
 ) -> ConditionStep:
-    """Create a condition step with string condition support."""
-    if isinstance(condition, str):
-        # Simple string condition evaluation
+    """Create a condition step with string condition support.
+    
+    A string condition is either a context key, tested for truthiness, or a
+    Python expression such as ``"count > 3 and items[0]['active']"``
+    evaluated against the context data without builtins. Strings naming an
+    existing context key, including keys like ``"fetch-data"``, are looked
+    up rather than evaluated. Expressions are compiled once here.
+    """
+    if isinstance(condition, str) and condition.isidentifier():
+        # Simple truthiness of a context value
+        key = condition
+        
+        def condition_func(context: WorkflowContext) -> bool:
+            return bool(context.get(key))
+        condition = condition_func
+    elif isinstance(condition, str):
+        key = condition
+        try:
+            code = compile(condition, f"<cond:{step_id}>", "eval")
+        except SyntaxError:
+            # Only usable as a context key
+            code = None
+        
         def condition_func(context: WorkflowContext) -> bool:
-            # Basic evaluation - can be enhanced
-            return bool(context.get(condition))
+            if key in context.data or code is None:
+                return bool(context.get(key))
+            try:
+                return bool(eval(code, {"__builtins__": {}}, context.data))
+            except NameError:
+                # e.g. "fetch-data" before that key has been set
+                return False
         condition = condition_func
     
     return ConditionStep(
@@ -669,20 +1100,8 @@ def create_transform_step(
 ) -> DataTransformStep:
     """Create a data transform step with string transform support."""
     if isinstance(transform, str):
-        # Simple string-based transformation
-        def transform_func(data: Any) -> Any:
-            if transform == "upper":
-                return str(data).upper()
-            elif transform == "lower":
-                return str(data).lower()
-            elif transform == "length":
-                return len(data) if hasattr(data, "__len__") else 0
-            elif transform == "json":
-                import json
-                return json.loads(str(data))
-            else:
-                return data
-        transform = transform_func
+        # Simple string-based transformation, resolved once here
+        transform = _BUILTIN_TRANSFORMS.get(transform, _identity_transform)
     
     return DataTransformStep(
         step_id=step_id,
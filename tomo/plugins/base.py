@@ -1,7 +1,11 @@
 """Base plugin infrastructure for Tomo."""
 
+import importlib.util
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Type, TYPE_CHECKING
+from collections import defaultdict
+from functools import cached_property, lru_cache, partial
+from typing import Dict, Any, Iterator, List, Tuple, Type, TYPE_CHECKING
 from enum import Enum
 
 if TYPE_CHECKING:
@@ -18,6 +22,27 @@ class PluginType(Enum):
     TRANSFORMER = "transformer"
 
 
+# Plugin type values by member, avoiding the enum ``value`` descriptor
+_PT_VALUE: Dict[PluginType, str] = {pt: pt.value for pt in PluginType}
+
+
+# Plugin classes by defining module, recorded at class creation
+_PLUGIN_CLASSES_BY_MODULE: Dict[str, List["weakref.ref[Type[BasePlugin]]"]] = defaultdict(list)
+
+
+def _forget_plugin_class(module_name: str, ref: "weakref.ref[Type[BasePlugin]]") -> None:
+    """Drop a collected class reference, and its module entry once empty."""
+    refs = _PLUGIN_CLASSES_BY_MODULE.get(module_name)
+    if refs is None:
+        return
+    try:
+        refs.remove(ref)
+    except ValueError:
+        pass
+    if not refs:
+        _PLUGIN_CLASSES_BY_MODULE.pop(module_name, None)
+
+
 class BasePlugin(ABC):
     """Base class for all Tomo plugins.
     
@@ -25,6 +50,13 @@ class BasePlugin(ABC):
     like tools, adapters, workflow steps, servers, etc.
     """
     
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record the subclass under its module for plugin discovery."""
+        super().__init_subclass__(**kwargs)
+        _PLUGIN_CLASSES_BY_MODULE[cls.__module__].append(
+            weakref.ref(cls, partial(_forget_plugin_class, cls.__module__))
+        )
+    
     @property
     @abstractmethod
     def plugin_type(self) -> PluginType:
@@ -87,15 +119,7 @@ class BasePlugin(ABC):
         Returns:
             List of missing dependencies (empty if all satisfied)
         """
-        missing_deps = []
-        
-        for dep in self.dependencies:
-            try:
-                __import__(dep)
-            except ImportError:
-                missing_deps.append(dep)
-        
-        return missing_deps
+        return list(_find_missing_modules(tuple(self.dependencies)))
     
     def get_info(self) -> Dict[str, Any]:
         """Get plugin information as a dictionary.
@@ -103,19 +127,75 @@ class BasePlugin(ABC):
         Returns:
             Dictionary containing plugin metadata
         """
+        info = dict(self._info)
+        info["dependencies"] = list(info["dependencies"])
+        return info
+    
+    @cached_property
+    def _info(self) -> Dict[str, Any]:
+        """Plugin metadata, computed once per instance."""
         return {
             "name": self.name,
             "version": self.version,
-            "type": self.plugin_type.value,
+            "type": _PT_VALUE[self.plugin_type],
             "description": self.description,
             "author": self.author,
             "homepage": self.homepage,
             "dependencies": self.dependencies,
         }
     
+    @cached_property
+    def _repr(self) -> str:
+        """String representation, computed once per instance."""
+        return f"{self.__class__.__name__}(name='{self.name}', version='{self.version}', type='{_PT_VALUE[self.plugin_type]}')"
+    
     def __repr__(self) -> str:
         """String representation of the plugin."""
-        return f"{self.__class__.__name__}(name='{self.name}', version='{self.version}', type='{self.plugin_type.value}')"
+        return self._repr
+
+
+@lru_cache(maxsize=256)
+def _find_missing_modules(modules: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Find modules that cannot be located, without importing them.
+    
+    Args:
+        modules: Module names to check
+        
+    Returns:
+        Names of the modules that are not available
+    """
+    missing = []
+    
+    for module in modules:
+        try:
+            if importlib.util.find_spec(module) is None:
+                missing.append(module)
+        except (ImportError, ValueError):
+            missing.append(module)
+    
+    return tuple(missing)
+
+
+def iter_module_plugin_classes(module_name: str) -> Iterator[Type[BasePlugin]]:
+    """Iterate over plugin classes defined in a module or its submodules.
+    
+    Only classes marked with ``_is_tomo_plugin`` (see :func:`plugin`) are
+    yielded, in definition order per module.
+    
+    Args:
+        module_name: Fully qualified module name
+        
+    Yields:
+        Marked plugin classes
+    """
+    prefix = module_name + "."
+    for name, refs in list(_PLUGIN_CLASSES_BY_MODULE.items()):
+        if name != module_name and not name.startswith(prefix):
+            continue
+        for ref in list(refs):
+            cls = ref()
+            if cls is not None and getattr(cls, "_is_tomo_plugin", False):
+                yield cls
 
 
 def plugin(plugin_type: PluginType, name: str, version: str = "1.0.0"):
@@ -1,21 +1,66 @@
 """Plugin loader for discovering and loading plugins from various sources."""
 
 import os
+import stat
 import sys
 import json
+import time
 import importlib
 import importlib.util
+import itertools
+import py_compile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from types import MappingProxyType, ModuleType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
 from .registry import PluginRegistry, PluginRegistryError
 from .base import BasePlugin
 
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+_MISSING = object()
+
+# Suffix for plugin module names; unique across loaders within the process
+_module_counter = itertools.count()
+
 
 class PluginLoaderError(Exception):
     """Exception raised by plugin loader operations."""
     pass
 
 
+def _load_package_source(loader: "PluginLoader", source: str, config: Dict[str, Any]) -> Tuple[int, str]:
+    """Load a package source entry from a plugin configuration file."""
+    return loader.load_from_package(source, config), f"package:{source}"
+
+
+def _load_directory_source(
+    loader: "PluginLoader", source: Dict[str, Any], config: Dict[str, Any]
+) -> Tuple[int, str]:
+    """Load a directory source entry from a plugin configuration file."""
+    directory = source.get("directory", _MISSING)
+    if directory is _MISSING:
+        raise PluginLoaderError(f"Invalid plugin source configuration: {source}")
+    
+    discovered = loader._load_from_directory_impl(
+        str(Path(directory)), loader._stat_directory(directory), config
+    )
+    return discovered, f"directory:{directory}"
+
+
+# Config source handlers keyed by the JSON type of the "source" field
+_SOURCE_HANDLERS = {
+    str: _load_package_source,
+    dict: _load_directory_source,
+}
+
+
 class PluginLoader:
     """Loads and manages plugins from various sources.
     
@@ -25,6 +70,14 @@ class PluginLoader:
     - Configuration files specifying plugins to load
     """
     
+    __slots__ = (
+        "registry",
+        "_loaded_modules",
+        "_load_history",
+        "_formatted_history",
+        "_dir_cache",
+    )
+    
     def __init__(self, registry: Optional[PluginRegistry] = None):
         """Initialize the plugin loader.
         
@@ -34,6 +87,9 @@ class PluginLoader:
         self.registry = registry or PluginRegistry()
         self._loaded_modules: Dict[str, Any] = {}
         self._load_history: List[Dict[str, Any]] = []
+        # Copies of history records with formatted timestamps, filled on read
+        self._formatted_history: List[Optional[Dict[str, Any]]] = []
+        self._dir_cache: Dict[str, Tuple[int, List[Tuple[str, ModuleType]]]] = {}
     
     def load_from_package(self, package_name: str, config: Dict[str, Any] = None) -> int:
         """Load plugins from an installed Python package.
@@ -50,14 +106,8 @@ class PluginLoader:
         """
         try:
             module = importlib.import_module(package_name)
-            discovered = self.registry.auto_discover_plugins(module)
+            discovered = self.registry.auto_discover_plugins(module, config)
             
-            # Apply config to newly discovered plugins if provided
-            if config and discovered > 0:
-                # Get plugins that were just added
-                current_plugins = set(self.registry.list_plugins())
-                # This is a simplified approach - in practice you'd track which plugins were just added
-                
             self._record_load_operation("package", package_name, discovered, config)
             return discovered
             
@@ -66,12 +116,16 @@ class PluginLoader:
         except Exception as e:
             raise PluginLoaderError(f"Error loading plugins from package '{package_name}': {str(e)}") from e
     
-    def load_from_directory(self, directory: Union[str, Path], config: Dict[str, Any] = None) -> int:
+    def load_from_directory(
+        self, directory: Union[str, Path], config: Dict[str, Any] = None, warmup: bool = False
+    ) -> int:
         """Load plugins from a directory containing Python files.
         
         Args:
             directory: Directory path to scan for plugin files
             config: Configuration to pass to discovered plugins
+            warmup: Byte-compile the plugin files into ``__pycache__`` before
+                executing them, so later loads skip parsing
             
         Returns:
             Number of plugins loaded
@@ -80,50 +134,170 @@ class PluginLoader:
             PluginLoaderError: If directory loading fails
         """
         directory = Path(directory)
+        return self._load_from_directory_impl(
+            str(directory), self._stat_directory(directory), config, warmup
+        )
+    
+    @classmethod
+    def prewarm_directory(cls, directory: Union[str, Path]) -> int:
+        """Byte-compile the plugin files in a directory without loading them.
+        
+        Args:
+            directory: Directory path to scan for plugin files
+            
+        Returns:
+            Number of plugin files compiled successfully
+            
+        Raises:
+            PluginLoaderError: If the directory does not exist
+        """
+        cls._stat_directory(directory)
+        file_paths = [file_path for _, file_path in cls._scan_plugin_files(directory)]
+        return sum(cls._compile_plugin_files(file_paths))
+    
+    @staticmethod
+    def _scan_plugin_files(directory: Union[str, Path]) -> List[Tuple[str, str]]:
+        """List the plugin files in a directory.
+        
+        Args:
+            directory: Directory path to scan
+            
+        Returns:
+            Sorted ``(stem, path)`` pairs of public Python files
+        """
+        # scandir reuses directory entry types instead of stat-ing each path
+        with os.scandir(directory) as entries:
+            return sorted(
+                (entry.name[:-3], entry.path) for entry in entries
+                if entry.name.endswith(".py")
+                and not entry.name.startswith("_")  # Skip private files
+                and entry.is_file()
+            )
+    
+    @staticmethod
+    def _compile_plugin_files(file_paths: List[str]) -> List[bool]:
+        """Write ``__pycache__`` entries for plugin files.
+        
+        Compile errors are not reported here; they surface when the file is
+        executed.
+        
+        Args:
+            file_paths: Paths of the plugin files
+            
+        Returns:
+            Whether each file was compiled
+        """
+        def compile_file(file_path: str) -> bool:
+            return py_compile.compile(file_path, doraise=False, quiet=2) is not None
+        
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                return list(executor.map(compile_file, file_paths))
+        return list(map(compile_file, file_paths))
+    
+    @staticmethod
+    def _stat_directory(directory: Union[str, Path]) -> os.stat_result:
+        """Stat a plugin directory, checking that it exists and is a directory.
         
-        if not directory.exists():
-            raise PluginLoaderError(f"Directory '{directory}' does not exist")
+        Args:
+            directory: Directory path to check
+            
+        Returns:
+            Stat result of the directory
+            
+        Raises:
+            PluginLoaderError: If the path is missing or not a directory
+        """
+        try:
+            st = os.stat(directory)
+        except OSError:
+            raise PluginLoaderError(f"Directory '{directory}' does not exist") from None
         
-        if not directory.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise PluginLoaderError(f"Path '{directory}' is not a directory")
         
+        return st
+    
+    def _load_from_directory_impl(
+        self, directory: str, st: os.stat_result, config: Dict[str, Any] = None, warmup: bool = False
+    ) -> int:
+        """Load plugins from a directory that has already been stat-ed.
+        
+        Args:
+            directory: Directory path to scan for plugin files
+            st: Stat result of the directory, used for the scan cache
+            config: Configuration to pass to discovered plugins
+            warmup: Byte-compile the plugin files before executing them
+            
+        Returns:
+            Number of plugins loaded
+            
+        Raises:
+            PluginLoaderError: If directory loading fails
+        """
         discovered = 0
         loaded_files = []
         
+        # Reuse modules from an earlier scan while the directory is unchanged
+        cache_key = os.path.realpath(directory)
+        mtime_ns = st.st_mtime_ns
+        cached = self._dir_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            for file_path, module in cached[1]:
+                discovered += self.registry.auto_discover_plugins(module, config)
+                loaded_files.append(file_path)
+            self._record_load_operation(
+                "directory", directory, discovered, config, {"files": loaded_files, "cached": True}
+            )
+            return discovered
+        
+        loaded_modules = []
+        
         try:
-            # Scan for Python files
-            for file_path in directory.glob("*.py"):
-                if file_path.name.startswith("_"):
-                    continue  # Skip private files
+            candidates = self._scan_plugin_files(directory)
+            file_paths = [file_path for _, file_path in candidates]
+            if warmup:
+                self._compile_plugin_files(file_paths)
+            
+            # Create all modules up front and publish them to sys.modules in
+            # one update; each must be registered before it executes so that
+            # imports inside plugin files work
+            modules = [
+                self._create_plugin_module(f"tomo_plugin_{stem}_{next(_module_counter)}", file_path)
+                for stem, file_path in candidates
+            ]
+            sys.modules.update({module.__name__: module for module in modules if module is not None})
+            
+            # Execute plugin files concurrently; their loading is dominated by
+            # file reads and imports. Registration stays in this thread.
+            if len(candidates) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                    errors = list(executor.map(self._try_exec_plugin_module, modules))
+            else:
+                errors = list(map(self._try_exec_plugin_module, modules))
+            
+            for i, (file_path, module, error) in enumerate(zip(file_paths, modules, errors)):
+                if error is not None:
+                    # Drop modules of files after the failing one; they are not registered
+                    for later in modules[i + 1:]:
+                        if later is not None:
+                            sys.modules.pop(later.__name__, None)
+                    raise PluginLoaderError(f"Error executing plugin file '{file_path}': {str(error)}") from error
+                
+                if module is None:
+                    continue
                 
-                # Load module from file
-                module_name = f"plugin_{file_path.stem}_{id(file_path)}"
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
+                # Store reference to loaded module
+                self._loaded_modules[file_path] = module
                 
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    
-                    # Add to sys.modules to make imports work
-                    sys.modules[module_name] = module
-                    
-                    try:
-                        spec.loader.exec_module(module)
-                        
-                        # Store reference to loaded module
-                        self._loaded_modules[str(file_path)] = module
-                        
-                        # Discover plugins in module
-                        file_discovered = self.registry.auto_discover_plugins(module)
-                        discovered += file_discovered
-                        loaded_files.append(str(file_path))
-                        
-                    except Exception as e:
-                        # Clean up on failure
-                        if module_name in sys.modules:
-                            del sys.modules[module_name]
-                        raise PluginLoaderError(f"Error executing plugin file '{file_path}': {str(e)}") from e
-            
-            self._record_load_operation("directory", str(directory), discovered, config, {"files": loaded_files})
+                # Discover plugins in module
+                file_discovered = self.registry.auto_discover_plugins(module, config)
+                discovered += file_discovered
+                loaded_files.append(file_path)
+                loaded_modules.append((file_path, module))
+            
+            self._dir_cache[cache_key] = (mtime_ns, loaded_modules)
+            self._record_load_operation("directory", directory, discovered, config, {"files": loaded_files})
             return discovered
             
         except Exception as e:
@@ -131,6 +305,44 @@ class PluginLoader:
                 raise PluginLoaderError(f"Error loading plugins from directory '{directory}': {str(e)}") from e
             raise
     
+    @staticmethod
+    def _create_plugin_module(module_name: str, file_path: str) -> Optional[ModuleType]:
+        """Create an unexecuted module for a plugin file.
+        
+        Args:
+            module_name: Name to give the module in ``sys.modules``
+            file_path: Path of the plugin file
+            
+        Returns:
+            The new module, or None if no loader is available for the file
+        """
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if not (spec and spec.loader):
+            return None
+        return importlib.util.module_from_spec(spec)
+    
+    @staticmethod
+    def _try_exec_plugin_module(module: Optional[ModuleType]) -> Optional[Exception]:
+        """Execute a plugin module already registered in ``sys.modules``.
+        
+        Args:
+            module: Module created by ``_create_plugin_module``, or None
+            
+        Returns:
+            The exception raised while executing the module, if any
+        """
+        if module is None:
+            return None
+        
+        try:
+            module.__spec__.loader.exec_module(module)
+        except Exception as e:
+            # Clean up on failure
+            sys.modules.pop(module.__name__, None)
+            return e
+        
+        return None
+    
     def load_from_config(self, config_file: Union[str, Path]) -> int:
         """Load plugins defined in a configuration file.
         
@@ -160,8 +372,7 @@ class PluginLoader:
             raise PluginLoaderError(f"Configuration file '{config_file}' does not exist")
         
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = _json_loads(config_file.read_bytes())
             
             total_discovered = 0
             loaded_sources = []
@@ -173,20 +384,12 @@ class PluginLoader:
                 source = plugin_config.get("source")
                 plugin_specific_config = plugin_config.get("config", {})
                 
-                if isinstance(source, str):
-                    # Package source
-                    discovered = self.load_from_package(source, plugin_specific_config)
-                    loaded_sources.append(f"package:{source}")
-                    
-                elif isinstance(source, dict) and "directory" in source:
-                    # Directory source
-                    directory = source["directory"]
-                    discovered = self.load_from_directory(directory, plugin_specific_config)
-                    loaded_sources.append(f"directory:{directory}")
-                    
-                else:
+                handler = _SOURCE_HANDLERS.get(type(source))
+                if handler is None:
                     raise PluginLoaderError(f"Invalid plugin source configuration: {source}")
                 
+                discovered, label = handler(self, source, plugin_specific_config)
+                loaded_sources.append(label)
                 total_discovered += discovered
             
             self._record_load_operation("config", str(config_file), total_discovered, None, {"sources": loaded_sources})
@@ -216,21 +419,56 @@ class PluginLoader:
             return True
         return False
     
-    def get_load_history(self) -> List[Dict[str, Any]]:
+    def invalidate_cache(self, directory: Optional[Union[str, Path]] = None) -> None:
+        """Forget cached directory scans so the next load re-executes files.
+        
+        Directory scans are cached until the directory's modification time
+        changes, which does not happen when a file is edited in place.
+        
+        Args:
+            directory: Directory to invalidate (all directories if None)
+        """
+        if directory is None:
+            self._dir_cache.clear()
+        else:
+            self._dir_cache.pop(os.path.realpath(directory), None)
+    
+    def get_load_history(self, since: int = 0) -> List[Dict[str, Any]]:
         """Get the history of plugin loading operations.
         
+        Args:
+            since: Index of the first record to return, so callers can tail
+                the history incrementally
+        
         Returns:
             List of load operation records
         """
-        return self._load_history.copy()
+        history = self._load_history
+        formatted = self._formatted_history
+        formatted.extend([None] * (len(history) - len(formatted)))
+        
+        # Timestamps are formatted once, and only for requested records
+        records = []
+        for i in range(len(history))[since:]:
+            if formatted[i] is None:
+                record = history[i]
+                formatted[i] = {**record, "timestamp": self._format_timestamp(record["timestamp"])}
+            records.append(dict(formatted[i]))
+        
+        return records
+    
+    @staticmethod
+    def _format_timestamp(timestamp_ns: int) -> str:
+        """Format a nanosecond epoch timestamp as an ISO 8601 string."""
+        return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
     
-    def get_loaded_modules(self) -> Dict[str, Any]:
+    def get_loaded_modules(self) -> Mapping[str, Any]:
         """Get all modules loaded by this loader.
         
         Returns:
-            Dictionary mapping file paths to loaded modules
+            Read-only live view mapping file paths to loaded modules
         """
-        return self._loaded_modules.copy()
+        return MappingProxyType(self._loaded_modules)
     
     def validate_config_file(self, config_file: Union[str, Path]) -> List[str]:
         """Validate a plugin configuration file without loading.
@@ -249,8 +487,7 @@ class PluginLoader:
             return errors
         
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = _json_loads(config_file.read_bytes())
             
             if not isinstance(config, dict):
                 errors.append("Configuration must be a JSON object")
@@ -265,27 +502,28 @@ class PluginLoader:
                 errors.append("'plugins' must be an array")
                 return errors
             
+            # Checks are inlined with a bound append; this runs once per entry
+            append = errors.append
             for i, plugin_config in enumerate(plugins):
                 if not isinstance(plugin_config, dict):
-                    errors.append(f"Plugin config {i} must be an object")
+                    append(f"Plugin config {i} must be an object")
                     continue
                 
                 source = plugin_config.get("source")
                 if source is None:
-                    errors.append(f"Plugin config {i} missing required 'source' field")
+                    append(f"Plugin config {i} missing required 'source' field")
                 elif isinstance(source, str):
                     # Package source - could validate package exists
                     pass
                 elif isinstance(source, dict):
-                    if "directory" not in source:
-                        errors.append(f"Plugin config {i} directory source missing 'directory' field")
-                    else:
-                        directory = Path(source["directory"])
-                        if not directory.exists():
-                            errors.append(f"Plugin config {i} directory '{directory}' does not exist")
+                    directory = source.get("directory", _MISSING)
+                    if directory is _MISSING:
+                        append(f"Plugin config {i} directory source missing 'directory' field")
+                    elif not os.path.exists(directory):
+                        append(f"Plugin config {i} directory '{Path(directory)}' does not exist")
                 else:
-                    errors.append(f"Plugin config {i} 'source' must be string or object")
-                
+                    append(f"Plugin config {i} 'source' must be string or object")
+            
         except json.JSONDecodeError as e:
             errors.append(f"Invalid JSON: {str(e)}")
         except Exception as e:
@@ -322,8 +560,12 @@ class PluginLoader:
             ]
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(sample_config, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(sample_config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(sample_config, f, indent=2)
     
     def _record_load_operation(
         self, 
@@ -342,10 +584,9 @@ class PluginLoader:
             config: Configuration used
             metadata: Additional metadata
         """
-        import datetime
-        
+        # Timestamps are stored as epoch nanoseconds and formatted on read
         record = {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": time.time_ns(),
             "source_type": source_type,
             "source": source,
             "plugins_loaded": plugins_loaded,
@@ -0,0 +1,41 @@
+"""Byte-compile plugin directories ahead of time.
+
+Usage: python -m tomo.plugins.prewarm DIRECTORY [DIRECTORY ...]
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .loader import PluginLoader, PluginLoaderError
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Compile the plugin files in each directory into ``__pycache__``.
+    
+    Args:
+        argv: Command line arguments (defaults to ``sys.argv[1:]``)
+        
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m tomo.plugins.prewarm",
+        description="Byte-compile plugin files so later loads skip parsing.",
+    )
+    parser.add_argument("directories", nargs="+", help="Plugin directories to compile")
+    args = parser.parse_args(argv)
+    
+    for directory in args.directories:
+        try:
+            compiled = PluginLoader.prewarm_directory(directory)
+        except PluginLoaderError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"{directory}: compiled {compiled} plugin file(s)")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,10 @@
 
 from typing import Dict, List, Type, Any, Optional, Iterator
 import importlib
+from collections import defaultdict
 from ..core.registry import ToolRegistry
 from ..core.tool import BaseTool
-from .base import BasePlugin, PluginType
+from .base import BasePlugin, PluginType, iter_module_plugin_classes
 
 
 class PluginRegistryError(Exception):
@@ -19,6 +20,20 @@ class PluginRegistry:
     existing Tomo registries for tools, adapters, workflow steps, etc.
     """
     
+    __slots__ = (
+        "plugins",
+        "tool_registry",
+        "adapter_registry",
+        "step_registry",
+        "server_registry",
+        "orchestrator_registry",
+        "transformer_registry",
+        "_enabled_plugins",
+        "_plugin_configs",
+        "_plugins_by_type",
+        "_all_plugin_info",
+    )
+    
     def __init__(self):
         """Initialize the plugin registry."""
         # Main plugin storage
@@ -35,6 +50,12 @@ class PluginRegistry:
         # Plugin metadata
         self._enabled_plugins: Dict[str, bool] = {}
         self._plugin_configs: Dict[str, Dict[str, Any]] = {}
+        
+        # Plugins grouped by type, keyed by name to keep registration order
+        self._plugins_by_type: Dict[PluginType, Dict[str, BasePlugin]] = defaultdict(dict)
+        
+        # Cached result of get_all_plugin_info; reset whenever plugins change
+        self._all_plugin_info: Optional[Dict[str, Dict[str, Any]]] = None
     
     def register_plugin(self, plugin: BasePlugin, config: Dict[str, Any] = None) -> None:
         """Register a plugin and its components.
@@ -56,12 +77,14 @@ class PluginRegistry:
                 f"Plugin '{plugin.name}' has missing dependencies: {', '.join(missing_deps)}"
             )
         
+        self._all_plugin_info = None
         try:
             # Initialize plugin
             plugin.initialize(config or {})
             
             # Register with main registry
             self.plugins[plugin.name] = plugin
+            self._plugins_by_type[plugin.plugin_type][plugin.name] = plugin
             self._enabled_plugins[plugin.name] = True
             self._plugin_configs[plugin.name] = config or {}
             
@@ -70,12 +93,10 @@ class PluginRegistry:
             
         except Exception as e:
             # Clean up on failure
-            if plugin.name in self.plugins:
-                del self.plugins[plugin.name]
-            if plugin.name in self._enabled_plugins:
-                del self._enabled_plugins[plugin.name]
-            if plugin.name in self._plugin_configs:
-                del self._plugin_configs[plugin.name]
+            if self.plugins.pop(plugin.name, None) is not None:
+                self._plugins_by_type[plugin.plugin_type].pop(plugin.name, None)
+            self._enabled_plugins.pop(plugin.name, None)
+            self._plugin_configs.pop(plugin.name, None)
             
             raise PluginRegistryError(f"Failed to register plugin '{plugin.name}': {str(e)}") from e
     
@@ -88,16 +109,16 @@ class PluginRegistry:
         Returns:
             True if the plugin was found and removed, False otherwise
         """
-        if name not in self.plugins:
+        plugin = self.plugins.pop(name, None)
+        if plugin is None:
             return False
         
         # TODO: Implement component cleanup (would need tracking of what each plugin registered)
         
-        del self.plugins[name]
-        if name in self._enabled_plugins:
-            del self._enabled_plugins[name]
-        if name in self._plugin_configs:
-            del self._plugin_configs[name]
+        self._all_plugin_info = None
+        self._plugins_by_type[plugin.plugin_type].pop(name, None)
+        self._enabled_plugins.pop(name, None)
+        self._plugin_configs.pop(name, None)
         
         return True
     
@@ -129,7 +150,8 @@ class PluginRegistry:
         Returns:
             List of plugins of the specified type
         """
-        return [p for p in self.plugins.values() if p.plugin_type == plugin_type]
+        plugins = self._plugins_by_type.get(plugin_type)
+        return list(plugins.values()) if plugins else []
     
     def is_plugin_enabled(self, name: str) -> bool:
         """Check if a plugin is enabled.
@@ -153,6 +175,7 @@ class PluginRegistry:
         """
         if name in self.plugins:
             self._enabled_plugins[name] = True
+            self._all_plugin_info = None
             return True
         return False
     
@@ -167,43 +190,61 @@ class PluginRegistry:
         """
         if name in self.plugins:
             self._enabled_plugins[name] = False
+            self._all_plugin_info = None
             return True
         return False
     
-    def auto_discover_plugins(self, module: Any) -> int:
+    def auto_discover_plugins(self, module: Any, config: Dict[str, Any] = None) -> int:
         """Auto-discover and register plugins from a module.
         
-        This method scans a module for classes that inherit from BasePlugin
-        and have the _is_tomo_plugin attribute set to True.
+        This method finds classes that inherit from BasePlugin, are defined
+        in the module or one of its submodules, and have the _is_tomo_plugin
+        attribute set to True. Classes are indexed when they are defined, so
+        the module namespace is not scanned.
         
         Args:
             module: The module to scan for plugins
+            config: Configuration to register each discovered plugin with
             
         Returns:
             The number of plugins discovered and registered
         """
-        discovered = 0
+        return len(self.discover_plugins(module, config))
+    
+    def discover_plugins(self, module: Any, config: Dict[str, Any] = None) -> List[str]:
+        """Discover and register plugins from a module, returning their names.
         
-        for name in dir(module):
-            obj = getattr(module, name)
+        Args:
+            module: The module to scan for plugins
+            config: Configuration to register each discovered plugin with
             
-            # Check if it's a class that inherits from BasePlugin and is marked as a plugin
+        Returns:
+            Names of the plugins newly registered by this call
+        """
+        registered = []
+        plugin_classes = list(iter_module_plugin_classes(module.__name__))
+        
+        # Plugins re-exported from modules outside this package
+        for value in list(vars(module).values()):
             if (
-                isinstance(obj, type)
-                and issubclass(obj, BasePlugin)
-                and obj is not BasePlugin
-                and getattr(obj, "_is_tomo_plugin", False)
+                isinstance(value, type)
+                and issubclass(value, BasePlugin)
+                and getattr(value, "_is_tomo_plugin", False)
+                and value not in plugin_classes
             ):
-                try:
-                    # Create plugin instance
-                    plugin = obj()
-                    self.register_plugin(plugin)
-                    discovered += 1
-                except (PluginRegistryError, Exception):
-                    # Plugin failed to register, skip
-                    pass
-        
-        return discovered
+                plugin_classes.append(value)
+        
+        for plugin_cls in plugin_classes:
+            try:
+                # Create plugin instance
+                plugin = plugin_cls()
+                self.register_plugin(plugin, dict(config) if config else None)
+                registered.append(plugin.name)
+            except (PluginRegistryError, Exception):
+                # Plugin failed to register, skip
+                pass
+        
+        return registered
     
     def get_plugin_info(self, name: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a plugin.
@@ -229,10 +270,15 @@ class PluginRegistry:
     def get_all_plugin_info(self) -> Dict[str, Dict[str, Any]]:
         """Get information about all registered plugins.
         
+        The result is cached until plugins are registered, unregistered,
+        enabled or disabled, and must not be mutated.
+        
         Returns:
             Dictionary mapping plugin names to their information
         """
-        return {name: self.get_plugin_info(name) for name in self.plugins.keys()}
+        if self._all_plugin_info is None:
+            self._all_plugin_info = {name: self.get_plugin_info(name) for name in self.plugins.keys()}
+        return self._all_plugin_info
     
     def validate_all_plugins(self) -> Dict[str, List[str]]:
         """Validate all registered plugins.
@@ -256,17 +302,19 @@ class PluginRegistry:
     
     def clear(self) -> None:
         """Clear all registered plugins and their components."""
-        self.plugins.clear()
-        self._enabled_plugins.clear()
-        self._plugin_configs.clear()
+        self._all_plugin_info = None
+        self.plugins = {}
+        self._enabled_plugins = {}
+        self._plugin_configs = {}
+        self._plugins_by_type = defaultdict(dict)
         
         # Clear component registries
         self.tool_registry.clear()
-        self.adapter_registry.clear()
-        self.step_registry.clear()
-        self.server_registry.clear()
-        self.orchestrator_registry.clear()
-        self.transformer_registry.clear()
+        self.adapter_registry = {}
+        self.step_registry = {}
+        self.server_registry = {}
+        self.orchestrator_registry = {}
+        self.transformer_registry = {}
     
     def size(self) -> int:
         """Get the number of registered plugins.
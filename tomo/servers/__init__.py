@@ -2,13 +2,26 @@
 
 This package provides different server implementations for exposing
 Tomo tools remotely, including RESTful API and MCP protocol servers.
+
+Server classes are imported lazily on first access, so importing this
+package does not pull in FastAPI, uvicorn or websockets.
 """
 
-try:
-    from .api import APIServer
-    from .mcp import MCPServer
+from typing import Any
+
+__all__ = ["APIServer", "MCPServer"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import server classes on first access.
 
-    __all__ = ["APIServer", "MCPServer"]
-except ImportError:
-    # Server dependencies not installed
-    __all__ = [] 
\ No newline at end of file
+    Raises:
+        ImportError: If the server's dependencies are not installed
+    """
+    if name == "APIServer":
+        from .api import APIServer
+        return APIServer
+    if name == "MCPServer":
+        from .mcp import MCPServer
+        return MCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,16 +4,89 @@ This module provides a FastAPI-based HTTP server that exposes Tomo tools
 as REST endpoints, allowing external systems to discover and execute tools.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, TypedDict, Union
 import asyncio
+import importlib.util
+import json
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..core.registry import ToolRegistry
 from ..core.runner import ToolRunner, ToolNotFoundError, ToolValidationError, ToolExecutionError
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Native event loop and HTTP parser, when installed (uvicorn[standard])
+_UVICORN_LOOP = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+_UVICORN_HTTP = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+
+# Types the JSON encoder doesn't support natively (Pydantic models, sets,
+# Decimal, ...) go through jsonable_encoder, as FastAPI responses do
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize to UTF-8 encoded JSON."""
+        return orjson.dumps(obj, default=jsonable_encoder, option=_ORJSON_OPTIONS)
+else:
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize to UTF-8 encoded JSON."""
+        return json.dumps(obj, default=jsonable_encoder).encode()
+
+# Results with more items than this are streamed instead of buffered
+_STREAM_THRESHOLD = 1000
+_STREAM_CHUNK_SIZE = 256
+
+
+def _encode_chunk(chunk: List[Any], is_list: bool) -> bytes:
+    """Encode list items or dict ``(key, value)`` pairs as comma-separated JSON."""
+    if is_list:
+        return b",".join(_json_dumps_bytes(item) for item in chunk)
+    # Encoding single-entry dicts keeps key handling identical to whole results
+    return b",".join(_json_dumps_bytes({key: value})[1:-1] for key, value in chunk)
+
+
+def _iter_execution_json(result: Union[List[Any], Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode a successful execution response incrementally.
+    
+    The first chunk is encoded before this function returns, so a result
+    that cannot be serialized fails before response headers are sent.
+    
+    Args:
+        result: Large list or dict returned by a tool
+        
+    Returns:
+        Iterator over consecutive pieces of the JSON response body
+    """
+    is_list = isinstance(result, list)
+    items = iter(result) if is_list else iter(result.items())
+    
+    def next_chunk() -> List[Any]:
+        return [item for _, item in zip(range(_STREAM_CHUNK_SIZE), items)]
+    
+    head = (
+        b'{"success":true,"result":' + (b"[" if is_list else b"{")
+        + _encode_chunk(next_chunk(), is_list)
+    )
+    
+    def generate() -> Iterator[bytes]:
+        yield head
+        while True:
+            chunk = next_chunk()
+            if not chunk:
+                break
+            yield b"," + _encode_chunk(chunk, is_list)
+        yield (b"]" if is_list else b"}") + b',"error":null}'
+    
+    return generate()
+
 
 class ToolExecutionRequest(BaseModel):
     """Request model for tool execution."""
@@ -29,26 +102,68 @@ class ToolExecutionResponse(BaseModel):
     error: Optional[str] = Field(default=None, description="Error message if execution failed")
 
 
-class ToolInfo(BaseModel):
+# Response shapes below are built by the server itself, so they are plain
+# dictionaries and skip Pydantic validation
+class ToolInfo(TypedDict):
     """Information about a tool."""
     
-    name: str = Field(description="Tool name")
-    description: str = Field(description="Tool description")
-    schema: Dict[str, Any] = Field(description="Tool parameter schema")
+    name: str
+    description: str
+    schema: Dict[str, Any]
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(TypedDict):
     """Health check response."""
     
-    status: str = Field(description="Server status")
-    tools_count: int = Field(description="Number of registered tools")
-    version: str = Field(description="Server version")
+    status: str
+    tools_count: int
+    version: str
+
+
+class KeepAliveMiddleware:
+    """ASGI middleware advertising persistent connections on HTTP responses.
+    
+    Proxies and clients that honor ``Keep-Alive`` reuse the connection for
+    up to ``timeout`` seconds instead of reconnecting for each request.
+    Responses that already carry a ``Connection`` header are left as is.
+    """
+    
+    def __init__(self, app: Any, timeout: int) -> None:
+        """Initialize the middleware.
+        
+        Args:
+            app: ASGI application to wrap
+            timeout: Keep-alive timeout in seconds to advertise
+        """
+        self.app = app
+        self._headers = [
+            (b"connection", b"keep-alive"),
+            (b"keep-alive", f"timeout={timeout}".encode()),
+        ]
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        """Handle an ASGI request, adding headers to HTTP responses."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_headers(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                # Leave responses that already decide, e.g. "Connection: close"
+                if not any(name.lower() == b"connection" for name, _ in headers):
+                    message["headers"] = [*headers, *self._headers]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
 
 
 class APIServer:
     """RESTful API server for Tomo tools.
     
     Provides HTTP endpoints for tool discovery and execution using FastAPI.
+    Connections are kept alive between requests, so clients should reuse a
+    pooled HTTP client (e.g. ``httpx.Client``) rather than reconnecting.
     """
 
     def __init__(
@@ -58,6 +173,7 @@ class APIServer:
         description: str = "RESTful API for Tomo tool execution",
         version: str = "0.1.0",
         enable_cors: bool = True,
+        keep_alive_timeout: int = 75,
     ) -> None:
         """Initialize the API server.
         
@@ -67,9 +183,18 @@ class APIServer:
             description: API description for documentation
             version: API version
             enable_cors: Whether to enable CORS middleware
+            keep_alive_timeout: Seconds an idle connection is kept open;
+                75 matches common load balancer defaults
         """
         self.registry = registry
         self.runner = ToolRunner(registry)
+        self.keep_alive_timeout = keep_alive_timeout
+        
+        # Serialized payloads, dropped when the registry version changes
+        self._list_cache: Optional[bytes] = None
+        self._health_cache: Optional[bytes] = None
+        self._schema_cache: Dict[str, bytes] = {}
+        self._cache_version = -1
         
         # Create FastAPI app
         self.app = FastAPI(
@@ -90,40 +215,34 @@ class APIServer:
                 allow_headers=["*"],
             )
         
+        self.app.add_middleware(KeepAliveMiddleware, timeout=keep_alive_timeout)
+        
         # Register endpoints
         self._register_endpoints()
 
     def _register_endpoints(self) -> None:
         """Register API endpoints."""
         
-        @self.app.get("/health", response_model=HealthResponse)
-        async def health_check() -> HealthResponse:
+        @self.app.get("/health", response_model=None)
+        async def health_check() -> Response:
             """Health check endpoint."""
-            return HealthResponse(
-                status="healthy",
-                tools_count=len(self.registry),
-                version="0.1.0"
-            )
+            self._sync_caches()
+            if self._health_cache is None:
+                health: HealthResponse = {
+                    "status": "healthy",
+                    "tools_count": len(self.registry),
+                    "version": "0.1.0",
+                }
+                self._health_cache = _json_dumps_bytes(health)
+            return Response(content=self._health_cache, media_type="application/json")
 
-        @self.app.get("/tools", response_model=List[ToolInfo])
-        async def list_tools() -> List[ToolInfo]:
+        @self.app.get("/tools", response_model=None)
+        async def list_tools() -> Response:
             """List all available tools."""
-            tools = []
-            for tool_name in self.registry.list():
-                schema = self.registry.get_schema(tool_name)
-                tool_class = self.registry.get(tool_name)
-                
-                if schema and tool_class:
-                    tools.append(ToolInfo(
-                        name=tool_name,
-                        description=tool_class.get_description(),
-                        schema=schema
-                    ))
-            
-            return tools
+            return Response(content=self._get_tools_payload(), media_type="application/json")
 
-        @self.app.get("/tools/{tool_name}", response_model=ToolInfo)
-        async def get_tool(tool_name: str) -> ToolInfo:
+        @self.app.get("/tools/{tool_name}", response_model=None)
+        async def get_tool(tool_name: str) -> Response:
             """Get information about a specific tool."""
             tool_class = self.registry.get(tool_name)
             schema = self.registry.get_schema(tool_name)
@@ -131,25 +250,33 @@ class APIServer:
             if not tool_class or not schema:
                 raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
             
-            return ToolInfo(
-                name=tool_name,
-                description=tool_class.get_description(),
-                schema=schema
-            )
+            info: ToolInfo = {
+                "name": tool_name,
+                "description": tool_class.get_description(),
+                "schema": schema,
+            }
+            return Response(content=_json_dumps_bytes(info), media_type="application/json")
 
         @self.app.post("/tools/{tool_name}/execute", response_model=ToolExecutionResponse)
         async def execute_tool(
             tool_name: str, 
             request: ToolExecutionRequest
-        ) -> ToolExecutionResponse:
+        ) -> Response:
             """Execute a tool with given inputs."""
             try:
-                result = self.runner.run_tool(tool_name, request.inputs)
-                return ToolExecutionResponse(
-                    success=True,
-                    result=result,
-                    error=None
-                )
+                # Run in a worker thread so slow tools don't block the event loop
+                result = await asyncio.to_thread(self.runner.run_tool, tool_name, request.inputs)
+                if isinstance(result, (list, dict)) and len(result) > _STREAM_THRESHOLD:
+                    return StreamingResponse(
+                        _iter_execution_json(result), media_type="application/json"
+                    )
+                # Encoded directly; the response model is used for docs only
+                payload = _json_dumps_bytes({
+                    "success": True,
+                    "result": result,
+                    "error": None,
+                })
+                return Response(content=payload, media_type="application/json")
             except ToolNotFoundError as e:
                 raise HTTPException(status_code=404, detail=str(e))
             except ToolValidationError as e:
@@ -166,7 +293,10 @@ class APIServer:
         ) -> Dict[str, Any]:
             """Validate tool inputs without executing."""
             try:
-                is_valid = self.runner.validate_tool_inputs(tool_name, request.inputs)
+                # Validators may be slow too; keep them off the event loop
+                is_valid = await asyncio.to_thread(
+                    self.runner.validate_tool_inputs, tool_name, request.inputs
+                )
                 return {
                     "valid": is_valid,
                     "tool_name": tool_name,
@@ -183,12 +313,44 @@ class APIServer:
                 }
 
         @self.app.get("/tools/{tool_name}/schema")
-        async def get_tool_schema(tool_name: str) -> Dict[str, Any]:
+        async def get_tool_schema(tool_name: str) -> Response:
             """Get the JSON schema for a tool."""
-            schema = self.registry.get_schema(tool_name)
-            if not schema:
-                raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
-            return schema
+            self._sync_caches()
+            payload = self._schema_cache.get(tool_name)
+            if payload is None:
+                schema = self.registry.get_schema(tool_name)
+                if not schema:
+                    raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
+                payload = self._schema_cache[tool_name] = _json_dumps_bytes(schema)
+            return Response(content=payload, media_type="application/json")
+
+    def _sync_caches(self) -> None:
+        """Drop cached payloads if tools were registered or removed."""
+        if self._cache_version != self.registry.version:
+            self._list_cache = None
+            self._health_cache = None
+            self._schema_cache = {}
+            self._cache_version = self.registry.version
+
+    def _get_tools_payload(self) -> bytes:
+        """Get the serialized tool listing, cached per registry version.
+        
+        Returns:
+            JSON-encoded list of tool information
+        """
+        self._sync_caches()
+        if self._list_cache is None:
+            tools: List[ToolInfo] = [
+                {
+                    "name": tool_name,
+                    "description": tool_class.get_description(),
+                    "schema": schema,
+                }
+                for tool_name, tool_class, schema in self.registry.iter_with_schema()
+            ]
+            self._list_cache = _json_dumps_bytes(tools)
+        
+        return self._list_cache
 
     def run(
         self,
@@ -196,6 +358,7 @@ class APIServer:
         port: int = 8000,
         log_level: str = "info",
         reload: bool = False,
+        access_log: bool = False,
     ) -> None:
         """Run the API server.
         
@@ -204,6 +367,7 @@ class APIServer:
             port: Port to bind to
             log_level: Logging level
             reload: Enable auto-reload for development
+            access_log: Log every request (adds per-request overhead)
         """
         uvicorn.run(
             self.app,
@@ -211,6 +375,10 @@ class APIServer:
             port=port,
             log_level=log_level,
             reload=reload,
+            loop=_UVICORN_LOOP,
+            http=_UVICORN_HTTP,
+            access_log=access_log,
+            timeout_keep_alive=self.keep_alive_timeout,
         )
 
     async def start_async(
@@ -218,6 +386,7 @@ class APIServer:
         host: str = "0.0.0.0",
         port: int = 8000,
         log_level: str = "info",
+        access_log: bool = False,
     ) -> None:
         """Start the server asynchronously.
         
@@ -225,12 +394,16 @@ class APIServer:
             host: Host to bind to
             port: Port to bind to
             log_level: Logging level
+            access_log: Log every request (adds per-request overhead)
         """
         config = uvicorn.Config(
             self.app,
             host=host,
             port=port,
             log_level=log_level,
+            http=_UVICORN_HTTP,
+            access_log=access_log,
+            timeout_keep_alive=self.keep_alive_timeout,
         )
         server = uvicorn.Server(config)
         await server.serve()
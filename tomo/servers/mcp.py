@@ -9,14 +9,50 @@ import json
 import logging
 from typing import Any, Dict, List, Optional, Union
 import websockets
+from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
 from websockets.server import serve, WebSocketServerProtocol
 
 from ..core.registry import ToolRegistry
+from ..core.tool import BatchableTool
 from ..core.runner import ToolRunner, ToolNotFoundError, ToolValidationError, ToolExecutionError
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        """Serialize to a JSON string with orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 
 logger = logging.getLogger(__name__)
 
+# Pre-serialized errors for messages that could not be parsed or handled;
+# these carry no request ID, so they never vary
+_PARSE_ERROR_MESSAGE = _json_dumps(
+    {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}
+)
+_INTERNAL_ERROR_MESSAGE = _json_dumps(
+    {"jsonrpc": "2.0", "id": None, "error": {"code": -32603, "message": "Internal error"}}
+)
+
+# Compression for the schema-heavy JSON payloads; replaces the websockets
+# default, which uses a smaller 4 KiB window
+_COMPRESSION_EXTENSIONS = [
+    ServerPerMessageDeflateFactory(
+        server_max_window_bits=15,
+        client_max_window_bits=15,
+        compress_settings={"memLevel": 5},
+    )
+]
+
 
 class MCPError(Exception):
     """Base class for MCP-specific errors."""
@@ -40,6 +76,13 @@ class MCPServer:
         registry: ToolRegistry,
         server_name: str = "tomo-mcp-server",
         server_version: str = "0.1.0",
+        batch_window: float = 0.005,
+        max_batch_size: int = 32,
+        structured_content: bool = False,
+        max_message_size: int = 16 * 1024 * 1024,
+        max_queue: int = 128,
+        write_limit: int = 1024 * 1024,
+        compression: bool = True,
     ) -> None:
         """Initialize the MCP server.
         
@@ -47,11 +90,40 @@ class MCPServer:
             registry: Tool registry containing available tools
             server_name: Name of the MCP server
             server_version: Version of the MCP server
+            batch_window: Seconds to wait for more calls to a batchable tool
+                before executing the batch
+            max_batch_size: Maximum number of calls executed in one batch
+            structured_content: Also return dict and list tool results as
+                ``structuredContent``, alongside the JSON text block older
+                clients read. Results are JSON-encoded into text, then
+                encoded again with the response, whether or not this is set
+            max_message_size: Largest incoming message accepted, in bytes
+            max_queue: Incoming messages buffered per connection
+            write_limit: Outgoing bytes buffered before sends wait for the
+                connection to drain
+            compression: Negotiate permessage-deflate with clients
         """
         self.registry = registry
         self.runner = ToolRunner(registry)
         self.server_name = server_name
         self.server_version = server_version
+        self.structured_content = structured_content
+        
+        # WebSocket transport settings
+        self.max_message_size = max_message_size
+        self.max_queue = max_queue
+        self.write_limit = write_limit
+        self.compression = compression
+        
+        # Pending calls to BatchableTool tools, coalesced per tool
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._batch_queues: Dict[str, asyncio.Queue] = {}
+        self._batch_tasks: Dict[str, asyncio.Task] = {}
+        
+        # tools/list entries, rebuilt when the registry version changes
+        self._mcp_tool_cache: Optional[List[Dict[str, Any]]] = None
+        self._mcp_tool_cache_version = -1
         
         # MCP protocol information
         self.protocol_version = "2024-11-05"
@@ -60,6 +132,25 @@ class MCPServer:
             "resources": {},
             "prompts": {},
         }
+        
+        # Constant results, built once and shared by all sessions; not mutated
+        self._initialize_result = {
+            "protocolVersion": self.protocol_version,
+            "capabilities": self.capabilities,
+            "serverInfo": {
+                "name": self.server_name,
+                "version": self.server_version,
+            },
+        }
+        self._ping_result: Dict[str, Any] = {}
+        
+        # MCP method handlers by method name
+        self._handlers = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+            "ping": self._handle_ping,
+        }
 
     async def handle_client(self, websocket: WebSocketServerProtocol, path: str) -> None:
         """Handle a new client connection.
@@ -68,33 +159,30 @@ class MCPServer:
             websocket: WebSocket connection
             path: Connection path
         """
-        logger.info(f"New MCP client connected from {websocket.remote_address}")
+        logger.info("New MCP client connected from %s", websocket.remote_address)
         
         try:
             async for message in websocket:
                 try:
-                    # Parse JSON-RPC message
-                    data = json.loads(message)
-                    response = await self._handle_message(data)
+                    # Parse JSON-RPC message or batch
+                    data = _json_loads(message)
+                    if isinstance(data, list):
+                        response = await self._handle_batch(data)
+                    else:
+                        response = await self._handle_message(data)
                     
                     if response:
-                        await websocket.send(json.dumps(response))
+                        await websocket.send(_json_dumps(response))
                         
                 except json.JSONDecodeError:
-                    error_response = self._create_error_response(
-                        None, -32700, "Parse error"
-                    )
-                    await websocket.send(json.dumps(error_response))
-                except Exception as e:
-                    logger.error(f"Error handling message: {e}")
-                    error_response = self._create_error_response(
-                        None, -32603, "Internal error"
-                    )
-                    await websocket.send(json.dumps(error_response))
+                    await websocket.send(_PARSE_ERROR_MESSAGE)
+                except Exception:
+                    logger.error("Error handling message", exc_info=True)
+                    await websocket.send(_INTERNAL_ERROR_MESSAGE)
         except websockets.exceptions.ConnectionClosed:
             logger.info("MCP client disconnected")
-        except Exception as e:
-            logger.error(f"Error in client handler: {e}")
+        except Exception:
+            logger.error("Error in client handler", exc_info=True)
 
     async def _handle_message(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Handle a JSON-RPC message.
@@ -106,6 +194,8 @@ class MCPServer:
             Response message or None for notifications
         """
         # Validate JSON-RPC structure
+        if not isinstance(data, dict):
+            return self._create_error_response(None, -32600, "Invalid Request")
         if "jsonrpc" not in data or data["jsonrpc"] != "2.0":
             return self._create_error_response(
                 data.get("id"), -32600, "Invalid Request"
@@ -115,20 +205,15 @@ class MCPServer:
         params = data.get("params", {})
         message_id = data.get("id")
         
-        # Handle different MCP methods
+        # Handle different MCP methods; non-string methods are never found
+        handler = self._handlers.get(method) if isinstance(method, str) else None
+        if handler is None:
+            return self._create_error_response(
+                message_id, -32601, f"Method not found: {method}"
+            )
+        
         try:
-            if method == "initialize":
-                result = await self._handle_initialize(params)
-            elif method == "tools/list":
-                result = await self._handle_tools_list(params)
-            elif method == "tools/call":
-                result = await self._handle_tools_call(params)
-            elif method == "ping":
-                result = {}
-            else:
-                return self._create_error_response(
-                    message_id, -32601, f"Method not found: {method}"
-                )
+            result = await handler(params)
             
             # Return success response for requests (not notifications)
             if message_id is not None:
@@ -141,13 +226,34 @@ class MCPServer:
         except MCPError as e:
             return self._create_error_response(message_id, e.code, e.message, e.data)
         except Exception as e:
-            logger.error(f"Error handling method {method}: {e}")
+            logger.error("Error handling method %s", method, exc_info=True)
             return self._create_error_response(
                 message_id, -32603, "Internal error", str(e)
             )
         
         return None
 
+    async def _handle_batch(
+        self, batch: List[Any]
+    ) -> Optional[Union[List[Dict[str, Any]], Dict[str, Any]]]:
+        """Handle a JSON-RPC batch sent in a single WebSocket message.
+        
+        Requests in the batch are handled concurrently and their responses
+        are returned together, so clients can amortize per-message overhead.
+        
+        Args:
+            batch: Parsed JSON-RPC messages
+            
+        Returns:
+            List of responses, an error for an empty batch, or None if the
+            batch only contained notifications
+        """
+        if not batch:
+            return self._create_error_response(None, -32600, "Invalid Request")
+        
+        responses = await asyncio.gather(*(self._handle_message(data) for data in batch))
+        return [response for response in responses if response] or None
+
     async def _handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP initialize request.
         
@@ -160,20 +266,24 @@ class MCPServer:
         client_info = params.get("clientInfo", {})
         protocol_version = params.get("protocolVersion")
         
-        logger.info(f"Initializing MCP session with client: {client_info}")
+        logger.info("Initializing MCP session with client: %s", client_info)
         
         # Validate protocol version
         if protocol_version != self.protocol_version:
-            logger.warning(f"Protocol version mismatch: {protocol_version} vs {self.protocol_version}")
+            logger.warning("Protocol version mismatch: %s vs %s", protocol_version, self.protocol_version)
         
-        return {
-            "protocolVersion": self.protocol_version,
-            "capabilities": self.capabilities,
-            "serverInfo": {
-                "name": self.server_name,
-                "version": self.server_version,
-            },
-        }
+        return self._initialize_result
+
+    async def _handle_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle ping request.
+        
+        Args:
+            params: Ping parameters
+            
+        Returns:
+            Empty ping response
+        """
+        return self._ping_result
 
     async def _handle_tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/list request.
@@ -184,23 +294,19 @@ class MCPServer:
         Returns:
             List of available tools
         """
-        tools = []
-        
-        for tool_name in self.registry.list():
-            tool_class = self.registry.get(tool_name)
-            if tool_class:
-                # Convert Tomo tool to MCP tool format
-                schema = tool_class.get_schema()
-                
-                mcp_tool = {
+        if self._mcp_tool_cache_version != self.registry.version:
+            # Convert Tomo tools to MCP tool format
+            self._mcp_tool_cache = [
+                {
                     "name": tool_name,
                     "description": tool_class.get_description(),
                     "inputSchema": schema.get("function", {}).get("parameters", {}),
                 }
-                
-                tools.append(mcp_tool)
+                for tool_name, tool_class, schema in self.registry.iter_with_schema()
+            ]
+            self._mcp_tool_cache_version = self.registry.version
         
-        return {"tools": tools}
+        return {"tools": self._mcp_tool_cache}
 
     async def _handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/call request.
@@ -218,17 +324,25 @@ class MCPServer:
             raise MCPError(-32602, "Missing tool name")
         
         try:
-            # Execute the tool
-            result = self.runner.run_tool(tool_name, arguments)
+            if isinstance(self.registry.get(tool_name), BatchableTool):
+                result = await self._run_batched(tool_name, arguments)
+            else:
+                # Execute the tool in a worker thread so other clients keep being served
+                result = await asyncio.to_thread(self.runner.run_tool, tool_name, arguments)
             
-            return {
+            response = {
                 "content": [
                     {
                         "type": "text",
-                        "text": json.dumps(result) if not isinstance(result, str) else result
+                        "text": _json_dumps(result) if not isinstance(result, str) else result
                     }
                 ]
             }
+            if self.structured_content and isinstance(result, (dict, list)):
+                # Machine-readable copy for clients with structured tool output
+                response["structuredContent"] = result
+            
+            return response
             
         except ToolNotFoundError as e:
             raise MCPError(-32602, f"Tool not found: {tool_name}")
@@ -237,6 +351,73 @@ class MCPServer:
         except ToolExecutionError as e:
             raise MCPError(-32603, f"Tool execution failed: {str(e)}")
 
+    async def _run_batched(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Queue a call to a batchable tool and wait for its result.
+        
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments
+            
+        Returns:
+            Tool execution result
+        """
+        loop = asyncio.get_running_loop()
+        task = self._batch_tasks.get(tool_name)
+        if task is None or task.done() or task.get_loop() is not loop:
+            # Queues and workers belong to one event loop; start fresh ones on
+            # a new loop, or when the previous worker has stopped
+            queue = self._batch_queues[tool_name] = asyncio.Queue()
+            self._batch_tasks[tool_name] = loop.create_task(self._batch_worker(tool_name, queue))
+        else:
+            queue = self._batch_queues[tool_name]
+        
+        future = loop.create_future()
+        await queue.put((arguments, future))
+        return await future
+
+    async def _batch_worker(self, tool_name: str, queue: asyncio.Queue) -> None:
+        """Collect queued calls to a tool and execute them in batches.
+        
+        Args:
+            tool_name: Name of the tool whose calls are batched
+            queue: Queue of ``(arguments, future)`` pairs
+        """
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                outcomes = await asyncio.to_thread(
+                    self.runner.run_tool_batch, tool_name, [arguments for arguments, _ in batch]
+                )
+            except Exception as e:
+                outcomes = [(None, e)] * len(batch)
+            
+            for (_, future), (result, error) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+    def _stop_batch_workers(self) -> None:
+        """Cancel background batch workers."""
+        for task in self._batch_tasks.values():
+            task.cancel()
+        self._batch_tasks.clear()
+        self._batch_queues.clear()
+
     def _create_error_response(
         self,
         message_id: Optional[Union[str, int]],
@@ -265,6 +446,29 @@ class MCPServer:
             "error": error,
         }
 
+    def _serve(self, host: str, port: int) -> Any:
+        """Create the WebSocket server with this server's transport settings.
+        
+        Args:
+            host: Host to bind to
+            port: Port to bind to
+            
+        Returns:
+            The websockets server, to be used as an async context manager
+        """
+        return serve(
+            self.handle_client,
+            host,
+            port,
+            ping_interval=30,
+            ping_timeout=10,
+            max_size=self.max_message_size,
+            max_queue=self.max_queue,
+            write_limit=self.write_limit,
+            compression="deflate" if self.compression else None,
+            extensions=_COMPRESSION_EXTENSIONS if self.compression else None,
+        )
+
     def run(
         self,
         host: str = "localhost",
@@ -280,19 +484,17 @@ class MCPServer:
         """
         logging.basicConfig(level=getattr(logging, log_level.upper()))
         
-        logger.info(f"Starting MCP server on {host}:{port}")
-        logger.info(f"Registered tools: {self.registry.list()}")
+        logger.info("Starting MCP server on %s:%s", host, port)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Registered tools: %s", self.registry.list())
         
         async def start_server():
-            async with serve(
-                self.handle_client,
-                host,
-                port,
-                ping_interval=30,
-                ping_timeout=10,
-            ):
-                logger.info(f"MCP server listening on ws://{host}:{port}")
-                await asyncio.Future()  # Run forever
+            async with self._serve(host, port):
+                logger.info("MCP server listening on ws://%s:%s", host, port)
+                try:
+                    await asyncio.Future()  # Run forever
+                finally:
+                    self._stop_batch_workers()
         
         asyncio.run(start_server())
 
@@ -307,15 +509,13 @@ class MCPServer:
             host: Host to bind to
             port: Port to bind to
         """
-        logger.info(f"Starting MCP server on {host}:{port}")
-        logger.info(f"Registered tools: {self.registry.list()}")
+        logger.info("Starting MCP server on %s:%s", host, port)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Registered tools: %s", self.registry.list())
         
-        async with serve(
-            self.handle_client,
-            host,
-            port,
-            ping_interval=30,
-            ping_timeout=10,
-        ):
-            logger.info(f"MCP server listening on ws://{host}:{port}")
-            await asyncio.Future()  # Run forever 
\ No newline at end of file
+        async with self._serve(host, port):
+            logger.info("MCP server listening on ws://%s:%s", host, port)
+            try:
+                await asyncio.Future()  # Run forever
+            finally:
+                self._stop_batch_workers()